@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""script方式とselenium方式の求職者情報の取得時間を比較するベンチマーク
+
+ローカルに生成した求職者ページをヘッドレスChromeで開き、同じページに対して
+2つの取得方式を繰り返し実行します。実行にはGoogle Chromeが必要です。
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import statistics
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+from bizreach_scraper import BizreachScraper
+from synthetic_server import render_candidate_page
+
+
+def measure(func, repeat):
+    """関数をrepeat回実行し、各回の所要時間（秒）と最後の結果を返す"""
+    durations = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        durations.append(time.perf_counter() - start)
+    return durations, result
+
+
+def main():
+    """メイン関数"""
+    parser = argparse.ArgumentParser(description='求職者情報の取得方式のベンチマーク')
+    parser.add_argument('--careers', type=int, default=20, help='経歴の件数（デフォルト: 20）')
+    parser.add_argument('--skills', type=int, default=20, help='スキルの件数（デフォルト: 20）')
+    parser.add_argument('--educations', type=int, default=3, help='学歴の件数（デフォルト: 3）')
+    parser.add_argument('--repeat', type=int, default=20, help='各方式の実行回数（デフォルト: 20）')
+    parser.add_argument('-d', '--driver', default=None, help='Chromeドライバーのパス（省略可）')
+    args = parser.parse_args()
+
+    with tempfile.NamedTemporaryFile('w', suffix='.html', encoding='utf-8', delete=False) as f:
+        f.write(render_candidate_page(args.careers, args.skills, args.educations))
+        page_path = f.name
+
+    scraper = BizreachScraper(args.driver, lean=True)
+
+    try:
+        scraper.start_browser()
+        scraper.driver.get("file://" + page_path)
+
+        script_times, script_result = measure(scraper._extract_with_script, args.repeat)
+        selenium_times, selenium_result = measure(scraper._extract_with_selenium, args.repeat)
+
+        if script_result != selenium_result:
+            print("警告: 2つの方式の取得結果が一致しません")
+
+        print(f"経歴 {args.careers}件 / スキル {args.skills}件 / 学歴 {args.educations}件, {args.repeat}回実行")
+        for label, durations in (("script", script_times), ("selenium", selenium_times)):
+            print(f"{label:>8}: 中央値 {statistics.median(durations) * 1000:8.1f}ms / "
+                  f"最大 {max(durations) * 1000:8.1f}ms")
+        print(f"速度比: {statistics.median(selenium_times) / statistics.median(script_times):.1f}倍")
+    finally:
+        scraper.close_browser()
+        os.remove(page_path)
+
+
+if __name__ == '__main__':
+    main()
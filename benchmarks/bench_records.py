@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""求職者情報を辞書で保持する場合とCandidate（__slots__と文字列のインターン）で保持する場合のメモリ使用量を比較するベンチマーク
+
+JSONLファイルから読み込んだ場合と同じく、同じ会社名・学校名・スキル名でも別々の文字列オブジェクトになるよう、
+1件ずつJSONを経由して求職者情報を生成し、tracemallocで保持に使ったメモリを計測します。
+"""
+
+import os
+import sys
+import json
+import random
+import argparse
+import tracemalloc
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+from records import CandidateCollection
+
+
+def generate_candidates(count, careers, skills, educations, vocabulary, seed=0):
+    """
+    よくある会社名・学校名・スキル名・期間が繰り返し現れる求職者情報を1件ずつ生成するジェネレーター
+
+    Args:
+        count (int): 件数
+        careers (int): 1人あたりの経歴の件数
+        skills (int): 1人あたりのスキルの件数
+        educations (int): 1人あたりの学歴の件数
+        vocabulary (int): 会社名・学校名・スキル名の種類の数
+        seed (int): 乱数のシード
+
+    Yields:
+        dict: 求職者情報（JSONから読み込んだ辞書）
+    """
+    rng = random.Random(seed)
+    periods = [f"{year}年4月 - {year + 3}年3月" for year in range(2000, 2022)]
+    for i in range(count):
+        candidate = {
+            "name": f"候補者 {i}",
+            "age": f"{rng.randint(22, 60)}歳",
+            "career_history": [
+                {"company": f"株式会社サンプル{rng.randrange(vocabulary)}", "period": rng.choice(periods),
+                 "position": f"エンジニア{rng.randrange(20)}"}
+                for _ in range(careers)
+            ],
+            "skills": [f"スキル{rng.randrange(vocabulary)}" for _ in range(skills)],
+            "education": [
+                {"school": f"サンプル大学{rng.randrange(vocabulary)}", "period": rng.choice(periods),
+                 "degree": f"工学部{rng.randrange(10)}"}
+                for _ in range(educations)
+            ],
+            "url": f"https://www.bizreach.jp/company/candidates/{100000 + i}",
+            "scraped_at": f"2024-05-01 12:{i // 60 % 60:02d}:{i % 60:02d}"
+        }
+        yield json.loads(json.dumps(candidate, ensure_ascii=False))
+
+
+def measure(build):
+    """build()で生成したオブジェクトを保持するのに使ったメモリ（バイト）と、そのオブジェクトを返す"""
+    tracemalloc.start()
+    result = build()
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return used, result
+
+
+def main():
+    """メイン関数"""
+    parser = argparse.ArgumentParser(description='求職者情報の保持に使うメモリのベンチマーク')
+    parser.add_argument('--count', type=int, default=20000, help='求職者の件数（デフォルト: 20000）')
+    parser.add_argument('--careers', type=int, default=4, help='1人あたりの経歴の件数（デフォルト: 4）')
+    parser.add_argument('--skills', type=int, default=10, help='1人あたりのスキルの件数（デフォルト: 10）')
+    parser.add_argument('--educations', type=int, default=2, help='1人あたりの学歴の件数（デフォルト: 2）')
+    parser.add_argument('--vocabulary', type=int, default=2000,
+                        help='会社名・学校名・スキル名の種類の数（デフォルト: 2000）')
+    args = parser.parse_args()
+
+    def candidates():
+        return generate_candidates(args.count, args.careers, args.skills, args.educations, args.vocabulary)
+
+    dict_bytes, dicts = measure(lambda: list(candidates()))
+    del dicts
+    record_bytes, collection = measure(lambda: CandidateCollection(candidates()))
+
+    print(f"求職者 {args.count}件（経歴 {args.careers}件 / スキル {args.skills}件 / 学歴 {args.educations}件）")
+    for label, used in (("辞書", dict_bytes), ("Candidate", record_bytes)):
+        print(f"{label:>9}: {used / 1024 / 1024:8.1f}MB（1件あたり {used / args.count:7.0f}バイト）")
+    print(f"削減率: {1 - record_bytes / dict_bytes:.0%}")
+
+
+if __name__ == '__main__':
+    main()
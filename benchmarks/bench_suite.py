@@ -0,0 +1,299 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""ローカルのサーバーに対してスクレイピング全体のスループットとメモリ使用量を計測するベンチマーク
+
+synthetic_server.pyのサーバーを別プロセスで起動し、求職者ページの大きさ（経歴・スキルの件数）と
+並列数の異なる固定のシナリオを実行します。各シナリオは別プロセスで複数回実行し（1回ごとに
+MIN_RUN_SECONDS以上になるまでURLを繰り返し取得）、1秒あたりのページ数が中央値の回のスループットと
+プロセスの最大メモリ使用量を、同じマシンで保存した基準値（baseline.json）との比率で比較します。
+
+    python benchmarks/bench_suite.py                    # 基準値と比較（性能が落ちていれば終了コード1）
+    python benchmarks/bench_suite.py --save-baseline    # 基準値を保存し直す
+    python benchmarks/bench_suite.py --engine selenium  # ブラウザでの取得を計測（Google Chromeが必要）
+    python benchmarks/bench_suite.py --engine fake      # ブラウザを使わず、スクレイパー自体の処理を計測
+"""
+
+import os
+import sys
+import json
+import time
+import queue
+import argparse
+import platform
+import resource
+import tempfile
+import multiprocessing
+from urllib.parse import urlsplit, parse_qs
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+from synthetic_server import SyntheticServerProcess, render_candidate_page
+from exporters import JsonlSink
+
+
+# 計測する取得方式（httpは非同期エンジン、それ以外はBizreachScraperのバックエンド）
+ENGINES = ("http", "selenium", "cdp", "fake")
+
+# 固定のシナリオ（ページの大きさと並列数）
+SCENARIOS = {
+    "small_sequential": {"careers": 2, "skills": 5, "educations": 1, "concurrency": 1, "pages": 100},
+    "large_sequential": {"careers": 50, "skills": 100, "educations": 4, "concurrency": 1, "pages": 50},
+    "small_concurrent": {"careers": 2, "skills": 5, "educations": 1, "concurrency": 8, "pages": 200},
+    "large_concurrent": {"careers": 50, "skills": 100, "educations": 4, "concurrency": 8, "pages": 100}
+}
+
+# 1回の実行の最短時間（短い計測はばらつきが大きいため、これに達するまでシナリオのURLを繰り返し取得する）
+MIN_RUN_SECONDS = 2.0
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+class _SkipLogin:
+    """ローカルのサーバーにはログインページがないため、ログインを省略するセッションキャッシュ"""
+
+    def login(self, scraper, username, password):
+        return True
+
+
+def run_http(urls, concurrency, sink):
+    """非同期エンジンとHTTPでの取得で、URLを取得してsinkに書き出す"""
+    from http_fetcher import HttpFetcher
+    from async_engine import AsyncScrapeEngine
+    import asyncio
+
+    fetcher = HttpFetcher(pool_size=concurrency)
+    # レート制限で計測が律速されないよう、十分に大きなレートにする
+    engine = AsyncScrapeEngine(fetcher.scrape_candidate_page, concurrency, rate=10000, burst=concurrency)
+
+    async def consume():
+        async for url, result in engine.scrape(urls):
+            sink.write(result or {"url": url, "error": "取得できませんでした"})
+
+    try:
+        asyncio.run(consume())
+    finally:
+        fetcher.close()
+
+
+def synthetic_page(url):
+    """fakeバックエンド用に、URLのクエリ文字列の件数で求職者ページを生成する（求職者ページ以外はNone）"""
+    query = parse_qs(urlsplit(url).query)
+    if "careers" not in query:
+        return None
+    return render_candidate_page(*[int(query[key][0]) for key in ("careers", "skills", "educations")])
+
+
+def run_scraper(urls, concurrency, sink, backend, driver_path=None):
+    """BizreachScraperで、URLを取得してsinkに書き出す（並列数が2以上の場合はWorkerPool）"""
+    from bizreach_scraper import BizreachScraper
+    from backends import FakeBackend
+    from worker_pool import WorkerPool
+
+    if backend == "fake":
+        # サーバーへの通信を含めず、スクレイパー自体の処理を計測する
+        backend = FakeBackend(synthetic_page)
+
+    def create_scraper():
+        return BizreachScraper(driver_path, lean=True, backend=backend)
+
+    if concurrency == 1:
+        scraper = create_scraper()
+        try:
+            scraper.start_browser()
+            scraper.scrape_multiple_candidates(urls, (0, 0), sink=sink)
+        finally:
+            scraper.close_browser()
+        return
+
+    pool = WorkerPool(create_scraper, concurrency, min_interval=0)
+    try:
+        pool.start("", "", _SkipLogin())
+        pool.scrape_multiple_candidates(urls, sink=sink)
+    finally:
+        pool.close()
+
+
+def run_scenario(name, engine, base_url, driver_path, result_queue):
+    """
+    1つのシナリオを実行し、結果をresult_queueに渡す（最大メモリ使用量を分けるため子プロセスで実行）
+
+    Args:
+        name (str): シナリオ名
+        engine (str): 取得方式（ENGINESのいずれか）
+        base_url (str): サーバーのURL
+        driver_path (str): Chromeドライバーのパス（seleniumの場合、省略可）
+        result_queue (multiprocessing.Queue): 結果の受け渡し先
+    """
+    scenario = SCENARIOS[name]
+    query = f"careers={scenario['careers']}&skills={scenario['skills']}&educations={scenario['educations']}"
+    urls = [f"{base_url}/company/candidates/{100000 + i}?{query}" for i in range(scenario["pages"])]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        sink = JsonlSink(os.path.join(temp_dir, "candidates.jsonl"))
+        start = time.perf_counter()
+        seconds = 0
+        while seconds < MIN_RUN_SECONDS:
+            if engine == "http":
+                run_http(urls, scenario["concurrency"], sink)
+            else:
+                run_scraper(urls, scenario["concurrency"], sink, engine, driver_path)
+            seconds = time.perf_counter() - start
+        sink.close()
+
+        errors = 0
+        with open(sink.filename, encoding="utf-8") as f:
+            for line in f:
+                errors += '"error"' in line
+
+    # Linuxのru_maxrssはKB単位
+    peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    result_queue.put({
+        "pages": sink.count,
+        "errors": errors,
+        "seconds": round(seconds, 3),
+        "pages_per_second": round(sink.count / seconds, 2),
+        "peak_rss_mb": round(peak_rss_mb, 1)
+    })
+
+
+def execute_scenario(name, engine, base_url, driver_path):
+    """
+    1つのシナリオを子プロセスで1回実行し、結果を返す
+
+    Returns:
+        dict: 計測結果（子プロセスが結果を返さずに終了した場合はNone）
+    """
+    result_queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=run_scenario, args=(name, engine, base_url, driver_path, result_queue))
+    process.start()
+    result = None
+    while result is None:
+        try:
+            result = result_queue.get(timeout=1)
+        except queue.Empty:
+            if not process.is_alive():
+                return None
+    process.join()
+    return result
+
+
+def median_result(runs):
+    """
+    複数回の計測結果から、1秒あたりのページ数が中央値の回の結果を返す（取得エラーは全ての回の最大）
+
+    Args:
+        runs (list): 計測結果のリスト
+
+    Returns:
+        dict: 代表の計測結果（repeatsに実行した回数を持つ）
+    """
+    ordered = sorted(runs, key=lambda run: run["pages_per_second"])
+    result = dict(ordered[(len(ordered) - 1) // 2])
+    result["errors"] = max(run["errors"] for run in runs)
+    result["repeats"] = len(runs)
+    return result
+
+
+def throughput_ratio(result, baseline):
+    """計測結果の1秒あたりのページ数の、基準値に対する比率（1.0で基準値と同じ）"""
+    return result["pages_per_second"] / baseline["pages_per_second"]
+
+
+def machine_conditions():
+    """基準値を計測したマシンの情報（スループットは絶対値のため、異なるマシンの基準値とは比較できない）"""
+    return {"machine": platform.node(), "processor": platform.machine(), "cpus": os.cpu_count()}
+
+
+def compare(result, baseline, tolerance):
+    """
+    計測結果を基準値と比較し、性能の低下を返す
+
+    Args:
+        result (dict): 計測結果
+        baseline (dict): 基準値
+        tolerance (float): 許容する低下の割合（スループットとメモリ使用量で共通）
+
+    Returns:
+        list: 性能の低下の説明（低下がなければ空のリスト）
+    """
+    regressions = []
+    ratio = throughput_ratio(result, baseline)
+    if ratio < 1 - tolerance:
+        regressions.append(
+            f"スループット {baseline['pages_per_second']} → {result['pages_per_second']}ページ/秒（基準値の{ratio:.0%}）"
+        )
+    if result["peak_rss_mb"] > baseline["peak_rss_mb"] * (1 + tolerance):
+        regressions.append(f"最大メモリ {baseline['peak_rss_mb']} → {result['peak_rss_mb']}MB")
+    if result["errors"]:
+        regressions.append(f"取得エラー {result['errors']}件")
+    return regressions
+
+
+def main():
+    """メイン関数"""
+    parser = argparse.ArgumentParser(description='スクレイピング全体のスループットとメモリ使用量のベンチマーク')
+    parser.add_argument('--engine', choices=ENGINES, default='http',
+                        help='取得方式（デフォルト: http）。selenium・cdpにはGoogle Chromeが必要です')
+    parser.add_argument('--scenario', action='append', choices=sorted(SCENARIOS),
+                        help='実行するシナリオ（複数指定可、省略すると全て）')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='各シナリオを実行する回数（中央値の回の結果を使う）（デフォルト: 5）')
+    parser.add_argument('--latency', type=float, default=0.05,
+                        help='サーバーの各応答に加える遅延（秒）（デフォルト: 0.05）')
+    parser.add_argument('--jitter', type=float, default=0.02,
+                        help='遅延にランダムに加える最大の時間（秒）（デフォルト: 0.02）')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE,
+                        help='基準値のファイル（デフォルト: benchmarks/baseline.json）')
+    parser.add_argument('--save-baseline', action='store_true', help='計測結果を基準値として保存する')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='基準値から許容する低下の割合（デフォルト: 0.2）')
+    parser.add_argument('-d', '--driver', default=None, help='Chromeドライバーのパス（seleniumの場合、省略可）')
+    args = parser.parse_args()
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    conditions = dict(machine_conditions(), latency=args.latency, jitter=args.jitter)
+    if not args.save_baseline and baseline.get("_conditions", {}).get("machine") not in (None, conditions["machine"]):
+        print("注意: 基準値は別のマシンで計測されています。このマシンで --save-baseline を指定して保存し直してください")
+
+    results = {}
+    failed = False
+    with SyntheticServerProcess(args.latency, args.jitter) as server:
+        for name in args.scenario or SCENARIOS:
+            runs = []
+            for _ in range(args.repeat):
+                run = execute_scenario(name, args.engine, server.base_url, args.driver)
+                if run is None:
+                    print(f"{args.engine}/{name}: シナリオの実行に失敗しました")
+                    sys.exit(1)
+                runs.append(run)
+            result = median_result(runs)
+
+            key = f"{args.engine}/{name}"
+            results[key] = result
+            ratio = f" 基準値比 {throughput_ratio(result, baseline[key]):>5.2f}" if key in baseline else ""
+            print(f"{key:<26} {result['pages']:>5}ページ {result['seconds']:>8.2f}秒 "
+                  f"{result['pages_per_second']:>8.2f}ページ/秒{ratio} 最大メモリ {result['peak_rss_mb']:>7.1f}MB")
+
+            if not args.save_baseline and key in baseline:
+                for regression in compare(result, baseline[key], args.tolerance):
+                    print(f"  性能の低下: {regression}")
+                    failed = True
+
+    if args.save_baseline:
+        baseline.update(results)
+        baseline["_conditions"] = conditions
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, ensure_ascii=False, indent=2, sort_keys=True)
+        print(f"基準値を保存しました: {args.baseline}")
+    elif baseline.get("_conditions", {}).get("latency") not in (None, args.latency):
+        print("注意: 基準値とサーバーの遅延の設定が異なります")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
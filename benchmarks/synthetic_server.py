@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""ベンチマーク用に、求職者ページを生成して返すローカルHTTPサーバー
+
+`/company/candidates/<ID>` へのリクエストに、スクレイパーのセレクター（h1.candidate-name、
+div.career-history-item など）と同じ構造のページを返します。経歴・スキル・学歴の件数は
+クエリ文字列（?careers=50&skills=100&educations=3）で、応答の遅延はサーバーの起動時に指定します。
+
+単体で起動する場合:
+    python benchmarks/synthetic_server.py --port 8765 --latency 0.2
+"""
+
+import os
+import re
+import sys
+import time
+import random
+import argparse
+import multiprocessing
+from functools import lru_cache
+from urllib.parse import urlsplit, parse_qs
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+from utils import generate_mock_candidate_data, generate_mock_candidate_html
+
+
+CANDIDATE_PATH_PATTERN = re.compile(r"^/company/candidates/(\d+)$")
+
+
+@lru_cache(maxsize=64)
+def render_candidate_page(careers=5, skills=10, educations=2):
+    """
+    指定した件数の経歴・スキル・学歴を持つ求職者ページのHTMLを生成する関数
+
+    Args:
+        careers (int): 経歴の件数
+        skills (int): スキルの件数
+        educations (int): 学歴の件数
+
+    Returns:
+        str: 生成したHTML
+    """
+    candidate = generate_mock_candidate_data()
+    candidate["career_history"] = [
+        {"company": f"株式会社サンプル{i}", "period": "2015年4月 - 2018年3月", "position": f"エンジニア{i}"}
+        for i in range(careers)
+    ]
+    candidate["skills"] = [f"スキル{i}" for i in range(skills)]
+    candidate["education"] = [
+        {"school": f"サンプル大学{i}", "period": "2010年4月 - 2014年3月", "degree": f"工学部{i}"}
+        for i in range(educations)
+    ]
+    return generate_mock_candidate_html(candidate)
+
+
+class SyntheticCandidateHandler(BaseHTTPRequestHandler):
+    """求職者ページを生成して返すハンドラー（遅延はserverの属性で指定）"""
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        if not CANDIDATE_PATH_PATTERN.match(parts.path):
+            self.send_error(404)
+            return
+
+        query = parse_qs(parts.query)
+        counts = [int(query.get(key, [default])[0]) for key, default in
+                  (("careers", 5), ("skills", 10), ("educations", 2))]
+        body = render_candidate_page(*counts).encode("utf-8")
+
+        # ネットワークとサーバーの処理時間を模した遅延
+        delay = self.server.latency + random.uniform(0, self.server.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def create_server(port=0, latency=0.0, jitter=0.0):
+    """
+    求職者ページを返すサーバーを生成する関数（serve_forever()で開始）
+
+    Args:
+        port (int): 待ち受けるポート（0の場合は空いているポート）
+        latency (float): 各リクエストに加える遅延（秒）
+        jitter (float): 遅延にランダムに加える最大の時間（秒）
+
+    Returns:
+        ThreadingHTTPServer: 生成したサーバー
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", port), SyntheticCandidateHandler)
+    server.daemon_threads = True
+    server.latency = latency
+    server.jitter = jitter
+    return server
+
+
+def _serve(port_queue, latency, jitter):
+    """子プロセスでサーバーを起動し、ポート番号を親プロセスに渡す"""
+    server = create_server(0, latency, jitter)
+    port_queue.put(server.server_port)
+    server.serve_forever()
+
+
+class SyntheticServerProcess:
+    """計測対象のプロセスに負荷をかけないよう、サーバーを別プロセスで動かすクラス"""
+
+    def __init__(self, latency=0.0, jitter=0.0):
+        """
+        Args:
+            latency (float): 各リクエストに加える遅延（秒）
+            jitter (float): 遅延にランダムに加える最大の時間（秒）
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.process = None
+        self.base_url = None
+
+    def __enter__(self):
+        port_queue = multiprocessing.Queue()
+        self.process = multiprocessing.Process(target=_serve, args=(port_queue, self.latency, self.jitter), daemon=True)
+        self.process.start()
+        self.base_url = f"http://127.0.0.1:{port_queue.get(timeout=10)}"
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.process.terminate()
+        self.process.join()
+
+    def candidate_urls(self, count, careers=5, skills=10, educations=2):
+        """
+        求職者ページのURLを生成する
+
+        Args:
+            count (int): URLの件数
+            careers (int): 経歴の件数
+            skills (int): スキルの件数
+            educations (int): 学歴の件数
+
+        Returns:
+            list: URLのリスト
+        """
+        query = f"careers={careers}&skills={skills}&educations={educations}"
+        return [f"{self.base_url}/company/candidates/{100000 + i}?{query}" for i in range(count)]
+
+
+def main():
+    """メイン関数"""
+    parser = argparse.ArgumentParser(description='ベンチマーク用の求職者ページのサーバー')
+    parser.add_argument('--port', type=int, default=8765, help='待ち受けるポート（デフォルト: 8765）')
+    parser.add_argument('--latency', type=float, default=0.0, help='各リクエストに加える遅延（秒）（デフォルト: 0）')
+    parser.add_argument('--jitter', type=float, default=0.0, help='遅延にランダムに加える最大の時間（秒）（デフォルト: 0）')
+    args = parser.parse_args()
+
+    server = create_server(args.port, args.latency, args.jitter)
+    print(f"http://127.0.0.1:{server.server_port}/company/candidates/12345?careers=5&skills=10 で待ち受けています")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,139 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from errors import classify_error
+
+
+class TokenBucket:
+    """トークンバケット方式で非同期処理のリクエストレートを制限するクラス"""
+
+    def __init__(self, rate, capacity=1):
+        """
+        トークンバケットの初期化
+
+        Args:
+            rate (float): 1秒あたりに補充されるトークン数（許可するリクエスト数/秒）
+            capacity (int): 貯めておけるトークンの最大数（瞬間的に連続で送れるリクエスト数）
+        """
+        if rate <= 0:
+            raise ValueError("レートは0より大きい値である必要があります")
+
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        # asyncio.Lockはイベントループに結び付くため、asyncio.run()ごとに作り直す
+        self._lock = None
+        self._loop = None
+
+    async def acquire(self):
+        """
+        トークンを1つ取得する（トークンがなければ補充されるまで待機する）
+
+        Returns:
+            float: 待機した時間（秒）
+        """
+        # 実行中のイベントループで最初に呼び出されたときにロックを作成する（別のasyncio.run()では作り直す）
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._lock = asyncio.Lock()
+            self._loop = loop
+
+        start_time = time.monotonic()
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return time.monotonic() - start_time
+
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class AsyncScrapeEngine:
+    """同時実行数とリクエストレートを制限しながら、非同期に求職者ページを取得するクラス"""
+
+    def __init__(self, fetch, concurrency=4, rate=1.0, burst=1):
+        """
+        非同期スクレイピングエンジンの初期化
+
+        Args:
+            fetch (callable): URLを受け取って求職者情報のdict（取得できなければNone）を返す関数。
+                              通常の関数はスレッドで、コルーチン関数はそのまま実行されます。
+            concurrency (int): 同時に実行する取得処理の最大数
+            rate (float): 1秒あたりの最大リクエスト数
+            burst (int): 瞬間的に連続で送れるリクエスト数
+        """
+        if concurrency < 1:
+            raise ValueError("同時実行数は1以上である必要があります")
+
+        self.fetch = fetch
+        self.concurrency = concurrency
+        self.rate_limiter = TokenBucket(rate, burst)
+
+    async def _fetch_one(self, url, executor):
+        """レート制限を守って1ページを取得する（例外はエラー情報のdictにする）"""
+        await self.rate_limiter.acquire()
+
+        try:
+            if asyncio.iscoroutinefunction(self.fetch):
+                result = await self.fetch(url)
+            else:
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(executor, self.fetch, url)
+        except Exception as e:
+            result = {
+                "url": url,
+                "error": str(e),
+                "error_type": classify_error(e),
+                "scraped_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            }
+
+        return url, result
+
+    async def scrape(self, urls):
+        """
+        複数の求職者ページを取得し、完了した順に結果を返す非同期ジェネレーター
+
+        Args:
+            urls (iterable): 求職者ページのURL
+
+        Yields:
+            tuple: (URL, 求職者情報のdict。取得できなかった場合はNone)
+        """
+        pending = set()
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            for url in urls:
+                # 実行中の取得処理が上限に達していれば、どれかが完了するまで待つ
+                if len(pending) >= self.concurrency:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        yield task.result()
+
+                pending.add(asyncio.ensure_future(self._fetch_one(url, executor)))
+
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+
+    def run(self, url_list):
+        """
+        複数の求職者ページを取得し、入力URLの順序で結果を返す
+
+        Args:
+            url_list (list): 求職者ページのURLリスト
+
+        Returns:
+            list: 求職者情報のdict（取得できなかったURLはNone）のリスト
+        """
+        async def collect():
+            return {url: result async for url, result in self.scrape(url_list)}
+
+        results = asyncio.run(collect())
+        return [results[url] for url in url_list]
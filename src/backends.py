@@ -0,0 +1,476 @@
+import os
+import json
+import time
+import shutil
+import tempfile
+import subprocess
+import urllib.request
+from selenium.common.exceptions import WebDriverException, TimeoutException, JavascriptException
+from candidate_page import BACKENDS
+from html_extractor import extract_candidate_from_html
+from fake_pages import render_candidate_html
+
+
+# 軽量モードでCDPを使って通信を遮断するURLパターン（アクセス解析、広告、動画・音声、フォント）
+BLOCKED_URL_PATTERNS = [
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*connect.facebook.net*",
+    "*hotjar.com*",
+    "*clarity.ms*",
+    "*.mp4", "*.webm", "*.mp3", "*.m4a",
+    "*.woff", "*.woff2", "*.ttf", "*.otf"
+]
+
+# Chromeの実行ファイルのパスを指定する環境変数
+CHROME_PATH_ENV = "CHROME_PATH"
+
+# 環境変数の指定がない場合にPATHから探すChromeの実行ファイル名
+CHROME_BINARY_NAMES = ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome")
+
+# ログインフォームに入力してログインボタンを押すスクリプト（セレクターは実際のものに変更してください）
+LOGIN_SCRIPT = """
+const set = (id, value) => {
+    const field = document.getElementById(id);
+    if (!field) return false;
+    field.value = value;
+    field.dispatchEvent(new Event('input', {bubbles: true}));
+    return true;
+};
+if (!set('username', arguments[0]) || !set('password', arguments[1])) return false;
+const button = document.querySelector("button[type='submit']");
+if (!button) return false;
+button.click();
+return true;
+"""
+
+
+class PageBackend:
+    """
+    ブラウザの操作方式の基底クラス
+
+    ページの移動・準備完了の待機・求職者情報の取り出しを分け、方式ごとに実装します。
+    start()はWebDriverと同じ主なメソッド（get, current_url, page_source, execute_script,
+    execute_cdp_cmd, get_cookies, add_cookie, quit）を持つドライバーを返し、
+    Cookieの共有やブラウザ監視などはどの方式でも同じドライバーの操作で行います。
+    """
+
+    name = None
+
+    def start(self, scraper):
+        """
+        ブラウザを起動する
+
+        Args:
+            scraper (BizreachScraper): 起動するスクレイパー（lean, chrome_driver_pathなどの設定を参照）
+
+        Returns:
+            object: WebDriver互換のドライバー
+        """
+        raise NotImplementedError
+
+    def login(self, scraper, username, password, login_url):
+        """
+        ログインする
+
+        Returns:
+            bool: ログイン成功ならTrue、失敗ならFalse
+        """
+        raise NotImplementedError
+
+    def navigate(self, scraper, url):
+        """ページに移動する"""
+        scraper.driver.get(url)
+
+    def wait_ready(self, scraper):
+        """
+        ページの準備完了を待つ
+
+        Returns:
+            float: 待機にかかった時間（秒）
+        """
+        return scraper.wait_for_page_ready()
+
+    def extract(self, scraper):
+        """
+        現在のページから求職者情報を取り出す
+
+        Returns:
+            tuple: (求職者情報のdict。氏名が取得できなければNone, 取得方式の名前)
+        """
+        raise NotImplementedError
+
+
+class SeleniumBackend(PageBackend):
+    """ChromeDriver（WebDriver）経由でChromeを操作する方式"""
+
+    name = "selenium"
+
+    def start(self, scraper):
+        return scraper._create_chrome_driver()
+
+    def login(self, scraper, username, password, login_url):
+        return scraper._login_with_form(username, password, login_url)
+
+    def extract(self, scraper):
+        candidate_info = None
+        extraction = scraper.extraction
+
+        if extraction == "script":
+            candidate_info = scraper._extract_with_script()
+
+        if candidate_info is None:
+            # スクリプトで取得できなかった場合は要素ごとの取得にフォールバック
+            extraction = "selenium"
+            candidate_info = scraper._extract_with_selenium()
+
+        return candidate_info, extraction
+
+
+class CdpBackend(PageBackend):
+    """ChromeDriverを使わず、DevToolsプロトコルでChromeを直接操作する方式（WebDriverのHTTP通信を省く）"""
+
+    name = "cdp"
+
+    def __init__(self, chrome_path=None, page_load_timeout=30):
+        """
+        Args:
+            chrome_path (str, optional): Chromeの実行ファイルのパス。Noneの場合は環境変数CHROME_PATHまたはPATHから探す
+            page_load_timeout (float): ページのloadイベントを待つ最大時間（秒）
+        """
+        self.chrome_path = chrome_path
+        self.page_load_timeout = page_load_timeout
+
+    def start(self, scraper):
+        return CdpDriver.launch(self.chrome_path, headless=scraper.lean, lean=scraper.lean,
+                                page_load_timeout=self.page_load_timeout)
+
+    def login(self, scraper, username, password, login_url):
+        try:
+            scraper.driver.get(login_url)
+            if not scraper.driver.execute_script(LOGIN_SCRIPT, username, password):
+                raise WebDriverException("ログインフォームが見つかりません")
+
+            # ログイン後のページが表示されるまで待機
+            deadline = time.monotonic() + 20
+            while True:
+                try:
+                    if "dashboard" in scraper.driver.current_url:
+                        break
+                except WebDriverException:
+                    # 移動中はページのコンテキストが破棄されて取得できない場合があるため、タイムアウトまで確認し直す
+                    pass
+                if time.monotonic() > deadline:
+                    raise TimeoutException("ログイン後のページが表示されませんでした")
+                time.sleep(0.2)
+
+            return True
+
+        except Exception as e:
+            print(f"ログイン中にエラーが発生しました: {str(e)}")
+            return False
+
+    def extract(self, scraper):
+        candidate_info = scraper._extract_with_script()
+        if candidate_info is not None:
+            return candidate_info, "script"
+
+        # 要素ごとの取得の代わりに、ページのHTMLから取り出す
+        return extract_candidate_from_html(scraper.driver.page_source), "html"
+
+
+class FakeBackend(PageBackend):
+    """ブラウザを起動せず、プロセス内で生成したページを返す方式（テスト・ベンチマーク用）"""
+
+    name = "fake"
+
+    def __init__(self, pages=None, latency=0.0):
+        """
+        Args:
+            pages (callable, optional): URLを受け取ってページのHTML（存在しなければNone）を返す関数。
+                                        Noneの場合はどのURLにもrender_candidate_html()の既定のページを返す
+            latency (float): ページの移動ごとに待機する時間（秒）
+        """
+        self.pages = pages or (lambda url: render_candidate_html())
+        self.latency = latency
+
+    def start(self, scraper):
+        return FakeDriver(self.pages, self.latency)
+
+    def login(self, scraper, username, password, login_url):
+        scraper.driver.current_url = "https://www.bizreach.jp/company/dashboard"
+        return True
+
+    def wait_ready(self, scraper):
+        # ページは移動した時点で完成しているため待機しない
+        return 0.0
+
+    def extract(self, scraper):
+        return extract_candidate_from_html(scraper.driver.page_source), "html"
+
+
+def find_chrome_binary(chrome_path=None):
+    """
+    Chromeの実行ファイルのパスを返す
+
+    Args:
+        chrome_path (str, optional): 指定されたパス。Noneの場合は環境変数CHROME_PATHまたはPATHから探す
+
+    Returns:
+        str: 実行ファイルのパス（見つからない場合はNone）
+    """
+    return chrome_path or os.environ.get(CHROME_PATH_ENV) or next(
+        filter(None, (shutil.which(name) for name in CHROME_BINARY_NAMES)), None
+    )
+
+
+def create_backend(name, **options):
+    """
+    名前からブラウザの操作方式を生成する関数
+
+    Args:
+        name (str): BACKENDSのいずれか
+        **options: 方式ごとの初期化引数（cdpのchrome_path、fakeのpagesなど）
+
+    Returns:
+        PageBackend: 生成した操作方式
+    """
+    backends = {"selenium": SeleniumBackend, "cdp": CdpBackend, "fake": FakeBackend}
+    if name not in backends:
+        raise ValueError(f"サポートされていないバックエンドです: {name}")
+    return backends[name](**options)
+
+
+class FakeDriver:
+    """FakeBackendのWebDriver互換のドライバー"""
+
+    def __init__(self, pages, latency=0.0):
+        self.pages = pages
+        self.latency = latency
+        self.current_url = "about:blank"
+        self.page_source = "<html><body></body></html>"
+        self.cookies = []
+        self.local_storage = {}
+
+    def get(self, url):
+        if self.latency:
+            time.sleep(self.latency)
+        html = self.pages(url)
+        self.current_url = url
+        self.page_source = html if html is not None else "<html><body>Not Found</body></html>"
+
+    def execute_script(self, script, *args):
+        if "localStorage.setItem" in script:
+            self.local_storage[args[0]] = args[1]
+            return None
+        if "localStorage" in script:
+            return dict(self.local_storage)
+        if "navigator.userAgent" in script:
+            return "Mozilla/5.0 (FakeBackend)"
+        if "document.readyState" in script:
+            return "complete"
+        if script.strip() == "return 1":
+            return 1
+        # 注入スクリプトでの取得は行わず、HTMLからの取り出しを使う
+        return None
+
+    def execute_cdp_cmd(self, cmd, params):
+        return {}
+
+    def get_cookies(self):
+        return list(self.cookies)
+
+    def add_cookie(self, cookie):
+        self.cookies = [c for c in self.cookies if c["name"] != cookie["name"]] + [dict(cookie)]
+
+    def maximize_window(self):
+        pass
+
+    def quit(self):
+        pass
+
+
+class CdpDriver:
+    """ChromeのDevToolsプロトコルをWebSocketで直接操作する、WebDriver互換のドライバー"""
+
+    def __init__(self, websocket_url, process=None, user_data_dir=None, page_load_timeout=30):
+        """
+        Args:
+            websocket_url (str): ページのDevToolsのWebSocket URL
+            process (subprocess.Popen, optional): launch()で起動したChromeのプロセス（quit()で終了する）
+            user_data_dir (str, optional): launch()で作成した一時プロファイル（quit()で削除する）
+            page_load_timeout (float): ページのloadイベントを待つ最大時間（秒）
+        """
+        # websocket-clientはcdp方式でのみ必要なため、ここで読み込む
+        import websocket
+
+        self.process = process
+        self.user_data_dir = user_data_dir
+        self.page_load_timeout = page_load_timeout
+        self._websocket = websocket.create_connection(websocket_url, timeout=page_load_timeout, suppress_origin=True)
+        self._next_id = 0
+        self._events = []
+
+        self.execute_cdp_cmd("Page.enable", {})
+        self.execute_cdp_cmd("Network.enable", {})
+
+    @classmethod
+    def launch(cls, chrome_path=None, headless=True, lean=False, page_load_timeout=30):
+        """
+        リモートデバッグを有効にしてChromeを起動し、そのページに接続する
+
+        Args:
+            chrome_path (str, optional): Chromeの実行ファイルのパス
+            headless (bool): ヘッドレスで起動する場合True
+            lean (bool): 画像を読み込まず、解析タグなどへの通信を遮断する場合True
+            page_load_timeout (float): ページのloadイベントを待つ最大時間（秒）
+
+        Returns:
+            CdpDriver: 接続したドライバー
+        """
+        chrome_path = find_chrome_binary(chrome_path)
+        if not chrome_path:
+            raise WebDriverException(f"Chromeが見つかりません（環境変数{CHROME_PATH_ENV}でパスを指定してください）")
+
+        user_data_dir = tempfile.mkdtemp(prefix="bizreach_cdp_")
+        command = [
+            chrome_path, "--remote-debugging-port=0", f"--user-data-dir={user_data_dir}",
+            "--no-first-run", "--no-default-browser-check", "--disable-notifications",
+            "--disable-popup-blocking", "--disable-extensions", "about:blank"
+        ]
+        if headless:
+            command[1:1] = ["--headless=new", "--window-size=1280,800", "--disable-gpu", "--mute-audio"]
+        if lean:
+            command.insert(1, "--blink-settings=imagesEnabled=false")
+
+        process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+        try:
+            # Chromeが空いているポートで待ち受けると、プロファイルにポート番号が書き込まれる
+            port_file = os.path.join(user_data_dir, "DevToolsActivePort")
+            deadline = time.monotonic() + 20
+            while True:
+                port = None
+                if os.path.exists(port_file):
+                    with open(port_file) as f:
+                        port = next(iter(f.read().split()), None)
+                if port:
+                    break
+                if process.poll() is not None or time.monotonic() > deadline:
+                    raise WebDriverException("Chromeのリモートデバッグに接続できませんでした")
+                time.sleep(0.1)
+
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/json/list", timeout=5) as response:
+                targets = json.load(response)
+            page = next(target for target in targets if target["type"] == "page")
+            driver = cls(page["webSocketDebuggerUrl"], process, user_data_dir, page_load_timeout)
+        except Exception:
+            process.kill()
+            shutil.rmtree(user_data_dir, ignore_errors=True)
+            raise
+
+        if lean:
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        return driver
+
+    def execute_cdp_cmd(self, cmd, params):
+        """
+        DevToolsプロトコルのコマンドを実行する（応答を待つ間に届いたイベントは保持する）
+
+        Args:
+            cmd (str): コマンド名（Page.navigateなど）
+            params (dict): コマンドの引数
+
+        Returns:
+            dict: コマンドの結果
+        """
+        self._next_id += 1
+        command_id = self._next_id
+        try:
+            self._websocket.send(json.dumps({"id": command_id, "method": cmd, "params": params}))
+            while True:
+                message = json.loads(self._websocket.recv())
+                if message.get("id") == command_id:
+                    break
+                if "method" in message:
+                    self._events.append(message["method"])
+        except Exception as e:
+            # 切断やタイムアウトは、WebDriverと同じくブラウザの異常として扱う
+            raise WebDriverException(f"DevToolsとの通信に失敗しました: {e}")
+
+        if "error" in message:
+            raise WebDriverException(message["error"].get("message", str(message["error"])))
+        return message.get("result", {})
+
+    def _wait_for_event(self, method, timeout):
+        """指定したイベントが届くまで待つ"""
+        deadline = time.monotonic() + timeout
+        while method not in self._events:
+            if time.monotonic() > deadline:
+                raise TimeoutException(f"{method}を待つ間にタイムアウトしました")
+            try:
+                message = json.loads(self._websocket.recv())
+            except Exception as e:
+                raise WebDriverException(f"DevToolsとの通信に失敗しました: {e}")
+            if "method" in message:
+                self._events.append(message["method"])
+
+    def get(self, url):
+        self._events.clear()
+        result = self.execute_cdp_cmd("Page.navigate", {"url": url})
+        if result.get("errorText"):
+            raise WebDriverException(f"{result['errorText']} ({url})")
+        self._wait_for_event("Page.loadEventFired", self.page_load_timeout)
+
+    def execute_script(self, script, *args):
+        expression = f"(function() {{{script}\n}}).apply(null, {json.dumps(args, ensure_ascii=False)})"
+        result = self.execute_cdp_cmd("Runtime.evaluate", {"expression": expression, "returnByValue": True})
+        if "exceptionDetails" in result:
+            details = result["exceptionDetails"]
+            raise JavascriptException(details.get("exception", {}).get("description", details.get("text")))
+        return result.get("result", {}).get("value")
+
+    @property
+    def current_url(self):
+        return self.execute_script("return location.href")
+
+    @property
+    def page_source(self):
+        return self.execute_script("return document.documentElement.outerHTML")
+
+    def get_cookies(self):
+        cookies = []
+        for cookie in self.execute_cdp_cmd("Network.getCookies", {}).get("cookies", []):
+            converted = {key: cookie[key] for key in ("name", "value", "domain", "path", "secure", "httpOnly")}
+            if cookie.get("expires", -1) > 0:
+                converted["expiry"] = int(cookie["expires"])
+            if cookie.get("sameSite"):
+                converted["sameSite"] = cookie["sameSite"]
+            cookies.append(converted)
+        return cookies
+
+    def add_cookie(self, cookie):
+        params = {key: cookie[key] for key in ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite")
+                  if key in cookie}
+        if "domain" not in params:
+            params["url"] = self.current_url
+        if "expiry" in cookie:
+            params["expires"] = cookie["expiry"]
+        self.execute_cdp_cmd("Network.setCookie", params)
+
+    def maximize_window(self):
+        pass
+
+    def quit(self):
+        try:
+            self._websocket.close()
+        finally:
+            if self.process:
+                self.process.terminate()
+                try:
+                    self.process.wait(timeout=10)
+                except subprocess.TimeoutExpired:
+                    self.process.kill()
+            if self.user_data_dir:
+                shutil.rmtree(self.user_data_dir, ignore_errors=True)
@@ -6,23 +6,101 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import time
-import pandas as pd
 import json
 import os
+from contextlib import nullcontext
 from datetime import datetime
+from candidate_page import (
+    SELECTORS, NAME_NOT_FOUND, AGE_UNKNOWN, EXTRACT_SCRIPT, READINESS_POLICIES, EXTRACTION_METHODS
+)
+from http_fetcher import HttpFetcher
+from html_extractor import extract_candidate_from_html
+from exporters import export_csv, export_json, export_parquet
+from browser_supervisor import BrowserSupervisor
+from errors import SessionExpiredError, PageStructureError, ThrottledError, classify_error
+from retry import RetryHandler
+from backends import BACKENDS, BLOCKED_URL_PATTERNS, PageBackend, create_backend
+from driver_cache import DriverPathCache
+from metrics import PageTimings
+
+
+# add_cookieで受け付けられるCookieのキー
+COOKIE_KEYS = ("name", "value", "domain", "path", "secure", "httpOnly", "expiry", "sameSite")
+
+# 軽量モードで設定するChromeのプリファレンス（画像とWebフォントを読み込まない）
+LEAN_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "webkit.webprefs.remote_fonts_enabled": False
+}
+
+# sections方式で存在を確認する各セクションのセレクター
+SECTION_SELECTORS = (
+    SELECTORS["name"],
+    SELECTORS["career_item"],
+    SELECTORS["skill_item"],
+    SELECTORS["education_item"]
+)
+
+# network_idle方式で、リソースの読み込みが止まったとみなすまでの時間（秒）
+NETWORK_IDLE_SECONDS = 0.5
+
+
+class NetworkIdle:
+    """リソースの読み込みが一定時間止まったことを判定するWebDriverWait用の条件"""
+
+    def __init__(self, idle_seconds=NETWORK_IDLE_SECONDS):
+        self.idle_seconds = idle_seconds
+        self.last_count = None
+        self.last_change = None
+
+    def __call__(self, driver):
+        count = driver.execute_script(
+            "return document.readyState === 'complete' ? "
+            "performance.getEntriesByType('resource').length : -1"
+        )
+        now = time.monotonic()
+
+        if count != self.last_count or count == -1:
+            self.last_count = count
+            self.last_change = now
+            return False
+
+        return now - self.last_change >= self.idle_seconds
 
 
 class BizreachScraper:
     """ビズリーチの求職者情報をスクレイピングするためのクラス"""
 
-    def __init__(self, chrome_driver_path=None):
+    def __init__(self, chrome_driver_path=None, readiness="ready_state", page_timeout=10, field_timeout=5,
+                 extraction="script", lean=False, backend="selenium", driver_cache=None):
         """
         ビズリーチスクレイパーの初期化
         
         Args:
             chrome_driver_path (str, optional): Chromeドライバーのパス。None の場合は自動検出・ダウンロードされます。
+            readiness (str): ページの準備完了の判定方式（READINESS_POLICIESのいずれか）
+            page_timeout (float): ページの準備完了を待つ最大時間（秒）
+            field_timeout (float): 各項目の要素が表示されるのを待つ最大時間（秒）
+            extraction (str): 求職者情報の取得方式（EXTRACTION_METHODSのいずれか）
+            lean (bool): Trueの場合、ヘッドレスで起動し、画像・フォント・解析タグなどを読み込まない軽量モードにする
+            backend (str or PageBackend): ブラウザの操作方式（BACKENDSのいずれか、またはPageBackendのインスタンス）
+            driver_cache (DriverPathCache, optional): ChromeDriverのパスのキャッシュ。None の場合は既定のキャッシュファイルを使います。
         """
+        if readiness not in READINESS_POLICIES:
+            raise ValueError(f"サポートされていない待機方式です: {readiness}")
+        if extraction not in EXTRACTION_METHODS:
+            raise ValueError(f"サポートされていない取得方式です: {extraction}")
+        if not isinstance(backend, PageBackend) and backend not in BACKENDS:
+            raise ValueError(f"サポートされていないバックエンドです: {backend}")
+        
         self.chrome_driver_path = chrome_driver_path
+        self.readiness = readiness
+        self.page_timeout = page_timeout
+        self.field_timeout = field_timeout
+        self.extraction = extraction
+        self.lean = lean
+        self.backend = backend if isinstance(backend, PageBackend) else create_backend(backend)
+        self.driver_cache = driver_cache
         self.options = webdriver.ChromeOptions()
         
         # ゲストモードの設定
@@ -33,24 +111,71 @@ class BizreachScraper:
         self.options.add_argument("--disable-popup-blocking")
         self.options.add_argument("--disable-extensions")
         
+        # 軽量モードの設定（ウィンドウを描画せず、不要なリソースを読み込まない）
+        if lean:
+            self.options.add_argument("--headless=new")
+            self.options.add_argument("--window-size=1280,800")
+            self.options.add_argument("--disable-gpu")
+            self.options.add_argument("--mute-audio")
+            self.options.add_experimental_option("prefs", LEAN_PREFS)
+        
         self.driver = None
         self.wait = None
         self.candidate_data = []
+        
+        # ログイン後にenable_http_fast_path()で設定される、ブラウザを使わない取得手段
+        self.http_fetcher = None
+        
+        # enable_snapshots()で設定される、ページのHTMLの保存先と再利用する最大の経過時間（秒）
+        self.snapshot_store = None
+        self.snapshot_reuse_seconds = None
+        
+        # enable_supervisor()で設定される、ブラウザの再起動・死活監視
+        self.supervisor = None
+        
+        # enable_retries()で設定される、エラーの分類ごとの再試行
+        self.retry_handler = None
+        
+        # enable_pacing()で設定される、ページの応答に合わせたリクエスト間隔の調整
+        self.pacer = None
+        
+        # enable_metrics()で設定される、処理段階ごとの時間とカウンターの集計
+        self.metrics = None
+        
+        # ページごとの待機・取得時間の集計
+        self.page_timings = PageTimings()
     
     def start_browser(self):
-        """ブラウザを起動する"""
+        """ブラウザを起動する（操作方式はbackendで指定）"""
+        self.driver = self.backend.start(self)
+        self.wait = WebDriverWait(self.driver, 20)
+        return True
+    
+    def _create_chrome_driver(self):
+        """
+        ChromeDriver経由でChromeを起動する（seleniumバックエンドの起動処理）
+        
+        Returns:
+            WebDriver: 起動したChromeのWebDriver
+        """
         if self.chrome_driver_path:
             # 指定されたドライバーパスを使用
             service = Service(self.chrome_driver_path)
-            self.driver = webdriver.Chrome(service=service, options=self.options)
+            driver = webdriver.Chrome(service=service, options=self.options)
         else:
-            # ChromeDriverManagerを使用して自動検出・ダウンロード
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=self.options)
-            
-        self.wait = WebDriverWait(self.driver, 20)
-        self.driver.maximize_window()
-        return True
+            # ChromeDriverManagerを使用して自動検出・ダウンロード（同じバージョンのChromeではキャッシュしたパスを使用）
+            if self.driver_cache is None:
+                self.driver_cache = DriverPathCache()
+            service = Service(self.driver_cache.resolve(lambda: ChromeDriverManager().install()))
+            driver = webdriver.Chrome(service=service, options=self.options)
+        
+        if self.lean:
+            # 解析タグや動画などへのリクエストをブラウザ内で遮断
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        else:
+            driver.maximize_window()
+        return driver
         
     def login(self, username, password, login_url="https://www.bizreach.jp/company/login"):
         """
@@ -64,6 +189,10 @@ class BizreachScraper:
         Returns:
             bool: ログイン成功ならTrue、失敗ならFalse
         """
+        return self.backend.login(self, username, password, login_url)
+    
+    def _login_with_form(self, username, password, login_url):
+        """ログインフォームの要素を操作してログインする（seleniumバックエンドのログイン処理）"""
         try:
             # ログインページにアクセス
             self.driver.get(login_url)
@@ -92,49 +221,261 @@ class BizreachScraper:
         except Exception as e:
             print(f"ログイン中にエラーが発生しました: {str(e)}")
             return False
+
+    def get_cookies(self):
+        """
+        現在のブラウザセッションのCookieを取得する
+
+        Returns:
+            list: Cookieの辞書のリスト
+        """
+        return self.driver.get_cookies()
+
+    def add_cookies(self, cookies, base_url="https://www.bizreach.jp/"):
+        """
+        別のセッションで取得したCookieをブラウザに設定する（ログインの共有用）
+
+        Args:
+            cookies (list): get_cookies()で取得したCookieのリスト
+            base_url (str): Cookieを設定する前に開くURL（同じドメインである必要があります）
+        """
+        # Cookieは開いているページのドメインにしか設定できないため、先にアクセスしておく
+        self.driver.get(base_url)
+
+        for cookie in cookies:
+            cookie = {key: value for key, value in cookie.items() if key in COOKIE_KEYS}
+            self.driver.add_cookie(cookie)
+
+    def get_local_storage(self):
+        """
+        現在のページのローカルストレージの内容を取得する
+        
+        Returns:
+            dict: キーと値の辞書
+        """
+        return self.driver.execute_script(
+            "return Object.fromEntries(Object.keys(localStorage).map(k => [k, localStorage.getItem(k)]))"
+        )
     
-    def scrape_candidate_page(self, url):
+    def set_local_storage(self, items):
         """
-        求職者ページから情報をスクレイピングする
+        現在のページのローカルストレージに値を設定する
+        
+        Args:
+            items (dict): キーと値の辞書
+        """
+        for key, value in items.items():
+            self.driver.execute_script("localStorage.setItem(arguments[0], arguments[1])", key, value)
+    
+    def enable_http_fast_path(self, pool_size=10):
+        """
+        ログイン済みのセッションを引き継ぎ、求職者ページをまずHTTPで直接取得するようにする
+        
+        HTTPで取得できないページやJavaScriptが必要なページは、自動的にブラウザで取得します。
+        
+        Args:
+            pool_size (int): HTTP接続プールのサイズ
+        """
+        self.http_fetcher = HttpFetcher.from_driver(
+            self.driver, pool_size=pool_size, snapshot_store=self.snapshot_store
+        )
+    
+    def enable_snapshots(self, snapshot_store, reuse_seconds=None):
+        """
+        取得したページのHTMLをスナップショットストアに保存するようにする
+        
+        Args:
+            snapshot_store (SnapshotStore): HTMLの保存先
+            reuse_seconds (float, optional): 指定した場合、この秒数以内に保存したHTMLがあれば
+                                             ページにアクセスせずにそのHTMLから取得する
+        """
+        self.snapshot_store = snapshot_store
+        self.snapshot_reuse_seconds = reuse_seconds
+        
+        if self.http_fetcher:
+            self.http_fetcher.snapshot_store = snapshot_store
+    
+    def enable_supervisor(self, username, password, session_cache=None, recycle_pages=1000, max_memory_mb=None):
+        """
+        ブラウザの定期的な再起動と、異常終了したブラウザの自動再起動・再ログインを有効にする
+        
+        Args:
+            username (str): 再ログイン用のユーザー名/メールアドレス
+            password (str): 再ログイン用のパスワード
+            session_cache (SessionCache, optional): 再ログイン時に保存したセッションを再利用する場合のキャッシュ
+            recycle_pages (int): ブラウザでこのページ数を読み込むごとにブラウザを再起動する（0の場合は再起動しない）
+            max_memory_mb (float, optional): ページのJavaScriptヒープがこのサイズ（MB）を超えたらブラウザを再起動する
+        
+        Returns:
+            BrowserSupervisor: 再起動の回数などを持つ監視オブジェクト
+        """
+        self.supervisor = BrowserSupervisor(
+            self, username, password, session_cache,
+            recycle_pages=recycle_pages, max_memory_mb=max_memory_mb
+        )
+        return self.supervisor
+    
+    def enable_retries(self, policies=None, breaker=None):
+        """
+        取得に失敗したページを、エラーの分類（一時的な通信エラー、セッション切れ、ページ構造の変更、アクセス制限）
+        ごとの方針で再試行するようにする
+        
+        Args:
+            policies (dict, optional): エラーの分類をキーとするRetryPolicy。Noneの場合は標準の方針
+            breaker (CircuitBreaker, optional): 失敗が急増したときに実行を一時停止するサーキットブレーカー
+        
+        Returns:
+            RetryHandler: 再試行の回数などを持つハンドラー
+        """
+        self.retry_handler = RetryHandler(policies, breaker, on_session_lost=self._recover_session)
+        return self.retry_handler
+    
+    def enable_pacing(self, pacer):
+        """
+        リクエスト間隔を固定の待機時間ではなく、ページの応答に合わせて調整するようにする
+        
+        複数のスクレイパーで同じpacerを共有すると、全体でのリクエスト間隔を調整します。
+        
+        Args:
+            pacer (AdaptivePacer): リクエスト間隔を調整するオブジェクト
+        """
+        self.pacer = pacer
+    
+    def enable_metrics(self, metrics):
+        """
+        ページの移動・待機・項目ごとの取得・書き出しなど、処理段階ごとの時間とページ数・エラー数を集計する
+        
+        Args:
+            metrics (Metrics): 集計先（複数のスクレイパーで共有可能）
+        """
+        self.metrics = metrics
+    
+    def _timer(self, phase):
+        """処理段階の時間を計測するコンテキストマネージャーを返す（集計しない場合は何もしない）"""
+        return self.metrics.timer(phase) if self.metrics else nullcontext()
+    
+    def _recover_session(self):
+        """ログインセッションが切れた場合に再ログインする（ブラウザ監視が有効な場合のみ）"""
+        if self.supervisor:
+            self.supervisor.relogin()
+    
+    def scrape_from_snapshot(self, url):
+        """
+        再利用できる新しいスナップショットがあれば、ページにアクセスせずそのHTMLから求職者情報を取得する
         
         Args:
             url (str): 求職者ページのURL
         
         Returns:
-            dict: 取得した求職者情報
+            dict: 取得した求職者情報。スナップショットを再利用しない設定、または新しいスナップショットがなければNone
+        """
+        if not self.snapshot_store or not self.snapshot_reuse_seconds:
+            return None
+        
+        html = self.snapshot_store.get_fresh(url, self.snapshot_reuse_seconds)
+        if html is None:
+            return None
+        
+        candidate_info = extract_candidate_from_html(html)
+        if candidate_info is None:
+            return None
+        
+        candidate_info["url"] = url
+        candidate_info["scraped_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return candidate_info
+    
+    def _readiness_condition(self):
+        """設定された待機方式に対応するWebDriverWait用の条件を返す"""
+        if self.readiness == "ready_state":
+            return lambda driver: driver.execute_script("return document.readyState") == "complete"
+        
+        if self.readiness == "sections":
+            selectors = json.dumps(list(SECTION_SELECTORS))
+            return lambda driver: driver.execute_script(
+                f"return {selectors}.every(s => document.querySelector(s) !== null)"
+            ) is True
+        
+        return NetworkIdle()
+    
+    def wait_for_page_ready(self):
+        """
+        設定された待機方式でページの準備完了を待つ
+        
+        タイムアウトしても例外は送出せず、その時点のページから取得を試みます。
+        
+        Returns:
+            float: 待機にかかった時間（秒）
+        """
+        start_time = time.monotonic()
+        
+        if self.readiness == "fixed":
+            time.sleep(3)
+        else:
+            try:
+                WebDriverWait(self.driver, self.page_timeout, poll_frequency=0.1).until(
+                    self._readiness_condition()
+                )
+            except TimeoutException:
+                pass
+        
+        return time.monotonic() - start_time
+    
+    def _extract_with_script(self):
+        """
+        注入したスクリプト1回の呼び出しで求職者情報を取得する
+        
+        Returns:
+            dict: 取得した求職者情報。取得できなかった場合（氏名が未表示の場合を含む）はNone
         """
         try:
-            self.driver.get(url)
-            
-            # ページが完全に読み込まれるまで待機
-            time.sleep(3)  # ページ読み込みのための明示的な待機
-            
-            # 基本情報の取得（セレクターは実際のものに調整してください）
-            candidate_info = {}
-            
-            # 氏名
+            result = self.driver.execute_script(EXTRACT_SCRIPT, SELECTORS)
+        except Exception:
+            return None
+        
+        if not isinstance(result, dict) or not result.get("name"):
+            return None
+        
+        if result.get("age") is None:
+            result["age"] = AGE_UNKNOWN
+        
+        return result
+    
+    def _extract_with_selenium(self):
+        """
+        要素ごとにfind_elementを呼び出して求職者情報を取得する（スクリプトが使えない場合のフォールバック）
+        
+        Returns:
+            dict: 取得した求職者情報
+        """
+        candidate_info = {}
+        
+        # 氏名（field_timeoutの範囲で表示を待つ）
+        with self._timer("extract.name"):
             try:
-                name_element = self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "h1.candidate-name")))
+                field_wait = WebDriverWait(self.driver, self.field_timeout, poll_frequency=0.1)
+                name_element = field_wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, SELECTORS["name"])))
                 candidate_info["name"] = name_element.text
             except Exception:
-                candidate_info["name"] = "取得できませんでした"
-            
-            # 年齢
+                candidate_info["name"] = NAME_NOT_FOUND
+        
+        # 年齢
+        with self._timer("extract.age"):
             try:
-                age_element = self.driver.find_element(By.CSS_SELECTOR, "span.candidate-age")
+                age_element = self.driver.find_element(By.CSS_SELECTOR, SELECTORS["age"])
                 candidate_info["age"] = age_element.text
             except Exception:
-                candidate_info["age"] = "不明"
-            
-            # 経歴情報
+                candidate_info["age"] = AGE_UNKNOWN
+        
+        # 経歴情報
+        with self._timer("extract.career"):
             try:
-                career_elements = self.driver.find_elements(By.CSS_SELECTOR, "div.career-history-item")
+                career_elements = self.driver.find_elements(By.CSS_SELECTOR, SELECTORS["career_item"])
                 career_history = []
                 
                 for element in career_elements:
-                    company = element.find_element(By.CSS_SELECTOR, "div.company-name").text
-                    period = element.find_element(By.CSS_SELECTOR, "div.period").text
-                    position = element.find_element(By.CSS_SELECTOR, "div.position").text
+                    company = element.find_element(By.CSS_SELECTOR, SELECTORS["career_company"]).text
+                    period = element.find_element(By.CSS_SELECTOR, SELECTORS["career_period"]).text
+                    position = element.find_element(By.CSS_SELECTOR, SELECTORS["career_position"]).text
                     
                     career_history.append({
                         "company": company,
@@ -145,24 +486,26 @@ class BizreachScraper:
                 candidate_info["career_history"] = career_history
             except Exception:
                 candidate_info["career_history"] = []
-            
-            # スキル情報
+        
+        # スキル情報
+        with self._timer("extract.skills"):
             try:
-                skill_elements = self.driver.find_elements(By.CSS_SELECTOR, "div.skill-item")
+                skill_elements = self.driver.find_elements(By.CSS_SELECTOR, SELECTORS["skill_item"])
                 skills = [element.text for element in skill_elements]
                 candidate_info["skills"] = skills
             except Exception:
                 candidate_info["skills"] = []
-            
-            # 学歴情報
+        
+        # 学歴情報
+        with self._timer("extract.education"):
             try:
-                education_elements = self.driver.find_elements(By.CSS_SELECTOR, "div.education-item")
+                education_elements = self.driver.find_elements(By.CSS_SELECTOR, SELECTORS["education_item"])
                 education = []
                 
                 for element in education_elements:
-                    school = element.find_element(By.CSS_SELECTOR, "div.school-name").text
-                    period = element.find_element(By.CSS_SELECTOR, "div.edu-period").text
-                    degree = element.find_element(By.CSS_SELECTOR, "div.degree").text
+                    school = element.find_element(By.CSS_SELECTOR, SELECTORS["education_school"]).text
+                    period = element.find_element(By.CSS_SELECTOR, SELECTORS["education_period"]).text
+                    degree = element.find_element(By.CSS_SELECTOR, SELECTORS["education_degree"]).text
                     
                     education.append({
                         "school": school,
@@ -173,88 +516,178 @@ class BizreachScraper:
                 candidate_info["education"] = education
             except Exception:
                 candidate_info["education"] = []
+        
+        return candidate_info
+    
+    def scrape_candidate_page(self, url):
+        """
+        求職者ページから情報をスクレイピングする
+        
+        enable_supervisor()を呼んだ場合は、必要に応じてブラウザを再起動しながら取得します。
+        enable_retries()を呼んだ場合は、失敗したページをエラーの分類ごとの方針で再試行します。
+        
+        Args:
+            url (str): 求職者ページのURL
+        
+        Returns:
+            dict: 取得した求職者情報
+        """
+        scrape_page = self._scrape_candidate_page
+        
+        if self.supervisor:
+            def scrape_page(page_url):
+                return self.supervisor.scrape(page_url, self._scrape_candidate_page)
+        
+        with self._timer("page"):
+            if self.retry_handler:
+                result = self.retry_handler.run(url, scrape_page)
+            else:
+                result = scrape_page(url)
+        
+        if self.metrics:
+            self.metrics.inc("pages", status="error" if "error" in result else "ok")
+            if "error" in result:
+                self.metrics.inc("errors", error_type=result.get("error_type", "unknown"))
+        
+        return result
+    
+    def _scrape_candidate_page(self, url):
+        """求職者ページから情報をスクレイピングする（scrape_candidate_pageの本体）"""
+        request_start = None
+        try:
+            # 最近保存したHTMLがあれば、ページにアクセスしない
+            snapshot_start = time.monotonic()
+            with self._timer("snapshot"):
+                candidate_info = self.scrape_from_snapshot(url)
             
-            # URL情報も保存
-            candidate_info["url"] = url
+            if candidate_info is not None:
+                self.page_timings.record(url, "snapshot", "snapshot", 0.0, time.monotonic() - snapshot_start)
+                return candidate_info
             
-            # スクレイピング時刻
-            candidate_info["scraped_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            # ページにアクセスする場合だけ、リクエスト間隔を空ける
+            if self.pacer:
+                with self._timer("wait"):
+                    self.pacer.acquire()
+            request_start = time.monotonic()
             
-            return candidate_info
+            candidate_info = self._fetch_candidate_page(url)
             
         except Exception as e:
-            return {"url": url, "error": str(e), "scraped_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+            candidate_info = {
+                "url": url,
+                "error": str(e),
+                "error_type": classify_error(e),
+                "scraped_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            }
+            if getattr(e, "retry_after", None):
+                candidate_info["retry_after"] = e.retry_after
+        
+        if self.pacer and request_start is not None:
+            self.pacer.record(candidate_info, time.monotonic() - request_start)
+        
+        return candidate_info
     
-    def scrape_multiple_candidates(self, url_list, wait_time_range=(3, 5)):
+    def _fetch_candidate_page(self, url):
+        """HTTPまたはブラウザで求職者ページを取得する（取得できない場合は例外を発生させる）"""
+        if self.http_fetcher:
+            # HTTPで取得できたページはブラウザを使わない
+            fetch_start = time.monotonic()
+            with self._timer("http"):
+                candidate_info = self.http_fetcher.scrape_candidate_page(url)
+            
+            if candidate_info is not None:
+                self.page_timings.record(url, "http", "http", 0.0, time.monotonic() - fetch_start)
+                return candidate_info
+        
+        with self._timer("navigate"):
+            self.backend.navigate(self, url)
+        
+        # ログインページへリダイレクトされた場合はセッション切れ、CAPTCHAページの場合はアクセス制限
+        current_url = self.driver.current_url
+        if "login" in current_url:
+            raise SessionExpiredError("ログインページへリダイレクトされました")
+        if "captcha" in current_url:
+            raise ThrottledError("CAPTCHAページが表示されました")
+        
+        # ページの準備ができるまで待機
+        with self._timer("ready"):
+            ready_seconds = self.backend.wait_ready(self)
+        
+        # 基本情報の取得（セレクターはSELECTORSで実際のものに調整してください）
+        extract_start = time.monotonic()
+        with self._timer("extract"):
+            candidate_info, extraction = self.backend.extract(self)
+        
+        # 氏名が取得できないページは、構造が変わったとみなす
+        if candidate_info is None or candidate_info["name"] == NAME_NOT_FOUND:
+            raise PageStructureError("氏名の要素が見つかりません（セレクターを確認してください）")
+        
+        # 待機・取得時間を記録
+        self.page_timings.record(url, self.readiness, extraction, ready_seconds, time.monotonic() - extract_start)
+        
+        # ページのHTMLを保存（セレクター変更後にオフラインで取得し直せるように）
+        if self.snapshot_store:
+            with self._timer("snapshot_save"):
+                self.snapshot_store.save(url, self.driver.page_source)
+        
+        # URL情報も保存
+        candidate_info["url"] = url
+        
+        # スクレイピング時刻
+        candidate_info["scraped_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        
+        return candidate_info
+    
+    def scrape_multiple_candidates(self, url_list, wait_time_range=(3, 5), sink=None, checkpoint=None):
         """
         複数の求職者ページをスクレイピングする
         
         Args:
-            url_list (list): 求職者ページのURLリスト
-            wait_time_range (tuple): 各リクエスト間の待機時間の範囲（最小値, 最大値）
+            url_list (iterable): 求職者ページのURL（リストまたはUrlStreamなどのイテラブル）
+            wait_time_range (tuple): 各リクエスト間の待機時間の範囲（最小値, 最大値）。enable_pacing()の場合は使わない
+            sink (JsonlSink, optional): 指定した場合、取得した情報を1件ずつ書き出し、メモリには保持しない
+            checkpoint (CheckpointJournal, optional): 指定した場合、各URLの処理結果を記録する
         
         Returns:
-            list: 取得した求職者情報のリスト
+            list: 取得した求職者情報のリスト（sinkを指定した場合は空のリスト）
         """
         self.candidate_data = []
-        total_urls = len(url_list)
         
-        for i, url in enumerate(url_list, 1):
+        for i, url in enumerate(url_list):
+            # 最初のURL以外は、前のリクエストとの間に待機時間を設ける（enable_pacing()の場合は取得時に待機する）
+            if i > 0 and not self.pacer:
+                wait_time = wait_time_range[0] + (i % (wait_time_range[1] - wait_time_range[0] + 1))
+                with self._timer("wait"):
+                    time.sleep(wait_time)
+            
             # スクレイピングを実行
             candidate_data = self.scrape_candidate_page(url)
-            self.candidate_data.append(candidate_data)
+            if sink:
+                with self._timer("serialize"):
+                    sink.write(candidate_data)
+            else:
+                self.candidate_data.append(candidate_data)
             
-            # 最後のURL以外は待機時間を設ける
-            if i < total_urls:
-                wait_time = wait_time_range[0] + (i % (wait_time_range[1] - wait_time_range[0] + 1))
-                time.sleep(wait_time)
+            if checkpoint:
+                checkpoint.record(url, candidate_data)
         
         return self.candidate_data
     
-    def save_data_to_csv(self, filename="bizreach_candidates.csv"):
+    def save_data_to_csv(self, filename="bizreach_candidates.csv", candidates=None, career_depth=3, education_depth=1):
         """
         取得したデータをCSVファイルに保存する
         
         Args:
             filename (str): 保存先のファイル名
+            candidates (iterable, optional): 保存する求職者情報（iter_jsonl()など）。Noneの場合はcandidate_data
+            career_depth (int): 列にする経歴の件数（最新から）
+            education_depth (int): 列にする学歴の件数（最新から）
             
         Returns:
             bool: 保存成功ならTrue、失敗ならFalse
         """
         try:
-            # データが複雑なので、フラット化する必要がある
-            flat_data = []
-            
-            for candidate in self.candidate_data:
-                flat_candidate = {
-                    "name": candidate.get("name", ""),
-                    "age": candidate.get("age", ""),
-                    "url": candidate.get("url", ""),
-                    "scraped_at": candidate.get("scraped_at", "")
-                }
-                
-                # キャリア履歴は最新の3つまでを列として追加
-                career_history = candidate.get("career_history", [])
-                for i in range(min(3, len(career_history))):
-                    flat_candidate[f"company_{i+1}"] = career_history[i].get("company", "")
-                    flat_candidate[f"period_{i+1}"] = career_history[i].get("period", "")
-                    flat_candidate[f"position_{i+1}"] = career_history[i].get("position", "")
-                
-                # スキルはカンマ区切りで1つの列に
-                flat_candidate["skills"] = ", ".join(candidate.get("skills", []))
-                
-                # 学歴も最新のものを追加
-                education = candidate.get("education", [])
-                if education:
-                    flat_candidate["school"] = education[0].get("school", "")
-                    flat_candidate["edu_period"] = education[0].get("period", "")
-                    flat_candidate["degree"] = education[0].get("degree", "")
-                
-                flat_data.append(flat_candidate)
-            
-            # DataFrameに変換してCSVに保存
-            df = pd.DataFrame(flat_data)
-            df.to_csv(filename, index=False, encoding="utf-8-sig")  # Excel対応のためUTF-8 with BOMで保存
+            export_csv(self.candidate_data if candidates is None else candidates, filename, career_depth, education_depth)
             
             return True
             
@@ -262,19 +695,19 @@ class BizreachScraper:
             print(f"データの保存中にエラーが発生しました: {str(e)}")
             return False
     
-    def save_data_to_json(self, filename="bizreach_candidates.json"):
+    def save_data_to_json(self, filename="bizreach_candidates.json", candidates=None):
         """
         取得したデータをJSONファイルに保存する（全データを保持）
         
         Args:
             filename (str): 保存先のファイル名
+            candidates (iterable, optional): 保存する求職者情報（iter_jsonl()など）。Noneの場合はcandidate_data
             
         Returns:
             bool: 保存成功ならTrue、失敗ならFalse
         """
         try:
-            with open(filename, "w", encoding="utf-8") as f:
-                json.dump(self.candidate_data, f, ensure_ascii=False, indent=2)
+            export_json(self.candidate_data if candidates is None else candidates, filename)
             
             return True
             
@@ -282,6 +715,26 @@ class BizreachScraper:
             print(f"JSONデータの保存中にエラーが発生しました: {str(e)}")
             return False
     
+    def save_data_to_parquet(self, filename="bizreach_candidates.parquet", candidates=None):
+        """
+        取得したデータをParquetファイルに保存する（経歴・スキル・学歴を入れ子の構造のまま保持）
+        
+        Args:
+            filename (str): 保存先のファイル名
+            candidates (iterable, optional): 保存する求職者情報（iter_jsonl()など）。Noneの場合はcandidate_data
+            
+        Returns:
+            bool: 保存成功ならTrue、失敗ならFalse
+        """
+        try:
+            export_parquet(self.candidate_data if candidates is None else candidates, filename)
+            
+            return True
+            
+        except Exception as e:
+            print(f"Parquetデータの保存中にエラーが発生しました: {str(e)}")
+            return False
+    
     def close_browser(self):
         """
         ブラウザを閉じる
@@ -289,6 +742,10 @@ class BizreachScraper:
         Returns:
             bool: 成功ならTrue
         """
+        if self.http_fetcher:
+            self.http_fetcher.close()
+            self.http_fetcher = None
+        
         if self.driver:
             self.driver.quit()
             self.driver = None
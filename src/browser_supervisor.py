@@ -0,0 +1,216 @@
+from selenium.common.exceptions import WebDriverException
+
+# ブラウザを使わずに取得したページの取得方式（ブラウザのページ数に数えない）
+NON_BROWSER_EXTRACTIONS = ("snapshot", "http")
+
+
+class BrowserSupervisor:
+    """ブラウザの再起動・死活監視を行い、長時間の実行でもメモリ使用量と処理速度を一定に保つクラス"""
+
+    def __init__(self, scraper, username, password, session_cache=None,
+                 recycle_pages=1000, max_memory_mb=None, memory_check_interval=20, max_restarts=5):
+        """
+        ブラウザ監視の初期化
+
+        Args:
+            scraper (BizreachScraper): 監視するスクレイパー
+            username (str): 再ログイン用のユーザー名/メールアドレス
+            password (str): 再ログイン用のパスワード
+            session_cache (SessionCache, optional): 再ログイン時に保存したセッションを再利用する場合のキャッシュ
+            recycle_pages (int): ブラウザでこのページ数を読み込むごとにブラウザを再起動する（0の場合は再起動しない）
+            max_memory_mb (float, optional): ページのJavaScriptヒープがこのサイズ（MB）を超えたらブラウザを再起動する
+            memory_check_interval (int): メモリ使用量を確認する間隔（ページ数）
+            max_restarts (int): 連続してブラウザの異常終了から復旧できなかった場合に諦めるまでの再起動回数
+        """
+        self.scraper = scraper
+        self.username = username
+        self.password = password
+        self.session_cache = session_cache
+        self.recycle_pages = recycle_pages
+        self.max_memory_mb = max_memory_mb
+        self.memory_check_interval = memory_check_interval
+        self.max_restarts = max_restarts
+
+        # 現在のブラウザで読み込んだページ数
+        self.browser_pages = 0
+        self._consecutive_failures = 0
+        self._performance_enabled = False
+
+        # 再起動の回数（pages: ページ数での再起動, memory: メモリ使用量での再起動, crash: 異常終了からの復旧）
+        self.restarts = {"pages": 0, "memory": 0, "crash": 0}
+
+    def is_alive(self):
+        """
+        ブラウザのセッションが応答するかを確認する
+
+        Returns:
+            bool: 応答すればTrue
+        """
+        if self.scraper.driver is None:
+            return False
+
+        try:
+            self.scraper.driver.execute_script("return 1")
+            return True
+        except WebDriverException:
+            return False
+
+    def memory_usage_mb(self):
+        """
+        現在のページのJavaScriptヒープの使用量をCDPのPerformance.getMetricsで取得する
+
+        Returns:
+            float: 使用量（MB）。取得できなければNone
+        """
+        try:
+            if not self._performance_enabled:
+                self.scraper.driver.execute_cdp_cmd("Performance.enable", {})
+                self._performance_enabled = True
+
+            metrics = self.scraper.driver.execute_cdp_cmd("Performance.getMetrics", {})
+            values = {metric["name"]: metric["value"] for metric in metrics.get("metrics", [])}
+        except WebDriverException:
+            return None
+
+        if "JSHeapTotalSize" not in values:
+            return None
+        return values["JSHeapTotalSize"] / (1024 * 1024)
+
+    def restart(self, reason):
+        """
+        ブラウザを再起動する
+
+        正常なブラウザの再起動ではCookieとローカルストレージを引き継ぎ、異常終了からの復旧では再ログインします。
+
+        Args:
+            reason (str): 再起動の理由（pages, memory, crash）
+
+        Returns:
+            bool: 再起動してログイン済みの状態に戻ればTrue
+        """
+        scraper = self.scraper
+        cookies = local_storage = None
+
+        if reason != "crash":
+            try:
+                cookies = scraper.get_cookies()
+                local_storage = scraper.get_local_storage()
+            except WebDriverException:
+                cookies = None
+
+        # HTTPでの取得は、再ログイン後のCookieで作り直す
+        had_http_fetcher = scraper.http_fetcher is not None
+        try:
+            scraper.close_browser()
+        except WebDriverException:
+            scraper.driver = None
+
+        self.restarts[reason] += 1
+        self.browser_pages = 0
+        self._performance_enabled = False
+
+        scraper.start_browser()
+        if cookies:
+            scraper.add_cookies(cookies)
+            scraper.set_local_storage(local_storage or {})
+            logged_in = True
+        elif self.session_cache:
+            logged_in = self.session_cache.login(scraper, self.username, self.password)
+        else:
+            logged_in = scraper.login(self.username, self.password)
+
+        if logged_in and had_http_fetcher:
+            scraper.enable_http_fast_path()
+
+        return logged_in
+
+    def relogin(self):
+        """
+        ブラウザは動いたままログインセッションが切れた場合に、ログインし直す
+
+        Returns:
+            bool: ログインに成功すればTrue
+        """
+        scraper = self.scraper
+        if self.session_cache:
+            # 保存したセッションは切れているため、削除してからログインする
+            self.session_cache.clear()
+            logged_in = self.session_cache.login(scraper, self.username, self.password)
+        else:
+            logged_in = scraper.login(self.username, self.password)
+
+        if logged_in and scraper.http_fetcher is not None:
+            scraper.http_fetcher.close()
+            scraper.enable_http_fast_path()
+
+        return logged_in
+
+    def _recover(self):
+        """
+        ブラウザを再起動してログイン済みの状態に戻るまで繰り返す
+
+        Raises:
+            RuntimeError: 連続してmax_restarts回再起動しても復旧できなかった場合
+        """
+        while True:
+            if self._consecutive_failures >= self.max_restarts:
+                raise RuntimeError(f"ブラウザを{self.max_restarts}回再起動しても復旧できませんでした")
+
+            self._consecutive_failures += 1
+            try:
+                if self.restart("crash"):
+                    return
+            except WebDriverException:
+                continue
+
+    def _before_page(self):
+        """ページ数またはメモリ使用量が上限に達していればブラウザを再起動する"""
+        reason = None
+        if self.recycle_pages and self.browser_pages >= self.recycle_pages:
+            reason = "pages"
+        elif (self.max_memory_mb and self.browser_pages and
+              self.browser_pages % self.memory_check_interval == 0):
+            usage = self.memory_usage_mb()
+            if usage is not None and usage > self.max_memory_mb:
+                reason = "memory"
+
+        if reason is None:
+            return
+        try:
+            if self.restart(reason):
+                return
+        except WebDriverException:
+            pass
+        # 定期的な再起動に失敗した場合も、異常終了と同じく上限の回数まで再起動し直す
+        self._consecutive_failures += 1
+        self._recover()
+
+    def scrape(self, url, scrape_page):
+        """
+        ブラウザを監視しながら1ページをスクレイピングする
+
+        取得に失敗し、ブラウザのセッションが応答しない場合は、ブラウザを再起動して同じURLをもう一度取得します。
+
+        Args:
+            url (str): 求職者ページのURL
+            scrape_page (callable): URLを受け取って求職者情報のdictを返す関数
+
+        Returns:
+            dict: 取得した求職者情報
+        """
+        self._before_page()
+
+        result = scrape_page(url)
+
+        if "error" in result and not self.is_alive():
+            self._recover()
+            result = scrape_page(url)
+
+        if "error" not in result:
+            self._consecutive_failures = 0
+
+        last = self.scraper.page_timings.last
+        if last and last["url"] == url and last["extraction"] not in NON_BROWSER_EXTRACTIONS:
+            self.browser_pages += 1
+
+        return result
@@ -0,0 +1,77 @@
+# 求職者ページの各項目のセレクター（実際のページ構造に合わせて調整してください）
+# ブラウザ経由の取得とHTMLからの取得で同じ定義を使います
+SELECTORS = {
+    "name": "h1.candidate-name",
+    "age": "span.candidate-age",
+    "career_item": "div.career-history-item",
+    "career_company": "div.company-name",
+    "career_period": "div.period",
+    "career_position": "div.position",
+    "skill_item": "div.skill-item",
+    "education_item": "div.education-item",
+    "education_school": "div.school-name",
+    "education_period": "div.edu-period",
+    "education_degree": "div.degree"
+}
+
+# 項目が取得できなかった場合の値
+NAME_NOT_FOUND = "取得できませんでした"
+AGE_UNKNOWN = "不明"
+
+# ページの準備完了を判定する方式
+#   fixed: 従来どおり一定時間（3秒）待機する
+#   ready_state: document.readyStateがcompleteになるまで待機する
+#   sections: 氏名・経歴・スキル・学歴の要素がすべて表示されるまで待機する
+#   network_idle: リソースの読み込みが一定時間止まるまで待機する
+READINESS_POLICIES = ("fixed", "ready_state", "sections", "network_idle")
+
+# 求職者情報の取得方式
+#   script: 注入したスクリプト1回の呼び出しで全項目を取得する
+#   selenium: 項目ごとにfind_elementを呼び出して取得する
+EXTRACTION_METHODS = ("script", "selenium")
+
+# ブラウザの操作方式（各方式の実装はbackends.py）
+#   selenium: ChromeDriver（WebDriver）経由でChromeを操作する
+#   cdp: ChromeDriverを使わず、ChromeのDevToolsプロトコルをWebSocketで直接操作する
+#   fake: ブラウザを起動せず、プロセス内で生成したページを返す（テスト・ベンチマーク用）
+BACKENDS = ("selenium", "cdp", "fake")
+
+# script方式で実行するスクリプト（引数にSELECTORSを受け取る）
+# 経歴・学歴は、Selenium版と同様に1件でも項目が欠けていれば空のリストにする
+EXTRACT_SCRIPT = """
+const sel = arguments[0];
+const text = (root, selector) => {
+    const element = root.querySelector(selector);
+    return element ? element.innerText.trim() : null;
+};
+const items = (selector, fields) => {
+    const entries = [];
+    for (const element of document.querySelectorAll(selector)) {
+        const entry = {};
+        for (const [key, fieldSelector] of Object.entries(fields)) {
+            const value = text(element, fieldSelector);
+            if (value === null) {
+                return [];
+            }
+            entry[key] = value;
+        }
+        entries.push(entry);
+    }
+    return entries;
+};
+return {
+    name: text(document, sel.name),
+    age: text(document, sel.age),
+    career_history: items(sel.career_item, {
+        company: sel.career_company,
+        period: sel.career_period,
+        position: sel.career_position
+    }),
+    skills: Array.from(document.querySelectorAll(sel.skill_item), element => element.innerText.trim()),
+    education: items(sel.education_item, {
+        school: sel.education_school,
+        period: sel.education_period,
+        degree: sel.education_degree
+    })
+};
+"""
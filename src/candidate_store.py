@@ -0,0 +1,315 @@
+import time
+import sqlite3
+import threading
+from datetime import datetime
+from utils import extract_candidate_id
+from change_detection import fingerprint
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS candidates (
+        candidate_id TEXT PRIMARY KEY,
+        url TEXT NOT NULL,
+        name TEXT,
+        age TEXT,
+        scraped_at TEXT,
+        error TEXT,
+        updated_at TEXT NOT NULL,
+        fingerprint TEXT,
+        checked_at REAL
+    );
+    CREATE TABLE IF NOT EXISTS career_entries (
+        candidate_id TEXT NOT NULL REFERENCES candidates (candidate_id) ON DELETE CASCADE,
+        position_index INTEGER NOT NULL,
+        company TEXT,
+        period TEXT,
+        position TEXT,
+        PRIMARY KEY (candidate_id, position_index)
+    );
+    CREATE TABLE IF NOT EXISTS education_entries (
+        candidate_id TEXT NOT NULL REFERENCES candidates (candidate_id) ON DELETE CASCADE,
+        position_index INTEGER NOT NULL,
+        school TEXT,
+        period TEXT,
+        degree TEXT,
+        PRIMARY KEY (candidate_id, position_index)
+    );
+    CREATE TABLE IF NOT EXISTS skills (
+        candidate_id TEXT NOT NULL REFERENCES candidates (candidate_id) ON DELETE CASCADE,
+        skill TEXT NOT NULL,
+        PRIMARY KEY (candidate_id, skill)
+    );
+    CREATE INDEX IF NOT EXISTS idx_career_entries_company ON career_entries (company);
+    CREATE INDEX IF NOT EXISTS idx_skills_skill ON skills (skill);
+"""
+
+# 以前のバージョンで作成したデータベースに追加する列
+MIGRATIONS = {
+    "fingerprint": "ALTER TABLE candidates ADD COLUMN fingerprint TEXT",
+    "checked_at": "ALTER TABLE candidates ADD COLUMN checked_at REAL"
+}
+
+
+class CandidateStore:
+    """求職者情報を正規化したテーブルに保存し、求職者IDごとに更新するSQLiteストア"""
+
+    def __init__(self, path, batch_size=500, commit_interval=5.0):
+        """
+        求職者ストアの初期化
+
+        Args:
+            path (str): SQLiteデータベースファイルのパス
+            batch_size (int): この件数がたまるごとに1つのトランザクションで書き込む
+            commit_interval (float): 前回の書き込みからこの秒数が経過していれば書き込む
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.commit_interval = commit_interval
+        self.count = 0
+        self._pending = []
+        self._last_commit = time.monotonic()
+
+        # 複数のワーカーから使えるよう、1つの接続をロックで保護して共有する
+        # （WALモードのため、別のプロセスからの読み込みは書き込み中もブロックされない）
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(candidates)")}
+        for column, statement in MIGRATIONS.items():
+            if column not in columns:
+                self._conn.execute(statement)
+        self._conn.commit()
+
+        # iter_staleで、最近確認済みのため除外したURLの数
+        self.skipped_fresh = 0
+
+    def write(self, candidate):
+        """
+        求職者情報を1件追加する（一定件数・一定時間ごとにまとめて書き込む）
+
+        Args:
+            candidate (dict): 求職者情報
+        """
+        with self._lock:
+            self._pending.append(candidate)
+            self.count += 1
+            flush = (len(self._pending) >= self.batch_size or
+                     time.monotonic() - self._last_commit >= self.commit_interval)
+
+        if flush:
+            self.flush()
+
+    def flush(self):
+        """たまっている求職者情報を1つのトランザクションで書き込む"""
+        with self._lock:
+            if self._pending:
+                with self._conn:
+                    for candidate in self._pending:
+                        self._upsert(candidate)
+                self._pending = []
+            self._last_commit = time.monotonic()
+
+    def _upsert(self, candidate):
+        """求職者情報を1件、求職者IDをキーに追加または更新する"""
+        url = candidate.get("url", "")
+        candidate_id = extract_candidate_id(url)
+        updated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        checked_at = time.time()
+
+        if "error" in candidate:
+            # 取得に失敗した場合は、前回取得できた情報を残してエラーだけを記録する
+            self._conn.execute(
+                "INSERT INTO candidates (candidate_id, url, scraped_at, error, updated_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (candidate_id) DO UPDATE SET error = excluded.error, updated_at = excluded.updated_at",
+                (candidate_id, url, candidate.get("scraped_at"), candidate["error"], updated_at)
+            )
+            return
+
+        candidate_fingerprint = fingerprint(candidate)
+        row = self._conn.execute(
+            "SELECT fingerprint FROM candidates WHERE candidate_id = ?", (candidate_id,)
+        ).fetchone()
+
+        if row is not None and row[0] == candidate_fingerprint:
+            # 内容が変わっていなければ、確認日時だけを更新する
+            self._conn.execute(
+                "UPDATE candidates SET scraped_at = ?, error = NULL, checked_at = ? WHERE candidate_id = ?",
+                (candidate.get("scraped_at"), checked_at, candidate_id)
+            )
+            return
+
+        self._conn.execute(
+            "INSERT INTO candidates (candidate_id, url, name, age, scraped_at, error, updated_at, fingerprint, checked_at) "
+            "VALUES (?, ?, ?, ?, ?, NULL, ?, ?, ?) "
+            "ON CONFLICT (candidate_id) DO UPDATE SET url = excluded.url, name = excluded.name, age = excluded.age, "
+            "scraped_at = excluded.scraped_at, error = NULL, updated_at = excluded.updated_at, "
+            "fingerprint = excluded.fingerprint, checked_at = excluded.checked_at",
+            (candidate_id, url, candidate.get("name"), candidate.get("age"), candidate.get("scraped_at"), updated_at,
+             candidate_fingerprint, checked_at)
+        )
+
+        # 経歴・学歴・スキルは入れ替える
+        for table in ("career_entries", "education_entries", "skills"):
+            self._conn.execute(f"DELETE FROM {table} WHERE candidate_id = ?", (candidate_id,))
+
+        self._conn.executemany(
+            "INSERT INTO career_entries (candidate_id, position_index, company, period, position) VALUES (?, ?, ?, ?, ?)",
+            [(candidate_id, i, career.get("company"), career.get("period"), career.get("position"))
+             for i, career in enumerate(candidate.get("career_history", []))]
+        )
+        self._conn.executemany(
+            "INSERT INTO education_entries (candidate_id, position_index, school, period, degree) VALUES (?, ?, ?, ?, ?)",
+            [(candidate_id, i, education.get("school"), education.get("period"), education.get("degree"))
+             for i, education in enumerate(candidate.get("education", []))]
+        )
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO skills (candidate_id, skill) VALUES (?, ?)",
+            [(candidate_id, skill) for skill in candidate.get("skills", [])]
+        )
+
+    def get(self, url):
+        """
+        求職者情報を取得する
+
+        Args:
+            url (str): 求職者ページのURLまたは求職者ID
+
+        Returns:
+            dict: scrape_candidate_pageと同じ形式の求職者情報。保存されていなければNone
+        """
+        self.flush()
+        candidate_id = extract_candidate_id(url)
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, name, age, scraped_at, error FROM candidates WHERE candidate_id = ?", (candidate_id,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            candidate = {"name": row[1], "age": row[2], "url": row[0], "scraped_at": row[3]}
+            if row[4] is not None:
+                candidate["error"] = row[4]
+
+            candidate["career_history"] = [
+                {"company": company, "period": period, "position": position}
+                for company, period, position in self._conn.execute(
+                    "SELECT company, period, position FROM career_entries WHERE candidate_id = ? ORDER BY position_index",
+                    (candidate_id,)
+                )
+            ]
+            candidate["skills"] = [
+                skill for skill, in self._conn.execute(
+                    "SELECT skill FROM skills WHERE candidate_id = ? ORDER BY rowid", (candidate_id,)
+                )
+            ]
+            candidate["education"] = [
+                {"school": school, "period": period, "degree": degree}
+                for school, period, degree in self._conn.execute(
+                    "SELECT school, period, degree FROM education_entries WHERE candidate_id = ? ORDER BY position_index",
+                    (candidate_id,)
+                )
+            ]
+
+        return candidate
+
+    def get_fingerprint(self, url):
+        """
+        保存している求職者情報のフィンガープリントを返す（まとめて書き込む前の情報は含まない）
+
+        Args:
+            url (str): 求職者ページのURLまたは求職者ID
+
+        Returns:
+            str: フィンガープリント。保存されていない、または取得できたことがなければNone
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fingerprint FROM candidates WHERE candidate_id = ?", (extract_candidate_id(url),)
+            ).fetchone()
+        return row[0] if row else None
+
+    def iter_stale(self, url_list, max_age_seconds):
+        """
+        最後に取得できてから指定した時間が経過した（または未取得の）URLだけを返すジェネレーター
+
+        Args:
+            url_list (iterable): 求職者ページのURL
+            max_age_seconds (float): 再取得しない最大の経過時間（秒）
+
+        Yields:
+            str: 再取得が必要なURL
+        """
+        self.skipped_fresh = 0
+        cutoff = time.time() - max_age_seconds
+
+        for url in url_list:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT checked_at FROM candidates WHERE candidate_id = ?", (extract_candidate_id(url),)
+                ).fetchone()
+
+            if row is not None and row[0] is not None and row[0] >= cutoff:
+                self.skipped_fresh += 1
+                continue
+            yield url
+
+    def find_by_company(self, company):
+        """
+        指定した会社の経歴を持つ求職者のIDを返す
+
+        Args:
+            company (str): 会社名（完全一致）
+
+        Returns:
+            list: 求職者IDのリスト
+        """
+        self.flush()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT candidate_id FROM career_entries WHERE company = ? ORDER BY candidate_id", (company,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def find_by_skill(self, skill):
+        """
+        指定したスキルを持つ求職者のIDを返す
+
+        Args:
+            skill (str): スキル名（完全一致）
+
+        Returns:
+            list: 求職者IDのリスト
+        """
+        self.flush()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT candidate_id FROM skills WHERE skill = ? ORDER BY candidate_id", (skill,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def total(self):
+        """
+        保存している求職者の数を返す
+
+        Returns:
+            int: 求職者の数
+        """
+        self.flush()
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM candidates").fetchone()[0]
+
+    def close(self):
+        """残りを書き込んでデータベースを閉じる"""
+        if self._conn is not None:
+            self.flush()
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,148 @@
+import json
+import hashlib
+
+# 変更の判定に使う項目（URLや取得日時は含めない）
+FINGERPRINT_FIELDS = ("name", "age", "career_history", "skills", "education")
+
+
+def _normalize_text(value):
+    """空白の違いを無視するため、連続する空白を1つにして前後の空白を除く"""
+    return " ".join(value.split()) if isinstance(value, str) else value
+
+
+def normalize_candidate(candidate):
+    """
+    変更の判定用に求職者情報を正規化する関数
+
+    文字列の空白をそろえ、スキルは重複を除いて並べ替えます（表示順の違いは変更とみなさない）。
+
+    Args:
+        candidate (dict): 求職者情報
+
+    Returns:
+        dict: FINGERPRINT_FIELDSの項目だけを持つ正規化した辞書
+    """
+    def normalize_entries(entries):
+        return [
+            {key: _normalize_text(value) for key, value in sorted(entry.items())}
+            for entry in entries or []
+        ]
+
+    return {
+        "name": _normalize_text(candidate.get("name")),
+        "age": _normalize_text(candidate.get("age")),
+        "career_history": normalize_entries(candidate.get("career_history")),
+        "skills": sorted({_normalize_text(skill) for skill in candidate.get("skills") or []}),
+        "education": normalize_entries(candidate.get("education"))
+    }
+
+
+def fingerprint(candidate):
+    """
+    求職者情報のフィンガープリント（正規化した項目のハッシュ）を返す関数
+
+    Args:
+        candidate (dict): 求職者情報
+
+    Returns:
+        str: SHA-256のハッシュ値
+    """
+    text = json.dumps(normalize_candidate(candidate), ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def diff_candidates(old, new):
+    """
+    2つの求職者情報の項目ごとの差分を返す関数
+
+    Args:
+        old (dict): 前回の求職者情報
+        new (dict): 今回の求職者情報
+
+    Returns:
+        dict: 変更された項目名をキーとする差分。スキルは{"added": [...], "removed": [...]}、
+              それ以外は{"old": 前回の値, "new": 今回の値}
+    """
+    old_normalized = normalize_candidate(old)
+    new_normalized = normalize_candidate(new)
+    changes = {}
+
+    for field in FINGERPRINT_FIELDS:
+        if old_normalized[field] == new_normalized[field]:
+            continue
+
+        if field == "skills":
+            changes[field] = {
+                "added": [skill for skill in new_normalized[field] if skill not in old_normalized[field]],
+                "removed": [skill for skill in old_normalized[field] if skill not in new_normalized[field]]
+            }
+        else:
+            changes[field] = {"old": old.get(field), "new": new.get(field)}
+
+    return changes
+
+
+class ChangeTrackingSink:
+    """保存済みの求職者情報と比較し、新規または変更された求職者情報だけを書き出すシンク"""
+
+    def __init__(self, store, sink, changes_only=True, diff=False):
+        """
+        変更検出シンクの初期化
+
+        Args:
+            store (CandidateStore): 前回までの求職者情報を保存したストア（全件をこのストアに保存します）
+            sink (JsonlSink): 新規または変更された求職者情報の書き出し先
+            changes_only (bool): Trueの場合、変更のない求職者情報はsinkに書き出さない
+            diff (bool): Trueの場合、変更された求職者情報に項目ごとの差分（changes）を付ける
+        """
+        self.store = store
+        self.sink = sink
+        self.changes_only = changes_only
+        self.diff = diff
+        self.counts = {"new": 0, "changed": 0, "unchanged": 0, "error": 0}
+
+    @property
+    def count(self):
+        """sinkに書き出した件数"""
+        return self.sink.count
+
+    def write(self, candidate):
+        """
+        求職者情報をストアに保存し、新規または変更されていればsinkにも書き出す
+
+        取得に失敗した求職者情報は、常にsinkに書き出します。
+
+        Args:
+            candidate (dict): 求職者情報
+        """
+        if "error" in candidate:
+            status = "error"
+        else:
+            previous_fingerprint = self.store.get_fingerprint(candidate["url"])
+            if previous_fingerprint is None:
+                status = "new"
+            elif previous_fingerprint == fingerprint(candidate):
+                status = "unchanged"
+            else:
+                status = "changed"
+
+        if status == "changed" and self.diff:
+            previous = self.store.get(candidate["url"])
+            candidate = dict(candidate, changes=diff_candidates(previous, candidate))
+
+        self.counts[status] += 1
+        self.store.write(candidate)
+
+        if status != "unchanged" or not self.changes_only:
+            self.sink.write(candidate)
+
+    def close(self):
+        """ストアとsinkを閉じる"""
+        self.sink.close()
+        self.store.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,107 @@
+import os
+import json
+from datetime import datetime
+
+
+class CheckpointJournal:
+    """処理済みのURLとその結果を記録し、中断した実行を再開できるようにするクラス"""
+
+    def __init__(self, filename, resume=False):
+        """
+        チェックポイントジャーナルの初期化
+
+        Args:
+            filename (str): ジャーナルファイルのパス
+            resume (bool): Trueなら既存の記録を読み込んで追記、Falseなら新しく記録を始める
+        """
+        self.filename = filename
+        self.stream_filename = None
+        self.done = {}
+
+        if resume and os.path.exists(filename):
+            self._load()
+            self._file = open(filename, "a", encoding="utf-8")
+        else:
+            self._file = open(filename, "w", encoding="utf-8")
+
+    def _load(self):
+        """既存のジャーナルを読み込む（書き込み途中の不完全な行は読み飛ばす）"""
+        with open(self.filename, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+
+                if entry.get("type") == "run":
+                    self.stream_filename = entry.get("stream")
+                else:
+                    self.done[entry["url"]] = entry["status"]
+
+    def _append(self, entry):
+        """1行追記する（プロセスが異常終了しても残るよう、すぐにOSへ書き出す）"""
+        self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def start_run(self, stream_filename):
+        """
+        実行の開始を記録する（再開時に同じ出力ファイルへ追記するため）
+
+        Args:
+            stream_filename (str): 取得した情報を書き出すJSONLファイルのパス
+        """
+        self.stream_filename = stream_filename
+        self._append({
+            "type": "run",
+            "stream": stream_filename,
+            "started_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        })
+
+    def record(self, url, candidate):
+        """
+        URLの処理結果を記録する
+
+        Args:
+            url (str): 処理したURL
+            candidate (dict): scrape_candidate_pageの結果
+        """
+        status = "error" if "error" in candidate else "ok"
+        entry = {"url": url, "status": status, "at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+        if status == "error":
+            entry["error"] = candidate["error"]
+
+        self._append(entry)
+        self.done[url] = status
+
+    def is_done(self, url):
+        """
+        URLが正常に処理済みかを返す（エラーになったURLは再開時にもう一度処理する）
+
+        Args:
+            url (str): 確認するURL
+
+        Returns:
+            bool: 処理済みならTrue
+        """
+        return self.done.get(url) == "ok"
+
+    def pending(self, url_list):
+        """
+        未処理のURLだけを1件ずつ返すジェネレーター
+
+        Args:
+            url_list (iterable): 全URL（リストまたはUrlStream）
+
+        Yields:
+            str: 正常に処理済みでないURL
+        """
+        for url in url_list:
+            if not self.is_done(url):
+                yield url
+
+    def close(self):
+        """ディスクへ同期してジャーナルファイルを閉じる"""
+        if not self._file.closed:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
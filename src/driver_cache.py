@@ -0,0 +1,131 @@
+import os
+import re
+import json
+import subprocess
+from backends import find_chrome_binary
+
+
+# キャッシュファイルのパスを指定する環境変数（空文字列の場合はキャッシュを使わない）
+DRIVER_CACHE_ENV = "BIZREACH_DRIVER_CACHE"
+
+# Chromeの--versionの出力からバージョンを取り出すパターン（例: Google Chrome 120.0.6099.109）
+CHROME_VERSION_PATTERN = re.compile(r"(\d+(?:\.\d+){1,3})")
+
+
+def default_cache_filename():
+    """キャッシュファイルの既定のパスを返す（環境変数BIZREACH_DRIVER_CACHE、なければ~/.cache以下）"""
+    if DRIVER_CACHE_ENV in os.environ:
+        return os.environ[DRIVER_CACHE_ENV] or None
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "bizreach_scraper", "chromedriver.json")
+
+
+class DriverPathCache:
+    """インストールされているChromeのバージョンごとに、解決したChromeDriverのパスを保存するキャッシュ"""
+
+    def __init__(self, filename=None, chrome_path=None):
+        """
+        キャッシュの初期化
+
+        Args:
+            filename (str, optional): キャッシュファイルのパス。Noneの場合はdefault_cache_filename()、空文字列の場合はキャッシュを使わない
+            chrome_path (str, optional): Chromeの実行ファイルのパス。Noneの場合は環境変数CHROME_PATHまたはPATHから探す
+        """
+        self.filename = default_cache_filename() if filename is None else filename
+        self.chrome_path = find_chrome_binary(chrome_path)
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self):
+        """キャッシュファイルを読み込む（ない場合・壊れている場合は空のキャッシュ）"""
+        try:
+            with open(self.filename, encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return {"chrome": {}, "drivers": {}}
+        entries.setdefault("chrome", {})
+        entries.setdefault("drivers", {})
+        return entries
+
+    def _save(self, entries):
+        """キャッシュファイルを書き出す（他のプロセスが途中の内容を読まないよう、置き換えで書き込む）"""
+        temp_filename = f"{self.filename}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.filename)), exist_ok=True)
+            with open(temp_filename, "w", encoding="utf-8") as f:
+                json.dump(entries, f, ensure_ascii=False, indent=2)
+            os.replace(temp_filename, self.filename)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"ドライバーのキャッシュの保存に失敗しました: {str(e)}")
+            # 書き込みに失敗した一時ファイルを残さない
+            try:
+                os.remove(temp_filename)
+            except OSError:
+                pass
+
+    def chrome_version(self, entries):
+        """
+        インストールされているChromeのバージョンを返す
+
+        実行ファイルの更新日時が前回と同じであれば、Chromeを起動せずに前回のバージョンを使います。
+
+        Args:
+            entries (dict): 読み込んだキャッシュ（バージョンを調べた場合は記録する）
+
+        Returns:
+            str: Chromeのバージョン（Chromeが見つからない場合はNone）
+        """
+        if not self.chrome_path:
+            return None
+        try:
+            real_path = os.path.realpath(self.chrome_path)
+            mtime = os.path.getmtime(real_path)
+        except OSError:
+            return None
+
+        known = entries["chrome"].get(real_path)
+        if known and known["mtime"] == mtime:
+            return known["version"]
+
+        try:
+            output = subprocess.run([self.chrome_path, "--version"], capture_output=True, text=True,
+                                    timeout=10).stdout
+        except (OSError, subprocess.SubprocessError):
+            return None
+        match = CHROME_VERSION_PATTERN.search(output)
+        if not match:
+            return None
+        entries["chrome"][real_path] = {"mtime": mtime, "version": match.group(1)}
+        return match.group(1)
+
+    def resolve(self, install):
+        """
+        ChromeDriverのパスを返す（同じバージョンのChromeで解決済みであれば、installを呼び出さない）
+
+        Args:
+            install (callable): キャッシュにない場合に呼び出す、ドライバーのパスを返す関数
+                                （ChromeDriverManager().installなど。ネットワークにアクセスする場合がある）
+
+        Returns:
+            str: ChromeDriverのパス
+        """
+        if not self.filename:
+            return install()
+
+        entries = self._load()
+        known_chrome = dict(entries["chrome"])
+        version = self.chrome_version(entries)
+        driver_path = entries["drivers"].get(version) if version else None
+        if isinstance(driver_path, str) and os.path.exists(driver_path):
+            self.hits += 1
+            if entries["chrome"] != known_chrome:
+                self._save(entries)
+            return driver_path
+
+        self.misses += 1
+        driver_path = install()
+        # パスの文字列だけをキャッシュする
+        if version and isinstance(driver_path, str) and os.path.exists(driver_path):
+            entries["drivers"][version] = driver_path
+            self._save(entries)
+        return driver_path
@@ -0,0 +1,84 @@
+import requests
+from selenium.common.exceptions import (
+    TimeoutException, NoSuchElementException, InvalidSessionIdException, NoSuchWindowException, WebDriverException
+)
+
+# エラーの分類
+TRANSIENT = "transient"    # 一時的な通信エラー・タイムアウト
+SESSION = "session"        # ログインセッションの切れ・ブラウザのセッションの消失
+STRUCTURE = "structure"    # ページの構造の変更（要素が見つからない）
+THROTTLED = "throttled"    # アクセス制限（HTTP 429/503）
+UNKNOWN = "unknown"        # その他
+
+ERROR_TYPES = (TRANSIENT, SESSION, STRUCTURE, THROTTLED, UNKNOWN)
+
+
+class ScrapeError(Exception):
+    """スクレイピング中のエラーの基底クラス（error_typeに分類を持つ）"""
+
+    error_type = UNKNOWN
+
+
+class TransientError(ScrapeError):
+    """一時的な通信エラー"""
+
+    error_type = TRANSIENT
+
+
+class SessionExpiredError(ScrapeError):
+    """ログインセッションが切れ、ログインページへリダイレクトされた"""
+
+    error_type = SESSION
+
+
+class PageStructureError(ScrapeError):
+    """ページの構造が変わり、必要な要素が見つからない"""
+
+    error_type = STRUCTURE
+
+
+class ThrottledError(ScrapeError):
+    """アクセスが制限された"""
+
+    error_type = THROTTLED
+
+    def __init__(self, message, retry_after=None):
+        """
+        Args:
+            message (str): エラーメッセージ
+            retry_after (float, optional): サーバーが指定した再試行までの待機時間（秒）
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def classify_error(error):
+    """
+    例外をエラーの分類に振り分ける関数
+
+    Args:
+        error (Exception): 発生した例外
+
+    Returns:
+        str: エラーの分類（ERROR_TYPESのいずれか）
+    """
+    if isinstance(error, ScrapeError):
+        return error.error_type
+
+    if isinstance(error, (InvalidSessionIdException, NoSuchWindowException)):
+        return SESSION
+
+    if isinstance(error, NoSuchElementException):
+        return STRUCTURE
+
+    if isinstance(error, (TimeoutException, requests.Timeout, requests.ConnectionError, ConnectionError)):
+        return TRANSIENT
+
+    if isinstance(error, WebDriverException):
+        message = str(error)
+        if "invalid session id" in message or "disconnected" in message:
+            return SESSION
+        if "net::ERR_" in message or "timeout" in message.lower():
+            return TRANSIENT
+
+    return UNKNOWN
@@ -0,0 +1,381 @@
+import os
+import csv
+import json
+import time
+
+
+# どの書き出し形式でも列にする基本情報の項目
+BASE_FIELDS = ("name", "age", "url", "scraped_at")
+
+# 取得結果の状態の項目（エラー、エラーの分類、試行回数、再試行までの待機秒数、前回からの差分）
+# 成功した求職者情報にはないため、CSVでは経歴・スキル・学歴の後ろの列にする
+STATUS_FIELDS = ("error", "error_type", "attempts", "retry_after", "changes")
+
+
+def _status_value(field, value):
+    """状態の項目の値を列の値にする（構造が項目ごとに異なる差分はJSON文字列にする）"""
+    if field == "changes" and value is not None:
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+class JsonlSink:
+    """取得した求職者情報を1件ずつJSON Lines形式でファイルに書き出すクラス"""
+
+    def __init__(self, filename, fsync_every=50, fsync_interval=5.0):
+        """
+        JSONLシンクの初期化（既存のファイルには追記します）
+
+        Args:
+            filename (str): 書き出し先のファイル名
+            fsync_every (int): この件数を書き出すごとにディスクへ同期する
+            fsync_interval (float): 前回の同期からこの秒数が経過していればディスクへ同期する
+        """
+        self.filename = filename
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self.count = 0
+        self._file = open(filename, "a", encoding="utf-8")
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def write(self, candidate):
+        """
+        求職者情報を1行書き出す
+
+        Args:
+            candidate (dict): 求職者情報
+        """
+        self._file.write(json.dumps(candidate, ensure_ascii=False) + "\n")
+        self.count += 1
+        self._unsynced += 1
+
+        if self._unsynced >= self.fsync_every or time.monotonic() - self._last_sync >= self.fsync_interval:
+            self.sync()
+
+    def sync(self):
+        """書き出した内容をディスクへ同期する（クラッシュしても同期済みの行は失われない）"""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def close(self):
+        """同期してファイルを閉じる"""
+        if not self._file.closed:
+            self.sync()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class TeeSink:
+    """求職者情報を複数のシンクに同時に書き出すクラス"""
+
+    def __init__(self, *sinks):
+        """
+        Args:
+            *sinks: 書き出し先のシンク（JsonlSink, CandidateStoreなど）。件数は最初のシンクのものを使用
+        """
+        self.sinks = sinks
+
+    @property
+    def count(self):
+        """書き出した件数"""
+        return self.sinks[0].count
+
+    def write(self, candidate):
+        """
+        全てのシンクに求職者情報を書き出す
+
+        Args:
+            candidate (dict): 求職者情報
+        """
+        for sink in self.sinks:
+            sink.write(candidate)
+
+    def close(self):
+        """全てのシンクを閉じる"""
+        for sink in self.sinks:
+            sink.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def iter_jsonl(filename):
+    """
+    JSON Lines形式のファイルから求職者情報を1件ずつ読み込むジェネレーター
+
+    書き込み途中でクラッシュした場合などの不完全な行は読み飛ばします。
+
+    Args:
+        filename (str): 読み込むファイル名
+
+    Yields:
+        dict: 求職者情報
+    """
+    with open(filename, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+
+def csv_columns(career_depth=3, education_depth=1):
+    """
+    CSVの列名のリストを返す関数（データによらず、経歴と学歴の件数の上限から決まる）
+
+    Args:
+        career_depth (int): 列にする経歴の件数（最新から）
+        education_depth (int): 列にする学歴の件数（最新から）
+
+    Returns:
+        list: 列名のリスト
+    """
+    columns = list(BASE_FIELDS)
+
+    for i in range(1, career_depth + 1):
+        columns += [f"company_{i}", f"period_{i}", f"position_{i}"]
+
+    columns.append("skills")
+
+    # 1件目の学歴は従来どおり番号なしの列名
+    for i in range(1, education_depth + 1):
+        suffix = "" if i == 1 else f"_{i}"
+        columns += [f"school{suffix}", f"edu_period{suffix}", f"degree{suffix}"]
+
+    columns += STATUS_FIELDS
+
+    return columns
+
+
+def flatten_candidate(candidate, career_depth=3, education_depth=1):
+    """
+    求職者情報をCSVの1行用にフラット化する関数
+
+    Args:
+        candidate (dict): 求職者情報
+        career_depth (int): 列にする経歴の件数（最新から）
+        education_depth (int): 列にする学歴の件数（最新から）
+
+    Returns:
+        dict: 列名と値の辞書（経歴・学歴・状態の項目がない列は含まない）
+    """
+    flat_candidate = {field: candidate.get(field, "") for field in BASE_FIELDS}
+
+    # キャリア履歴は最新のcareer_depth件までを列として追加
+    career_history = candidate.get("career_history", [])
+    for i in range(min(career_depth, len(career_history))):
+        flat_candidate[f"company_{i+1}"] = career_history[i].get("company", "")
+        flat_candidate[f"period_{i+1}"] = career_history[i].get("period", "")
+        flat_candidate[f"position_{i+1}"] = career_history[i].get("position", "")
+
+    # スキルはカンマ区切りで1つの列に
+    flat_candidate["skills"] = ", ".join(candidate.get("skills", []))
+
+    # 学歴も最新のeducation_depth件までを追加
+    education = candidate.get("education", [])
+    for i in range(min(education_depth, len(education))):
+        suffix = "" if i == 0 else f"_{i+1}"
+        flat_candidate[f"school{suffix}"] = education[i].get("school", "")
+        flat_candidate[f"edu_period{suffix}"] = education[i].get("period", "")
+        flat_candidate[f"degree{suffix}"] = education[i].get("degree", "")
+
+    for field in STATUS_FIELDS:
+        if field in candidate:
+            flat_candidate[field] = _status_value(field, candidate[field])
+
+    return flat_candidate
+
+
+class CsvSink:
+    """求職者情報をフラット化して1行ずつCSVファイルに書き出すクラス"""
+
+    def __init__(self, filename, career_depth=3, education_depth=1):
+        """
+        CSVシンクの初期化（列は最初に決まるため、全件を読み込まずに書き出せます）
+
+        Args:
+            filename (str): 書き出し先のファイル名（既存のファイルは上書きします）
+            career_depth (int): 列にする経歴の件数（最新から）
+            education_depth (int): 列にする学歴の件数（最新から）
+        """
+        self.filename = filename
+        self.career_depth = career_depth
+        self.education_depth = education_depth
+        self.count = 0
+
+        # Excel対応のためUTF-8 with BOMで保存
+        self._file = open(filename, "w", encoding="utf-8-sig", newline="")
+        self._writer = csv.DictWriter(
+            self._file, csv_columns(career_depth, education_depth), restval="", lineterminator="\n"
+        )
+        self._writer.writeheader()
+
+    def write(self, candidate):
+        """
+        求職者情報を1行書き出す
+
+        Args:
+            candidate (dict): 求職者情報
+        """
+        self._writer.writerow(flatten_candidate(candidate, self.career_depth, self.education_depth))
+        self.count += 1
+
+    def close(self):
+        """ファイルを閉じる"""
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def export_csv(candidates, filename, career_depth=3, education_depth=1):
+    """
+    求職者情報をCSVファイルに保存する関数
+
+    Args:
+        candidates (iterable): 求職者情報（リストまたはiter_jsonl()などのジェネレーター）
+        filename (str): 保存先のファイル名
+        career_depth (int): 列にする経歴の件数（最新から）
+        education_depth (int): 列にする学歴の件数（最新から）
+    """
+    with CsvSink(filename, career_depth, education_depth) as sink:
+        for candidate in candidates:
+            sink.write(candidate)
+
+
+def export_json(candidates, filename):
+    """
+    求職者情報をJSONファイルに保存する関数（全データを保持）
+
+    json.dump(..., indent=2)と同じ形式で、1件ずつ書き出します。
+
+    Args:
+        candidates (iterable): 求職者情報（リストまたはiter_jsonl()などのジェネレーター）
+        filename (str): 保存先のファイル名
+    """
+    count = 0
+    with open(filename, "w", encoding="utf-8") as f:
+        f.write("[")
+        for candidate in candidates:
+            text = json.dumps(candidate, ensure_ascii=False, indent=2)
+            f.write(("," if count else "") + "\n  " + text.replace("\n", "\n  "))
+            count += 1
+        f.write("\n]" if count else "]")
+
+
+def _parquet_schema(pa):
+    """
+    求職者情報のParquetスキーマ（経歴・スキル・学歴はリストと構造体の列のまま保持）
+
+    基本情報と状態の項目はCSVと同じBASE_FIELDS・STATUS_FIELDSから作るため、形式ごとに列がずれません。
+    """
+    types = {"attempts": pa.int64(), "retry_after": pa.float64()}
+    scalar_fields = [(field, types.get(field, pa.string())) for field in BASE_FIELDS + STATUS_FIELDS]
+
+    return pa.schema(scalar_fields + [
+        ("career_history", pa.list_(pa.struct([
+            ("company", pa.string()),
+            ("period", pa.string()),
+            ("position", pa.string())
+        ]))),
+        ("skills", pa.list_(pa.string())),
+        ("education", pa.list_(pa.struct([
+            ("school", pa.string()),
+            ("period", pa.string()),
+            ("degree", pa.string())
+        ])))
+    ])
+
+
+class ParquetSink:
+    """求職者情報を入れ子の構造のまま、行グループ単位でParquetファイルに書き出すクラス"""
+
+    def __init__(self, filename, row_group_size=10000, compression="zstd"):
+        """
+        Parquetシンクの初期化（pyarrowが必要です）
+
+        Args:
+            filename (str): 書き出し先のファイル名（既存のファイルは上書きします）
+            row_group_size (int): この件数がたまるごとに1つの行グループとして書き出す
+            compression (str): 圧縮方式（zstd, snappy, gzipなど）
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self.filename = filename
+        self.row_group_size = row_group_size
+        self.count = 0
+        self._pa = pa
+        self._schema = _parquet_schema(pa)
+        self._writer = pq.ParquetWriter(filename, self._schema, compression=compression)
+        self._rows = []
+
+    def write(self, candidate):
+        """
+        求職者情報を1件追加する（行グループの件数に達したら書き出す）
+
+        Args:
+            candidate (dict): 求職者情報
+        """
+        row = dict(candidate)
+        for field in STATUS_FIELDS:
+            if field in row:
+                row[field] = _status_value(field, row[field])
+
+        self._rows.append(row)
+        self.count += 1
+
+        if len(self._rows) >= self.row_group_size:
+            self.flush()
+
+    def flush(self):
+        """たまっている求職者情報を1つの行グループとして書き出す"""
+        if self._rows:
+            table = self._pa.Table.from_pylist(self._rows, schema=self._schema)
+            self._writer.write_table(table)
+            self._rows = []
+
+    def close(self):
+        """残りを書き出してファイルを閉じる"""
+        if self._writer is not None:
+            self.flush()
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def export_parquet(candidates, filename, row_group_size=10000):
+    """
+    求職者情報をParquetファイルに保存する関数（経歴・スキル・学歴を入れ子の構造のまま保持）
+
+    Args:
+        candidates (iterable): 求職者情報（リストまたはiter_jsonl()などのジェネレーター）
+        filename (str): 保存先のファイル名
+        row_group_size (int): 1つの行グループの件数
+    """
+    with ParquetSink(filename, row_group_size) as sink:
+        for candidate in candidates:
+            sink.write(candidate)
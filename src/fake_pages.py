@@ -0,0 +1,60 @@
+from html import escape
+
+
+# fakeバックエンドが既定で返す求職者ページの内容
+DEFAULT_CANDIDATE = {
+    "name": "テスト 太郎",
+    "age": "35歳",
+    "career_history": [
+        {"company": "株式会社テスト", "period": "2018年4月 - 現在", "position": "シニアエンジニア"},
+        {"company": "サンプル株式会社", "period": "2015年4月 - 2018年3月", "position": "Webエンジニア"}
+    ],
+    "skills": ["Python", "JavaScript", "AWS", "Docker"],
+    "education": [
+        {"school": "サンプル大学", "period": "2010年4月 - 2014年3月", "degree": "工学部 情報工学科"}
+    ]
+}
+
+
+def render_candidate_html(candidate=None):
+    """
+    求職者情報から、求職者ページと同じ構造（candidate_page.SELECTORSで取得できる構造）のHTMLを生成する
+
+    Args:
+        candidate (dict, optional): 求職者情報。Noneの場合はDEFAULT_CANDIDATE
+
+    Returns:
+        str: 求職者ページのHTML
+    """
+    if candidate is None:
+        candidate = DEFAULT_CANDIDATE
+
+    career_html = "".join(
+        '<div class="career-history-item">'
+        f'<div class="company-name">{escape(career["company"])}</div>'
+        f'<div class="period">{escape(career["period"])}</div>'
+        f'<div class="position">{escape(career["position"])}</div>'
+        '</div>'
+        for career in candidate.get("career_history", [])
+    )
+    skill_html = "".join(
+        f'<div class="skill-item">{escape(skill)}</div>' for skill in candidate.get("skills", [])
+    )
+    education_html = "".join(
+        '<div class="education-item">'
+        f'<div class="school-name">{escape(education["school"])}</div>'
+        f'<div class="edu-period">{escape(education["period"])}</div>'
+        f'<div class="degree">{escape(education["degree"])}</div>'
+        '</div>'
+        for education in candidate.get("education", [])
+    )
+
+    return (
+        '<!DOCTYPE html>\n<html lang="ja"><head><meta charset="utf-8"><title>求職者情報</title></head><body>'
+        f'<h1 class="candidate-name">{escape(candidate["name"])}</h1>'
+        f'<span class="candidate-age">{escape(candidate["age"])}</span>'
+        f'<section class="career-history">{career_html}</section>'
+        f'<section class="skills">{skill_html}</section>'
+        f'<section class="education">{education_html}</section>'
+        '</body></html>'
+    )
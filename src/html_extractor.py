@@ -0,0 +1,106 @@
+from lxml import etree
+from lxml import html as lxml_html
+from candidate_page import SELECTORS, AGE_UNKNOWN
+
+
+def css_to_xpath(selector):
+    """
+    「タグ名.クラス名」形式の単純なCSSセレクターを、子孫要素を検索するXPathに変換する関数
+    
+    Args:
+        selector (str): CSSセレクター（例: "div.company-name"）
+        
+    Returns:
+        str: 変換したXPath
+    """
+    tag, *classes = selector.split(".")
+    conditions = "".join(
+        f"[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+        for class_name in classes
+    )
+    return f".//{tag or '*'}{conditions}"
+
+
+# SELECTORSの各セレクターを変換したXPath
+XPATHS = {key: etree.XPath(css_to_xpath(selector)) for key, selector in SELECTORS.items()}
+
+
+def _first_text(root, key):
+    """最初に見つかった要素のテキストを返す（見つからなければNone）"""
+    elements = XPATHS[key](root)
+    return elements[0].text_content().strip() if elements else None
+
+
+def _items(root, item_key, fields):
+    """経歴・学歴の各項目を取得する（Selenium版と同様に1件でも欠けていれば空のリスト）"""
+    entries = []
+    
+    for element in XPATHS[item_key](root):
+        entry = {}
+        for field, key in fields.items():
+            value = _first_text(element, key)
+            if value is None:
+                return []
+            entry[field] = value
+        entries.append(entry)
+    
+    return entries
+
+
+def parse_html(html):
+    """
+    HTMLを解析してlxmlの要素ツリーを返す関数
+    
+    Args:
+        html (str or bytes): ページのHTML
+        
+    Returns:
+        lxml.html.HtmlElement: ルート要素。解析できなければNone
+    """
+    try:
+        return lxml_html.document_fromstring(html)
+    except ValueError:
+        # エンコーディング宣言付きの文字列はバイト列にしてから解析する
+        if isinstance(html, str):
+            return parse_html(html.encode("utf-8"))
+        return None
+    except etree.ParserError:
+        return None
+
+
+def extract_candidate_from_html(html):
+    """
+    求職者ページのHTMLから、scrape_candidate_pageと同じ形式の求職者情報を取得する関数
+    
+    Args:
+        html (str or bytes): 求職者ページのHTML
+        
+    Returns:
+        dict: 取得した求職者情報（urlとscraped_atは含まない）。
+              氏名がHTMLに含まれない場合（JavaScriptで描画されるページなど）はNone
+    """
+    root = parse_html(html)
+    if root is None:
+        return None
+    
+    name = _first_text(root, "name")
+    if not name:
+        return None
+    
+    age = _first_text(root, "age")
+    
+    return {
+        "name": name,
+        "age": age if age is not None else AGE_UNKNOWN,
+        "career_history": _items(root, "career_item", {
+            "company": "career_company",
+            "period": "career_period",
+            "position": "career_position"
+        }),
+        "skills": [element.text_content().strip() for element in XPATHS["skill_item"](root)],
+        "education": _items(root, "education_item", {
+            "school": "education_school",
+            "period": "education_period",
+            "degree": "education_degree"
+        })
+    }
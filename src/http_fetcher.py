@@ -0,0 +1,128 @@
+import requests
+from requests.adapters import HTTPAdapter
+from datetime import datetime
+from html_extractor import extract_candidate_from_html
+from errors import ThrottledError
+
+# アクセス制限を表すHTTPステータスコード
+THROTTLED_STATUS_CODES = (429, 503)
+
+
+class HttpFetcher:
+    """ブラウザでログインしたセッションを引き継ぎ、ブラウザを使わずに求職者ページを取得するクラス"""
+
+    def __init__(self, cookies=None, user_agent=None, pool_size=10, timeout=15, snapshot_store=None):
+        """
+        HTTPフェッチャーの初期化
+        
+        Args:
+            cookies (list, optional): Seleniumのget_cookies()形式のCookieのリスト
+            user_agent (str, optional): リクエストに付けるUser-Agent（ブラウザと同じものを推奨）
+            pool_size (int): 接続プールのサイズ
+            timeout (float): 1リクエストのタイムアウト（秒）
+            snapshot_store (SnapshotStore, optional): 指定した場合、取得したHTMLを保存する
+        """
+        self.timeout = timeout
+        self.snapshot_store = snapshot_store
+        self.session = requests.Session()
+        
+        # 同じホストへの接続を使い回す
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
+        if user_agent:
+            self.session.headers["User-Agent"] = user_agent
+        self.session.headers["Accept-Language"] = "ja,en;q=0.8"
+        
+        for cookie in cookies or []:
+            self.session.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain", ""),
+                path=cookie.get("path", "/")
+            )
+    
+    @classmethod
+    def from_driver(cls, driver, pool_size=10, timeout=15, snapshot_store=None):
+        """
+        ログイン済みのWebDriverからCookieとUser-Agentを引き継いでフェッチャーを生成する
+        
+        Args:
+            driver (WebDriver): ログイン済みのWebDriver
+            pool_size (int): 接続プールのサイズ
+            timeout (float): 1リクエストのタイムアウト（秒）
+            snapshot_store (SnapshotStore, optional): 指定した場合、取得したHTMLを保存する
+            
+        Returns:
+            HttpFetcher: 生成したフェッチャー
+        """
+        user_agent = driver.execute_script("return navigator.userAgent")
+        return cls(driver.get_cookies(), user_agent, pool_size, timeout, snapshot_store)
+    
+    def fetch(self, url):
+        """
+        ページのHTMLを取得する
+        
+        Args:
+            url (str): 取得するページのURL
+            
+        Returns:
+            str: ページのHTML。取得できなかった場合（ログインページへのリダイレクトを含む）はNone
+            
+        Raises:
+            ThrottledError: アクセスが制限された場合（HTTP 429/503、CAPTCHAページへのリダイレクト）
+        """
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+        except requests.RequestException:
+            return None
+        
+        if response.status_code in THROTTLED_STATUS_CODES:
+            retry_after = response.headers.get("Retry-After", "")
+            raise ThrottledError(
+                f"アクセスが制限されました（HTTP {response.status_code}）",
+                float(retry_after) if retry_after.isdigit() else None
+            )
+        
+        if "captcha" in response.url:
+            raise ThrottledError("CAPTCHAページが表示されました")
+        
+        if response.status_code != 200 or "login" in response.url:
+            return None
+        
+        # 文字コードの指定がない場合、requestsはISO-8859-1とみなすためUTF-8として扱う
+        if "charset" not in response.headers.get("Content-Type", "").lower():
+            response.encoding = "utf-8"
+        
+        return response.text
+    
+    def scrape_candidate_page(self, url):
+        """
+        求職者ページをHTTPで取得して情報を取り出す
+        
+        Args:
+            url (str): 求職者ページのURL
+            
+        Returns:
+            dict: 取得した求職者情報。HTTPで取得できない、またはJavaScriptが必要なページの場合はNone
+        """
+        html = self.fetch(url)
+        if html is None:
+            return None
+        
+        candidate_info = extract_candidate_from_html(html)
+        if candidate_info is None:
+            return None
+        
+        if self.snapshot_store:
+            self.snapshot_store.save(url, html)
+        
+        candidate_info["url"] = url
+        candidate_info["scraped_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        
+        return candidate_info
+    
+    def close(self):
+        """接続プールを閉じる"""
+        self.session.close()
@@ -3,14 +3,36 @@
 
 import os
 import sys
+import time
 import argparse
-from bizreach_scraper import BizreachScraper
-from utils import load_url_list, create_output_filename, ensure_directory_exists
+from candidate_page import READINESS_POLICIES, EXTRACTION_METHODS, BACKENDS
+from metrics import Metrics, PageTimings
+from exporters import JsonlSink, TeeSink, iter_jsonl, export_csv, export_json, export_parquet
+from checkpoint import CheckpointJournal
+from snapshot_store import SnapshotStore
+from candidate_store import CandidateStore
+from change_detection import ChangeTrackingSink
+from utils import UrlStream, create_output_filename, ensure_directory_exists
 
+# selenium・webdriver_manager・requestsなど読み込みに時間のかかるモジュールは、使う関数の中で読み込む
+# （--helpや引数の誤り、ブラウザを使わない処理で待たせないため）
 
-def parse_arguments():
-    """コマンドライン引数を解析する関数"""
-    parser = argparse.ArgumentParser(description='ビズリーチ求職者情報スクレイピングツール')
+
+def parse_arguments(argv=None, worker=False):
+    """
+    コマンドライン引数を解析する関数
+    
+    Args:
+        argv (list, optional): 解析する引数（Noneの場合はsys.argv）
+        worker (bool): workerサブコマンドの場合True（URLリストの代わりに作業キューから取得する）
+    """
+    if worker:
+        parser = argparse.ArgumentParser(
+            prog='main.py worker',
+            description='作業キューからURLを借りて、キューが空になるまでスクレイピングする'
+        )
+    else:
+        parser = argparse.ArgumentParser(description='ビズリーチ求職者情報スクレイピングツール')
     
     parser.add_argument('-u', '--username', required=True,
                         help='ビズリーチのログインユーザー名/メールアドレス')
@@ -21,55 +43,701 @@ def parse_arguments():
     parser.add_argument('-d', '--driver', default=None,
                         help='Chromeドライバーのパス（省略可）')
     
-    parser.add_argument('-i', '--input', required=True,
-                        help='スクレイピング対象URLのリストファイル（.txt, .csv, .json）')
+    if worker:
+        add_queue_arguments(parser)
+    else:
+        parser.add_argument('-i', '--input', required=True,
+                            help='スクレイピング対象URLのリストファイル（.txt, .csv, .jsonl, .json。.gz圧縮も可）')
+        
+        parser.add_argument('--bloom-capacity', type=int, default=None,
+                            help='URLの重複判定にこの件数を想定したブルームフィルターを使う（数百万件以上の入力向け。'
+                                 '省略時はセットで正確に判定）')
     
     parser.add_argument('-o', '--output-dir', default='./data',
                         help='出力ディレクトリのパス（デフォルト: ./data）')
     
-    parser.add_argument('-f', '--format', choices=['csv', 'json', 'both'], default='both',
-                        help='出力形式（csv, json, both）（デフォルト: both）')
+    parser.add_argument('-f', '--format', choices=['csv', 'json', 'both', 'jsonl', 'parquet'], default='both',
+                        help='出力形式（csv, json, both, jsonl, parquet）（デフォルト: both）。'
+                             'JSONL形式のファイルは取得しながら常に書き出されます')
+    
+    parser.add_argument('--csv-career-depth', type=int, default=3,
+                        help='CSVの列にする経歴の件数（デフォルト: 3）')
+    
+    parser.add_argument('--csv-education-depth', type=int, default=1,
+                        help='CSVの列にする学歴の件数（デフォルト: 1）')
+    
+    parser.add_argument('--db', default=None,
+                        help='取得した求職者情報を求職者IDごとに更新して保存するSQLiteデータベースのパス（省略可）')
+    
+    parser.add_argument('--changes-only', action='store_true',
+                        help='--dbの前回の情報と比べて、新規または変更された求職者情報だけを出力する')
+    
+    parser.add_argument('--diff', action='store_true',
+                        help='変更された求職者情報に、項目ごとの差分（changes）を付けて出力する')
+    
+    parser.add_argument('--stale-hours', type=float, default=None,
+                        help='--dbで最後に取得できてからこの時間が経過した求職者だけを取得する（時間）')
     
     parser.add_argument('-w', '--wait', type=int, default=3,
                         help='リクエスト間の待機時間（秒）（デフォルト: 3）')
     
-    return parser.parse_args()
+    parser.add_argument('--adaptive-wait', action='store_true',
+                        help='リクエスト間隔を--waitから始め、ページの応答が正常なら少しずつ短く、'
+                             '遅いページやアクセス制限・ログインページへのリダイレクトがあれば大きく長くする')
+    
+    parser.add_argument('--min-wait', type=float, default=1,
+                        help='--adaptive-waitで短くするリクエスト間隔の下限（秒）（デフォルト: 1）')
+    
+    parser.add_argument('--max-wait', type=float, default=60,
+                        help='--adaptive-waitで長くするリクエスト間隔の上限（秒）（デフォルト: 60）')
+    
+    parser.add_argument('-n', '--workers', type=int, default=1,
+                        help='並列に動かすブラウザセッション数（デフォルト: 1）。'
+                             '2以上の場合、--waitは全セッション合計でのリクエスト間隔になります')
+    
+    parser.add_argument('--ready', choices=READINESS_POLICIES, default='ready_state',
+                        help='ページの読み込み完了の判定方式（デフォルト: ready_state）')
+    
+    parser.add_argument('--page-timeout', type=float, default=10,
+                        help='ページの読み込み完了を待つ最大時間（秒）（デフォルト: 10）')
+    
+    parser.add_argument('--field-timeout', type=float, default=5,
+                        help='各項目の要素の表示を待つ最大時間（秒）（デフォルト: 5）')
+    
+    parser.add_argument('--extraction', choices=EXTRACTION_METHODS, default='script',
+                        help='求職者情報の取得方式（デフォルト: script）')
+    
+    parser.add_argument('--backend', choices=BACKENDS, default='selenium',
+                        help='ブラウザの操作方式（デフォルト: selenium）。cdpはChromeDriverを使わずDevToolsで直接操作し、'
+                             'fakeはブラウザを起動せずテスト用のページを返します')
+    
+    parser.add_argument('--recycle-pages', type=int, default=1000,
+                        help='ブラウザでこのページ数を読み込むごとにブラウザを再起動する（デフォルト: 1000、0で無効）')
+    
+    parser.add_argument('--max-browser-memory-mb', type=float, default=None,
+                        help='ページのJavaScriptヒープがこのサイズ（MB）を超えたらブラウザを再起動する（省略可）')
+    
+    parser.add_argument('--no-retry', action='store_true',
+                        help='取得に失敗したページを再試行しない')
+    
+    parser.add_argument('--circuit-cooldown', type=float, default=60,
+                        help='失敗が急増したときに実行を停止する時間（秒）（デフォルト: 60）')
+    
+    parser.add_argument('--profile', action='store_true',
+                        help='ページの移動・待機・項目ごとの取得・書き出しなど、処理段階ごとの時間の内訳を最後に表示する')
+    
+    parser.add_argument('--metrics-json', default=None,
+                        help='処理段階ごとの時間とページ数・エラー数の集計をJSONファイルに保存する（省略可）')
+    
+    parser.add_argument('--metrics-prom', default=None,
+                        help='集計をPrometheusのテキスト形式でファイルに保存する（省略可）')
+    
+    parser.add_argument('--lean', action='store_true',
+                        help='ヘッドレスで起動し、画像・フォント・解析タグなどを読み込まない軽量モードで実行する')
+    
+    parser.add_argument('--http', action='store_true',
+                        help='ログイン後、求職者ページをまずブラウザを使わずHTTPで取得する'
+                             '（取得できないページはブラウザで取得）')
+    
+    parser.add_argument('--engine', choices=['browser', 'async'], default='browser',
+                        help='スクレイピングの実行方式（デフォルト: browser）。'
+                             'asyncはHTTPでの取得を非同期に並行実行します')
+    
+    parser.add_argument('--concurrency', type=int, default=4,
+                        help='asyncエンジンで同時に実行する取得数（デフォルト: 4）')
+    
+    parser.add_argument('--rate', type=float, default=None,
+                        help='asyncエンジンの1秒あたりの最大リクエスト数（デフォルト: 1/--wait）')
+    
+    parser.add_argument('--session-file', default=None,
+                        help='ログイン済みのセッションを暗号化して保存するファイルのパス（省略可）。'
+                             '有効なセッションがあればログインを省略します')
+    
+    parser.add_argument('--session-max-age', type=float, default=12,
+                        help='保存したセッションを再利用する最大時間（時間）（デフォルト: 12）')
+    
+    if not worker:
+        # workerでは、処理済みのURLは作業キューに記録する
+        parser.add_argument('--checkpoint', default=None,
+                            help='処理済みURLを記録するファイルのパス（デフォルト: 出力ディレクトリ/bizreach_checkpoint.jsonl）')
+        
+        parser.add_argument('--resume', action='store_true',
+                            help='前回中断した実行を再開する（処理済みのURLを飛ばし、同じJSONLファイルに追記）')
+    
+    parser.add_argument('--snapshot-dir', default=None,
+                        help='取得したページのHTMLを圧縮して保存するディレクトリ（省略可）')
+    
+    parser.add_argument('--snapshot-reuse-hours', type=float, default=None,
+                        help='この時間以内に保存したHTMLがあれば、ページにアクセスせずに再利用する（時間）')
+    
+    parser.add_argument('--snapshot-max-mb', type=float, default=None,
+                        help='保存するHTMLの合計サイズの上限（MB）。超えた分は古い順に削除')
+    
+    parser.add_argument('--snapshot-max-age-days', type=float, default=None,
+                        help='保存したHTMLを残す最大日数。超えたものは削除')
+    
+    args = parser.parse_args(argv)
+    args.worker = worker
+    
+    if args.engine == 'async' and args.workers > 1:
+        parser.error('--engine async と --workers は同時に指定できません')
+    if args.engine == 'async' and args.adaptive_wait:
+        parser.error('--engine async と --adaptive-wait は同時に指定できません（--rateを指定してください）')
+    if args.min_wait <= 0 or args.min_wait > args.max_wait:
+        parser.error('--min-wait は0より大きく、--max-wait 以下である必要があります')
+    
+    if (args.changes_only or args.diff or args.stale_hours) and not args.db:
+        parser.error('--changes-only, --diff, --stale-hours には --db の指定が必要です')
+    if worker and args.stale_hours:
+        parser.error('workerでは --stale-hours は指定できません（main.py enqueue で除外してください）')
+    
+    return args
 
 
-def main():
-    """メイン関数"""
-    # 引数の解析
-    args = parse_arguments()
+def add_queue_arguments(parser):
+    """workerサブコマンドの作業キューの引数を追加する関数"""
+    parser.add_argument('--queue', required=True,
+                        help='作業キューのSQLiteファイルのパス（main.py enqueueで作成）')
     
-    # 出力ディレクトリの作成
-    ensure_directory_exists(args.output_dir)
+    parser.add_argument('--batch-size', type=int, default=20,
+                        help='作業キューから1回に借りるURLの件数（デフォルト: 20）')
+    
+    parser.add_argument('--lease-seconds', type=float, default=300,
+                        help='借りたURLの期限（秒）。期限の1/3ごとに延長し、ワーカーが停止すると期限切れで他のワーカーに渡る'
+                             '（デフォルト: 300）')
+    
+    parser.add_argument('--max-attempts', type=int, default=3,
+                        help='1つのURLを試行する最大回数。失敗したURLは上限まで作業キューに戻す（デフォルト: 3）')
+    
+    parser.add_argument('--worker-id', default=None,
+                        help='作業キューに記録するワーカーの識別子（デフォルト: ホスト名:プロセスID）')
+
+
+def parse_enqueue_arguments(argv):
+    """enqueueサブコマンドのコマンドライン引数を解析する関数"""
+    parser = argparse.ArgumentParser(
+        prog='main.py enqueue',
+        description='URLリストを作業キューに追加する（main.py workerで複数のマシン・プロセスから取得する）'
+    )
+    
+    parser.add_argument('--queue', required=True,
+                        help='作業キューのSQLiteファイルのパス（なければ作成）')
+    
+    parser.add_argument('-i', '--input', required=True,
+                        help='追加するURLのリストファイル（.txt, .csv, .jsonl, .json。.gz圧縮も可）')
+    
+    parser.add_argument('--priority', type=int, default=0,
+                        help='追加するURLの優先度。大きいほど先に取得される（デフォルト: 0）')
+    
+    parser.add_argument('--bloom-capacity', type=int, default=None,
+                        help='URLの重複判定にこの件数を想定したブルームフィルターを使う（省略時はセットで正確に判定）')
+    
+    parser.add_argument('--db', default=None,
+                        help='求職者情報のSQLiteデータベースのパス（--stale-hoursで使用）')
+    
+    parser.add_argument('--stale-hours', type=float, default=None,
+                        help='データベースでこの時間以内に取得できた求職者は追加しない（時間）。--dbの指定が必要')
+    
+    args = parser.parse_args(argv)
+    if args.stale_hours and not args.db:
+        parser.error('--stale-hours には --db の指定が必要です')
+    return args
+
+
+def run_enqueue(args):
+    """
+    URLリストを作業キューに追加する関数
+    
+    Args:
+        args (argparse.Namespace): enqueueサブコマンドのコマンドライン引数
+    """
+    from work_queue import create_work_queue
     
-    # URLリストの読み込み
     try:
-        url_list = load_url_list(args.input)
-        print(f"URLリストを読み込みました: {len(url_list)}件")
+        url_stream = UrlStream(args.input, args.bloom_capacity)
     except Exception as e:
         print(f"URLリストの読み込みに失敗しました: {str(e)}")
         sys.exit(1)
     
-    # スクレイパーの初期化
-    scraper = BizreachScraper(args.driver)
+    work_queue = create_work_queue(args.queue)
+    candidate_store = CandidateStore(args.db) if args.db else None
+    try:
+        urls = candidate_store.iter_stale(url_stream, args.stale_hours * 3600) if args.stale_hours else url_stream
+        added = work_queue.enqueue(urls, args.priority)
+        print(f"作業キューに追加しました: {added}件（優先度 {args.priority}）")
+        print(f"URLリスト: 有効 {url_stream.count}件 / 無効 {url_stream.invalid}件 / 重複 {url_stream.duplicates}件")
+        if candidate_store and args.stale_hours:
+            print(f"最近取得済みのため省略: {candidate_store.skipped_fresh}件")
+        print_queue_counts(work_queue)
+    finally:
+        if candidate_store:
+            candidate_store.close()
+        work_queue.close()
+
+
+def print_queue_counts(work_queue):
+    """作業キューの状態ごとの件数を表示する関数"""
+    counts = work_queue.counts()
+    print(f"作業キュー: 取得待ち {counts['pending']}件 / 取得中 {counts['leased']}件 / "
+          f"完了 {counts['done']}件（うちエラー {counts['error']}件）")
+
+
+def parse_reparse_arguments(argv):
+    """reparseサブコマンドのコマンドライン引数を解析する関数"""
+    parser = argparse.ArgumentParser(
+        prog='main.py reparse',
+        description='保存したHTMLから、ブラウザを使わずに求職者情報を取得し直す'
+    )
+    
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--html-dir',
+                        help='求職者ページのHTMLを保存したディレクトリ（ファイル名は求職者ID、.html/.htm/.html.gz）')
+    source.add_argument('--snapshot-dir',
+                        help='--snapshot-dirで保存したスナップショットのディレクトリ（求職者ごとの最新のHTMLを使用）')
+    
+    parser.add_argument('-o', '--output-dir', default='./data',
+                        help='出力ディレクトリのパス（デフォルト: ./data）')
+    
+    parser.add_argument('-f', '--format', choices=['csv', 'json', 'both', 'jsonl', 'parquet'], default='both',
+                        help='出力形式（csv, json, both, jsonl, parquet）（デフォルト: both）')
+    
+    parser.add_argument('--csv-career-depth', type=int, default=3,
+                        help='CSVの列にする経歴の件数（デフォルト: 3）')
+    
+    parser.add_argument('--csv-education-depth', type=int, default=1,
+                        help='CSVの列にする学歴の件数（デフォルト: 1）')
+    
+    parser.add_argument('--db', default=None,
+                        help='取得した求職者情報を求職者IDごとに更新して保存するSQLiteデータベースのパス（省略可）')
+    
+    parser.add_argument('--processes', type=int, default=None,
+                        help='並列に実行するプロセス数（デフォルト: CPUのコア数）')
+    
+    return parser.parse_args(argv)
+
+
+def run_reparse(args):
+    """
+    保存したHTMLから求職者情報を取得し直し、通常と同じ形式のファイルに保存する関数
+    
+    Args:
+        args (argparse.Namespace): reparseサブコマンドのコマンドライン引数
+    """
+    from reparse import iter_html_dir, iter_snapshots, reparse
+    
+    ensure_directory_exists(args.output_dir)
+    
+    if args.html_dir and not os.path.isdir(args.html_dir):
+        print(f"HTMLのディレクトリが見つかりません: {args.html_dir}")
+        sys.exit(1)
+    
+    snapshot_store = SnapshotStore(args.snapshot_dir) if args.snapshot_dir else None
+    tasks = iter_snapshots(snapshot_store) if snapshot_store else iter_html_dir(args.html_dir)
+    
+    stream_filename = os.path.join(
+        args.output_dir,
+        create_output_filename('bizreach_candidates', '.jsonl')
+    )
     
     try:
-        # ブラウザの起動
-        scraper.start_browser()
-        print("ブラウザを起動しました")
+        print(f"保存したHTMLから求職者情報を取得し直しています: {stream_filename}")
+        sink = JsonlSink(stream_filename)
+        if args.db:
+            sink = TeeSink(sink, CandidateStore(args.db))
+        with sink:
+            succeeded, failed = reparse(tasks, sink, args.processes)
+        print(f"取得し直しました（成功: {succeeded}件, 失敗: {failed}件）")
+    finally:
+        if snapshot_store:
+            snapshot_store.close()
+    
+    if args.format in ['csv', 'both']:
+        csv_filename = os.path.join(
+            args.output_dir,
+            create_output_filename('bizreach_candidates', '.csv')
+        )
+        export_csv(iter_jsonl(stream_filename), csv_filename, args.csv_career_depth, args.csv_education_depth)
+        print(f"CSVファイルに保存しました: {csv_filename}")
+    
+    if args.format in ['json', 'both']:
+        json_filename = os.path.join(
+            args.output_dir,
+            create_output_filename('bizreach_candidates', '.json')
+        )
+        export_json(iter_jsonl(stream_filename), json_filename)
+        print(f"JSONファイルに保存しました: {json_filename}")
+    
+    if args.format == 'parquet':
+        parquet_filename = os.path.join(
+            args.output_dir,
+            create_output_filename('bizreach_candidates', '.parquet')
+        )
+        export_parquet(iter_jsonl(stream_filename), parquet_filename)
+        print(f"Parquetファイルに保存しました: {parquet_filename}")
+
+
+def create_scraper(args, snapshot_store=None):
+    """コマンドライン引数の設定でスクレイパーを生成する関数"""
+    from bizreach_scraper import BizreachScraper
+    
+    scraper = BizreachScraper(
+        args.driver,
+        readiness=args.ready,
+        page_timeout=args.page_timeout,
+        field_timeout=args.field_timeout,
+        extraction=args.extraction,
+        lean=args.lean,
+        backend=args.backend
+    )
+    
+    if snapshot_store:
+        reuse_seconds = args.snapshot_reuse_hours * 3600 if args.snapshot_reuse_hours else None
+        scraper.enable_snapshots(snapshot_store, reuse_seconds)
+    
+    return scraper
+
+
+def run_async_engine(scraper, url_list, args, sink, checkpoint):
+    """
+    ログイン済みのセッションを使ってHTTPでの取得を非同期に並行実行する関数
+    
+    取得した情報は完了した順に書き出し、HTTPで取得できなかったページはHTTPでの取得と並行してブラウザで1件ずつ取得します。
+    
+    Args:
+        scraper (BizreachScraper): ログイン済みのスクレイパー
+        url_list (iterable): 求職者ページのURL（リストまたはUrlStream）
+        args (argparse.Namespace): コマンドライン引数
+        sink (JsonlSink): 取得した情報を書き出すシンク
+        checkpoint (CheckpointJournal): 各URLの処理結果を記録するジャーナル
+    """
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+    from http_fetcher import HttpFetcher
+    from async_engine import AsyncScrapeEngine
+    
+    rate = args.rate if args.rate else 1 / max(args.wait, 0.01)
+    fetcher = HttpFetcher.from_driver(
+        scraper.driver, pool_size=args.concurrency, snapshot_store=scraper.snapshot_store
+    )
+    
+    metrics = scraper.metrics
+    
+    def fetch(url):
+        # 最近保存したHTMLがあれば、ページにアクセスしない
+        start = time.perf_counter()
+        result = scraper.scrape_from_snapshot(url) or fetcher.scrape_candidate_page(url)
+        if metrics:
+            metrics.observe("http", time.perf_counter() - start)
+        return result
+    
+    engine = AsyncScrapeEngine(fetch, args.concurrency, rate)
+    
+    async def consume(browser_executor):
+        loop = asyncio.get_running_loop()
+        # HTTPで取得できなかったURLは、HTTPでの取得を続けながらブラウザで1件ずつ取得する
+        # （ブラウザが追いつかない場合はHTTPでの取得を待たせ、待ち行列が増え続けないようにする）
+        fallback_queue = asyncio.Queue(maxsize=args.concurrency)
+        
+        async def browser_worker():
+            fallback_count = 0
+            while True:
+                url = await fallback_queue.get()
+                if url is None:
+                    return fallback_count
+                if not fallback_count:
+                    print("HTTPで取得できなかったページをブラウザで取得します")
+                result = await loop.run_in_executor(browser_executor, scraper.scrape_candidate_page, url)
+                sink.write(result)
+                checkpoint.record(url, result)
+                fallback_count += 1
         
-        # ログイン処理
-        if not scraper.login(args.username, args.password):
-            print("ログインに失敗しました。ユーザー名とパスワードを確認してください。")
+        async def enqueue(url):
+            # ブラウザでの取得が例外で止まった場合は、待ち続けずにその例外を発生させる
+            put = asyncio.ensure_future(fallback_queue.put(url))
+            await asyncio.wait({put, worker}, return_when=asyncio.FIRST_COMPLETED)
+            if not put.done():
+                put.cancel()
+                worker.result()
+        
+        worker = asyncio.ensure_future(browser_worker())
+        try:
+            async for url, result in engine.scrape(url_list):
+                if result is None:
+                    await enqueue(url)
+                    continue
+                if metrics:
+                    metrics.inc("pages", status="error" if "error" in result else "ok")
+                sink.write(result)
+                checkpoint.record(url, result)
+            await enqueue(None)
+            return await worker
+        finally:
+            worker.cancel()
+    
+    try:
+        with ThreadPoolExecutor(max_workers=1) as browser_executor:
+            fallback_count = asyncio.run(consume(browser_executor))
+    finally:
+        fetcher.close()
+    
+    if fallback_count:
+        print(f"HTTPで取得できなかった{fallback_count}件をブラウザで取得しました")
+
+
+def iter_saved_candidates(stream_filename, checkpoint):
+    """
+    JSONLファイルに書き出した求職者情報を1件ずつ返すジェネレーター
+    
+    再開した実行で取得し直したURLについては、前回のエラー行を除きます。
+    
+    Args:
+        stream_filename (str): JSONLファイルのパス
+        checkpoint (CheckpointJournal): 処理済みURLのジャーナル
+        
+    Yields:
+        dict: 求職者情報
+    """
+    for candidate in iter_jsonl(stream_filename):
+        if "error" in candidate and checkpoint.is_done(candidate["url"]):
+            continue
+        yield candidate
+
+
+def main():
+    """メイン関数"""
+    # サブコマンド（保存したHTMLからの再取得）
+    if len(sys.argv) > 1 and sys.argv[1] == 'reparse':
+        run_reparse(parse_reparse_arguments(sys.argv[2:]))
+        return
+    
+    # サブコマンド（作業キューへのURLの追加）
+    if len(sys.argv) > 1 and sys.argv[1] == 'enqueue':
+        run_enqueue(parse_enqueue_arguments(sys.argv[2:]))
+        return
+    
+    # 引数の解析（workerサブコマンドでは、URLリストの代わりに作業キューから取得する）
+    if len(sys.argv) > 1 and sys.argv[1] == 'worker':
+        args = parse_arguments(sys.argv[2:], worker=True)
+    else:
+        args = parse_arguments()
+    
+    # 出力ディレクトリの作成
+    ensure_directory_exists(args.output_dir)
+    
+    url_stream = None
+    work_queue = None
+    if args.worker:
+        # 作業キューからURLを借りながらスクレイピングし、取得結果をキューに記録する
+        from work_queue import create_work_queue, QueueFeed
+        try:
+            work_queue = create_work_queue(args.queue)
+        except Exception as e:
+            print(f"作業キューを開けませんでした: {str(e)}")
+            sys.exit(1)
+        feed = QueueFeed(work_queue, args.worker_id, args.batch_size, args.lease_seconds, args.max_attempts)
+        url_list = feed
+        print(f"作業キューを開きました: {args.queue}（ワーカー: {feed.worker_id}）")
+    else:
+        # URLリストの読み込み（1件ずつ読みながらスクレイピングする）
+        try:
+            url_stream = UrlStream(args.input, args.bloom_capacity)
+            url_list = url_stream
+            print(f"URLリストを開きました: {args.input}")
+        except Exception as e:
+            print(f"URLリストの読み込みに失敗しました: {str(e)}")
             sys.exit(1)
+    
+    # セッションキャッシュ（暗号鍵は環境変数BIZREACH_SESSION_KEY、なければパスワードから導出）
+    session_cache = None
+    if args.session_file:
+        from session_cache import SessionCache
+        secret = os.environ.get('BIZREACH_SESSION_KEY') or args.password
+        session_cache = SessionCache(args.session_file, secret, args.session_max_age)
+    
+    if args.worker:
+        # 処理結果は作業キューに記録し、ワーカーごとに新しいJSONLファイルに書き出す
+        checkpoint = feed
+        stream_filename = os.path.join(
+            args.output_dir,
+            create_output_filename('bizreach_candidates', '.jsonl')
+        )
+    else:
+        # 処理済みURLのジャーナル（再開時は処理済みのURLを除外する）
+        checkpoint_filename = args.checkpoint or os.path.join(args.output_dir, 'bizreach_checkpoint.jsonl')
+        checkpoint = CheckpointJournal(checkpoint_filename, resume=args.resume)
+        
+        if args.resume and checkpoint.stream_filename:
+            # 前回と同じJSONLファイルに追記する
+            stream_filename = checkpoint.stream_filename
+            url_list = checkpoint.pending(url_list)
+            done_count = sum(1 for status in checkpoint.done.values() if status == "ok")
+            print(f"前回の実行を再開します（処理済み: {done_count}件）")
+        else:
+            # 取得した情報を逐次書き出すJSONLファイル
+            stream_filename = os.path.join(
+                args.output_dir,
+                create_output_filename('bizreach_candidates', '.jsonl')
+            )
+            checkpoint.start_run(stream_filename)
+    # 書き出し中のシンク（取得を終えて閉じたらclosed_sinkに移す）
+    sink = None
+    closed_sink = None
+    completed = False
+    
+    # ページのHTMLのスナップショットストア
+    snapshot_store = SnapshotStore(args.snapshot_dir) if args.snapshot_dir else None
+    
+    # 求職者情報のデータベース（最近取得できた求職者は取得し直さない）
+    candidate_store = CandidateStore(args.db) if args.db else None
+    if candidate_store and args.stale_hours:
+        url_list = candidate_store.iter_stale(url_list, args.stale_hours * 3600)
+    
+    # スクレイパーの初期化
+    if args.workers > 1:
+        # --adaptive-waitの場合は、全セッションで共有するAdaptivePacerが間隔を空ける
+        from worker_pool import WorkerPool
+        pool = WorkerPool(lambda: create_scraper(args, snapshot_store), args.workers,
+                          0 if args.adaptive_wait else args.wait)
+    else:
+        pool = None
+        scraper = create_scraper(args, snapshot_store)
+    
+    try:
+        if pool:
+            # 全セッションのブラウザを起動し、1回のログインをCookieで共有
+            if not pool.start(args.username, args.password, session_cache):
+                print("ログインに失敗しました。ユーザー名とパスワードを確認してください。")
+                sys.exit(1)
+            
+            print(f"ブラウザを{args.workers}個起動し、ログインに成功しました")
+            scraper = pool.primary
+        else:
+            # ブラウザの起動
+            scraper.start_browser()
+            print("ブラウザを起動しました")
+            
+            # ログイン処理（保存したセッションが有効なら再利用）
+            if session_cache:
+                logged_in = session_cache.login(scraper, args.username, args.password)
+            else:
+                logged_in = scraper.login(args.username, args.password)
+            
+            if not logged_in:
+                print("ログインに失敗しました。ユーザー名とパスワードを確認してください。")
+                sys.exit(1)
+            
+            print("ログインに成功しました")
+        
+        # ブラウザの定期的な再起動と、異常終了時の自動再起動・再ログイン
+        for s in (pool.scrapers if pool else [scraper]):
+            s.enable_supervisor(args.username, args.password, session_cache,
+                                args.recycle_pages, args.max_browser_memory_mb)
+        
+        # エラーの分類ごとの再試行と、失敗が急増したときの一時停止（全セッションで共有）
+        breaker = None
+        if not args.no_retry:
+            from retry import CircuitBreaker
+            breaker = CircuitBreaker(cooldown=args.circuit_cooldown)
+            for s in (pool.scrapers if pool else [scraper]):
+                s.enable_retries(breaker=breaker)
+        
+        # 処理段階ごとの時間の集計（全セッションで共有）
+        metrics = None
+        if args.profile or args.metrics_json or args.metrics_prom:
+            metrics = Metrics()
+            if pool:
+                pool.enable_metrics(metrics)
+            else:
+                scraper.enable_metrics(metrics)
+        
+        # ページの応答に合わせたリクエスト間隔の調整（全セッションで共有）
+        pacer = None
+        if args.adaptive_wait:
+            from pacing import AdaptivePacer
+            pacer = AdaptivePacer(args.wait, args.min_wait, args.max_wait, slow_page_seconds=args.page_timeout)
+            for s in (pool.scrapers if pool else [scraper]):
+                s.enable_pacing(pacer)
+        
+        # ブラウザのログインセッションを引き継いでHTTPでの取得を有効化
+        if args.http:
+            for s in (pool.scrapers if pool else [scraper]):
+                s.enable_http_fast_path()
+            print("HTTPでの直接取得を有効にしました")
+        
+        # スクレイピングの実行（取得した情報は1件ずつJSONLファイルに書き出す）
+        print("スクレイピングを開始します")
+        sink = JsonlSink(stream_filename)
+        print(f"取得した情報を書き出しています: {stream_filename}")
+        if candidate_store:
+            # 全件をデータベースに保存し、JSONLファイルには新規・変更された情報だけを書き出す（--changes-only）
+            sink = ChangeTrackingSink(candidate_store, sink, args.changes_only, args.diff)
+            print(f"取得した情報をデータベースに保存しています: {args.db}")
+        
+        if pool:
+            pool.scrape_multiple_candidates(url_list, sink=sink, checkpoint=checkpoint)
+        elif args.engine == 'async':
+            run_async_engine(scraper, url_list, args, sink, checkpoint)
+        else:
+            scraper.scrape_multiple_candidates(url_list, (args.wait, args.wait + 2), sink=sink, checkpoint=checkpoint)
         
-        print("ログインに成功しました")
+        sink.close()
+        closed_sink, sink = sink, None
+        if url_stream:
+            print(f"URLリスト: 有効 {url_stream.count}件 / 無効 {url_stream.invalid}件 / 重複 {url_stream.duplicates}件")
+        else:
+            print(f"作業キューに記録: {feed.completed}件"
+                  + (f" / 他のワーカーに渡ったため記録できず: {feed.lost}件" if feed.lost else ""))
+        if candidate_store:
+            if args.stale_hours:
+                print(f"最近取得済みのため省略: {candidate_store.skipped_fresh}件")
+            counts = closed_sink.counts
+            print(f"前回との比較: 新規 {counts['new']}件 / 変更 {counts['changed']}件 / "
+                  f"変更なし {counts['unchanged']}件 / エラー {counts['error']}件")
         
-        # スクレイピングの実行
-        print(f"スクレイピングを開始します（対象URL: {len(url_list)}件）")
-        scraper.scrape_multiple_candidates(url_list, (args.wait, args.wait + 2))
+        # ページごとの待機・取得時間の集計
+        scrapers = pool.scrapers if pool else [scraper]
+        timings = PageTimings.combine(s.page_timings for s in scrapers)
+        if timings.count:
+            waits = timings.ready.to_dict()
+            extracts = timings.extract.to_dict()
+            print(f"ページ待機時間: 平均 {waits['mean']:.2f}秒 / 最大 {waits['max']:.2f}秒")
+            print(f"情報取得時間: 平均 {extracts['mean']:.2f}秒 / 最大 {extracts['max']:.2f}秒")
+            print("取得方式の内訳: " + ", ".join(f"{method} {count}件" for method, count in timings.extractions.items()))
+        
+        # ブラウザの再起動の回数
+        restarts = {"pages": 0, "memory": 0, "crash": 0}
+        for s in scrapers:
+            for reason, count in s.supervisor.restarts.items():
+                restarts[reason] += count
+        if any(restarts.values()):
+            print(f"ブラウザの再起動: ページ数 {restarts['pages']}回 / メモリ {restarts['memory']}回 / "
+                  f"異常終了 {restarts['crash']}回")
+        
+        # 再試行の回数
+        if breaker:
+            retries = {}
+            for s in scrapers:
+                for error_type, count in s.retry_handler.retries.items():
+                    retries[error_type] = retries.get(error_type, 0) + count
+            if any(retries.values()):
+                print("再試行: " + ", ".join(f"{error_type} {count}回" for error_type, count in retries.items() if count))
+            if breaker.opened:
+                print(f"失敗の急増による一時停止: {breaker.opened}回")
+        
+        # リクエスト間隔の調整の結果
+        if pacer:
+            print(f"リクエスト間隔: 最終 {pacer.interval:.2f}秒 / 短縮 {pacer.increases}回 / 延長 {pacer.decreases}回")
+        
+        # 処理段階ごとの時間の内訳
+        if metrics:
+            if args.profile:
+                print(metrics.format_profile())
+            if args.metrics_json:
+                metrics.save_json(args.metrics_json)
+                print(f"集計をJSONファイルに保存しました: {args.metrics_json}")
+            if args.metrics_prom:
+                metrics.save_prometheus(args.metrics_prom)
+                print(f"集計をPrometheusのテキスト形式で保存しました: {args.metrics_prom}")
         
         # 取得したデータの保存
         if args.format in ['csv', 'both']:
@@ -77,7 +745,8 @@ def main():
                 args.output_dir, 
                 create_output_filename('bizreach_candidates', '.csv')
             )
-            if scraper.save_data_to_csv(csv_filename):
+            if scraper.save_data_to_csv(csv_filename, iter_saved_candidates(stream_filename, checkpoint),
+                                        args.csv_career_depth, args.csv_education_depth):
                 print(f"CSVファイルに保存しました: {csv_filename}")
         
         if args.format in ['json', 'both']:
@@ -85,18 +754,52 @@ def main():
                 args.output_dir, 
                 create_output_filename('bizreach_candidates', '.json')
             )
-            if scraper.save_data_to_json(json_filename):
+            if scraper.save_data_to_json(json_filename, iter_saved_candidates(stream_filename, checkpoint)):
                 print(f"JSONファイルに保存しました: {json_filename}")
         
+        if args.format == 'parquet':
+            parquet_filename = os.path.join(
+                args.output_dir, 
+                create_output_filename('bizreach_candidates', '.parquet')
+            )
+            if scraper.save_data_to_parquet(parquet_filename, iter_saved_candidates(stream_filename, checkpoint)):
+                print(f"Parquetファイルに保存しました: {parquet_filename}")
+        
+        completed = True
         print("スクレイピングが完了しました")
         
     except KeyboardInterrupt:
-        print("\nユーザーによって中断されました")
+        print("\nユーザーによって中断されました（--resume で続きから再開できます）")
     except Exception as e:
         print(f"エラーが発生しました: {str(e)}")
     finally:
+        # 取得の途中で中断・エラーになった場合は、書き出し中のJSONLファイルをここで閉じる（取得済みの情報は残る）
+        if sink:
+            sink.close()
+            closed_sink, sink = sink, None
+        if not completed and closed_sink and closed_sink.count:
+            print(f"取得済みの{closed_sink.count}件はJSONLファイルに保存されています: {stream_filename}")
+        # ワーカーでは、未完了のURLを作業キューに戻す
+        checkpoint.close()
+        if work_queue:
+            print_queue_counts(work_queue)
+            work_queue.close()
+        if candidate_store:
+            candidate_store.close()
+        
+        # 古いスナップショットの削除
+        if snapshot_store:
+            max_bytes = int(args.snapshot_max_mb * 1024 * 1024) if args.snapshot_max_mb else None
+            removed = snapshot_store.prune(max_bytes, args.snapshot_max_age_days)
+            if removed:
+                print(f"古いスナップショットを{removed}件削除しました")
+            snapshot_store.close()
+        
         # ブラウザの終了
-        if scraper.close_browser():
+        if pool:
+            if pool.close():
+                print("ブラウザを終了しました")
+        elif scraper.close_browser():
             print("ブラウザを終了しました")
 
 
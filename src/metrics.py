@@ -0,0 +1,326 @@
+import json
+import time
+import threading
+import unicodedata
+from bisect import bisect_left
+from contextlib import contextmanager
+
+
+# 処理時間のヒストグラムの区切り（秒）
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Prometheus形式で出力するメトリクス名の接頭辞
+PROMETHEUS_PREFIX = "bizreach"
+
+
+def _pad(text, width):
+    """全角文字を2文字分として、表示幅がwidthになるように左側を空白で埋める"""
+    display_width = sum(2 if unicodedata.east_asian_width(char) in "FW" else 1 for char in text)
+    return " " * max(0, width - display_width) + text
+
+
+class Histogram:
+    """処理時間の分布を区切りごとの件数で保持するクラス（件数が増えてもメモリ使用量は一定）"""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        """
+        ヒストグラムの初期化
+
+        Args:
+            buckets (tuple): 区切りの上限値（秒）の昇順のタプル
+        """
+        self.buckets = tuple(buckets)
+        # 最後の要素は最大の区切りを超えた件数
+        self.bucket_counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        """
+        値を1件記録する
+
+        Args:
+            value (float): 処理時間（秒）
+        """
+        self.bucket_counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def merge(self, other):
+        """
+        同じ区切りの別のヒストグラムの記録を加える
+
+        Args:
+            other (Histogram): 加えるヒストグラム
+        """
+        for i, bucket_count in enumerate(other.bucket_counts):
+            self.bucket_counts[i] += bucket_count
+        self.count += other.count
+        self.sum += other.sum
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q):
+        """
+        分位数を区切りの中で線形補間して推定する
+
+        Args:
+            q (float): 0から1の分位（0.5で中央値）
+
+        Returns:
+            float: 推定した値（秒）。記録がなければ0
+        """
+        if not self.count:
+            return 0.0
+
+        target = q * self.count
+        cumulative = 0
+        for i, bucket_count in enumerate(self.bucket_counts):
+            if cumulative + bucket_count >= target and bucket_count:
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                upper = self.buckets[i] if i < len(self.buckets) else self.max
+                value = lower + (upper - lower) * (target - cumulative) / bucket_count
+                return min(value, self.max)
+            cumulative += bucket_count
+        return self.max
+
+    def to_dict(self):
+        """
+        集計結果をdictで返す
+
+        Returns:
+            dict: 件数、合計・平均・中央値・95パーセンタイル・最大（秒）
+        """
+        return {
+            "count": self.count,
+            "total": round(self.sum, 6),
+            "mean": round(self.sum / self.count, 6) if self.count else 0.0,
+            "p50": round(self.quantile(0.5), 6),
+            "p95": round(self.quantile(0.95), 6),
+            "max": round(self.max, 6)
+        }
+
+
+class PageTimings:
+    """ページごとの待機・取得時間を集計するクラス（ページ数が増えてもメモリ使用量は一定）"""
+
+    def __init__(self):
+        # ページの準備完了までの待機時間と、情報の取得時間
+        self.ready = Histogram()
+        self.extract = Histogram()
+        # 取得方式（script, selenium, http, snapshot など）ごとのページ数
+        self.extractions = {}
+        # 最後に記録したページ（url, readiness, extraction, ready_seconds, extract_seconds）
+        self.last = None
+
+    @property
+    def count(self):
+        """記録したページ数"""
+        return self.ready.count
+
+    def record(self, url, readiness, extraction, ready_seconds, extract_seconds):
+        """
+        1ページの待機・取得時間を記録する
+
+        Args:
+            url (str): 求職者ページのURL
+            readiness (str): ページの準備完了の判定方式
+            extraction (str): 情報の取得方式
+            ready_seconds (float): 待機時間（秒）
+            extract_seconds (float): 取得時間（秒）
+        """
+        self.ready.observe(ready_seconds)
+        self.extract.observe(extract_seconds)
+        self.extractions[extraction] = self.extractions.get(extraction, 0) + 1
+        self.last = {
+            "url": url,
+            "readiness": readiness,
+            "extraction": extraction,
+            "ready_seconds": round(ready_seconds, 3),
+            "extract_seconds": round(extract_seconds, 3)
+        }
+
+    @classmethod
+    def combine(cls, timings):
+        """
+        複数のワーカーの集計を1つにまとめる
+
+        Args:
+            timings (iterable): PageTimingsのイテラブル
+
+        Returns:
+            PageTimings: まとめた集計
+        """
+        combined = cls()
+        for page_timings in timings:
+            combined.ready.merge(page_timings.ready)
+            combined.extract.merge(page_timings.extract)
+            for extraction, count in page_timings.extractions.items():
+                combined.extractions[extraction] = combined.extractions.get(extraction, 0) + count
+        return combined
+
+
+class Metrics:
+    """スクレイピングの処理段階ごとの時間とカウンターを集計するクラス（複数のワーカーで共有可能）"""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        """
+        メトリクスの初期化
+
+        Args:
+            buckets (tuple): 処理時間のヒストグラムの区切り（秒）
+        """
+        self.buckets = buckets
+        # 処理段階（navigate, ready, extract.name など）ごとのヒストグラム
+        self.phases = {}
+        # カウンター名ごとの、ラベルの値ごとの件数
+        self.counters = {}
+        self._label_names = {}
+        self.started = time.monotonic()
+        self._lock = threading.Lock()
+
+    def observe(self, phase, seconds):
+        """
+        処理段階の時間を記録する
+
+        Args:
+            phase (str): 処理段階の名前
+            seconds (float): 処理時間（秒）
+        """
+        with self._lock:
+            histogram = self.phases.get(phase)
+            if histogram is None:
+                histogram = self.phases[phase] = Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    @contextmanager
+    def timer(self, phase):
+        """
+        withブロックの処理時間を記録する
+
+        Args:
+            phase (str): 処理段階の名前
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(phase, time.perf_counter() - start)
+
+    def inc(self, name, amount=1, **label):
+        """
+        カウンターを増やす
+
+        Args:
+            name (str): カウンター名（pages, errors など）
+            amount (int): 増やす数
+            **label: 1つまでのラベル（例: status="ok"）
+        """
+        label_name, label_value = next(iter(label.items()), ("", ""))
+        with self._lock:
+            values = self.counters.setdefault(name, {})
+            values[label_value] = values.get(label_value, 0) + amount
+            self._label_names[name] = label_name
+
+    def elapsed(self):
+        """計測を開始してからの経過時間（秒）"""
+        return time.monotonic() - self.started
+
+    def summary(self):
+        """
+        実行の集計結果をdictで返す
+
+        Returns:
+            dict: 経過時間、ページ数、スループット、カウンター、処理段階ごとの時間
+        """
+        elapsed = self.elapsed()
+        with self._lock:
+            pages = sum(self.counters.get("pages", {}).values())
+            return {
+                "elapsed_seconds": round(elapsed, 3),
+                "pages": pages,
+                "pages_per_minute": round(pages * 60 / elapsed, 3) if elapsed > 0 else 0.0,
+                "counters": {name: dict(values) for name, values in self.counters.items()},
+                "phases": {phase: histogram.to_dict() for phase, histogram in self.phases.items()}
+            }
+
+    def save_json(self, filename):
+        """
+        集計結果をJSONファイルに保存する
+
+        Args:
+            filename (str): 保存先のファイル名
+        """
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(self.summary(), f, ensure_ascii=False, indent=2)
+
+    def to_prometheus(self):
+        """
+        集計結果をPrometheusのテキスト形式で返す（node_exporterのtextfileコレクターなどで読み込める）
+
+        Returns:
+            str: Prometheusのテキスト形式
+        """
+        lines = []
+        with self._lock:
+            for name, values in sorted(self.counters.items()):
+                metric = f"{PROMETHEUS_PREFIX}_{name}_total"
+                label_name = self._label_names[name]
+                lines.append(f"# TYPE {metric} counter")
+                for label_value, count in sorted(values.items()):
+                    labels = f'{{{label_name}="{label_value}"}}' if label_name else ""
+                    lines.append(f"{metric}{labels} {count}")
+
+            metric = f"{PROMETHEUS_PREFIX}_phase_seconds"
+            if self.phases:
+                lines.append(f"# TYPE {metric} histogram")
+            for phase, histogram in sorted(self.phases.items()):
+                cumulative = 0
+                for bucket, bucket_count in zip(histogram.buckets, histogram.bucket_counts):
+                    cumulative += bucket_count
+                    lines.append(f'{metric}_bucket{{phase="{phase}",le="{bucket}"}} {cumulative}')
+                lines.append(f'{metric}_bucket{{phase="{phase}",le="+Inf"}} {histogram.count}')
+                lines.append(f'{metric}_sum{{phase="{phase}"}} {histogram.sum:.6f}')
+                lines.append(f'{metric}_count{{phase="{phase}"}} {histogram.count}')
+
+        lines.append(f"# TYPE {PROMETHEUS_PREFIX}_elapsed_seconds gauge")
+        lines.append(f"{PROMETHEUS_PREFIX}_elapsed_seconds {self.elapsed():.3f}")
+        return "\n".join(lines) + "\n"
+
+    def save_prometheus(self, filename):
+        """
+        集計結果をPrometheusのテキスト形式でファイルに保存する
+
+        Args:
+            filename (str): 保存先のファイル名
+        """
+        with open(filename, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus())
+
+    def format_profile(self):
+        """
+        処理段階ごとの時間の内訳を、合計時間の長い順の表にする
+
+        Returns:
+            str: 表示用の文字列
+        """
+        summary = self.summary()
+        elapsed = summary["elapsed_seconds"]
+        lines = [
+            f"経過時間: {elapsed:.1f}秒 / ページ数: {summary['pages']}件 / "
+            f"スループット: {summary['pages_per_minute']:.1f}件/分",
+            "処理段階" + " " * 12 + "".join(_pad(header, width) for header, width in
+                                           [("回数", 8), ("合計(秒)", 12), ("割合", 8), ("平均", 10),
+                                            ("中央値", 10), ("95%", 10), ("最大", 10)])
+        ]
+        phases = sorted(summary["phases"].items(), key=lambda item: item[1]["total"], reverse=True)
+        for phase, stats in phases:
+            share = stats["total"] / elapsed * 100 if elapsed > 0 else 0.0
+            lines.append(
+                f"{phase:<20}{stats['count']:>8}{stats['total']:>12.2f}{share:>7.1f}%"
+                f"{stats['mean']:>10.3f}{stats['p50']:>10.3f}{stats['p95']:>10.3f}{stats['max']:>10.3f}"
+            )
+        for name, values in summary["counters"].items():
+            lines.append(f"{name}: " + ", ".join(f"{label or name} {count}" for label, count in values.items()))
+        return "\n".join(lines)
@@ -0,0 +1,77 @@
+import time
+from worker_pool import RateLimiter
+from errors import TRANSIENT, SESSION, THROTTLED
+
+
+# リクエストを送りすぎている兆候とみなすエラーの分類（タイムアウト、ログインページへのリダイレクト、アクセス制限・CAPTCHA）
+BACKOFF_ERROR_TYPES = (TRANSIENT, SESSION, THROTTLED)
+
+
+class AdaptivePacer(RateLimiter):
+    """ページの応答に合わせてリクエスト間隔を調整するクラス（AIMD: 速めるときは少しずつ、遅くするときは大きく）"""
+
+    def __init__(self, initial_interval, min_wait=1.0, max_wait=60.0, increase=0.02,
+                 decrease_factor=0.5, slow_page_seconds=10.0):
+        """
+        リクエスト間隔の調整の初期化
+
+        Args:
+            initial_interval (float): 最初のリクエスト間隔（秒）
+            min_wait (float): リクエスト間隔の下限（秒）。これより速くはしない
+            max_wait (float): リクエスト間隔の上限（秒）。これより遅くはしない
+            increase (float): 正常なページ1件ごとに増やすリクエスト数（件/秒）
+            decrease_factor (float): 異常を検出したときにリクエスト数に掛ける係数（0より大きく1未満）
+            slow_page_seconds (float): 取得にこの時間（秒）以上かかったページを異常とみなす
+        """
+        if not 0 < min_wait <= max_wait:
+            raise ValueError("リクエスト間隔の下限は0より大きく、上限以下である必要があります")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("減速の係数は0より大きく1未満である必要があります")
+
+        super().__init__(min(max(initial_interval, min_wait), max_wait))
+        self.min_wait = min_wait
+        self.max_wait = max_wait
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.slow_page_seconds = slow_page_seconds
+
+        # 速めた回数と遅くした回数
+        self.increases = 0
+        self.decreases = 0
+        self._last_decrease = 0.0
+
+    @property
+    def interval(self):
+        """現在のリクエスト間隔（秒）"""
+        return self.min_interval
+
+    def record(self, result, elapsed):
+        """
+        1件のリクエストの結果からリクエスト間隔を調整する
+
+        正常なページではリクエスト数を加算的に増やし、遅いページ・タイムアウト・アクセス制限・
+        ログインページへのリダイレクトではリクエスト数を乗算的に減らします。
+        ページ構造の変更などその他のエラーでは間隔を変えません。
+
+        Args:
+            result (dict): 取得した求職者情報（失敗時はerrorとerror_typeを含む）
+            elapsed (float): リクエストの開始から結果までの時間（秒）
+        """
+        now = time.monotonic()
+        error_type = result.get("error_type") if "error" in result else None
+
+        with self._lock:
+            if error_type in BACKOFF_ERROR_TYPES or elapsed >= self.slow_page_seconds:
+                # 前回減速する前に始まったリクエストの失敗は、同じ混雑によるものなので重ねて減速しない
+                if now - elapsed < self._last_decrease:
+                    return
+                rate = (1 / self.min_interval) * self.decrease_factor
+                self.decreases += 1
+                self._last_decrease = now
+            elif error_type is None:
+                rate = 1 / self.min_interval + self.increase
+                self.increases += 1
+            else:
+                return
+
+            self.min_interval = min(self.max_wait, max(self.min_wait, 1 / rate))
@@ -0,0 +1,204 @@
+import sys
+
+
+def _intern(value):
+    """文字列をインターンする（同じ会社名・学校名・スキル名などを1つの文字列オブジェクトで共有する）"""
+    return sys.intern(value) if type(value) is str else value
+
+
+class CareerEntry:
+    """経歴の1件（__slots__で属性を固定し、辞書よりメモリを使わない）"""
+
+    __slots__ = ("company", "period", "position")
+
+    def __init__(self, company=None, period=None, position=None):
+        self.company = _intern(company)
+        self.period = _intern(period)
+        self.position = _intern(position)
+
+    @classmethod
+    def from_dict(cls, entry):
+        """辞書（{"company", "period", "position"}）から生成する"""
+        return cls(entry.get("company"), entry.get("period"), entry.get("position"))
+
+    def to_dict(self):
+        """現在の辞書の形式に戻す"""
+        return {"company": self.company, "period": self.period, "position": self.position}
+
+    def __eq__(self, other):
+        return isinstance(other, CareerEntry) and self.to_dict() == other.to_dict()
+
+    def __hash__(self):
+        return hash((self.company, self.period, self.position))
+
+    def __repr__(self):
+        return f"CareerEntry({self.company!r}, {self.period!r}, {self.position!r})"
+
+
+class EducationEntry:
+    """学歴の1件（__slots__で属性を固定し、辞書よりメモリを使わない）"""
+
+    __slots__ = ("school", "period", "degree")
+
+    def __init__(self, school=None, period=None, degree=None):
+        self.school = _intern(school)
+        self.period = _intern(period)
+        self.degree = _intern(degree)
+
+    @classmethod
+    def from_dict(cls, entry):
+        """辞書（{"school", "period", "degree"}）から生成する"""
+        return cls(entry.get("school"), entry.get("period"), entry.get("degree"))
+
+    def to_dict(self):
+        """現在の辞書の形式に戻す"""
+        return {"school": self.school, "period": self.period, "degree": self.degree}
+
+    def __eq__(self, other):
+        return isinstance(other, EducationEntry) and self.to_dict() == other.to_dict()
+
+    def __hash__(self):
+        return hash((self.school, self.period, self.degree))
+
+    def __repr__(self):
+        return f"EducationEntry({self.school!r}, {self.period!r}, {self.degree!r})"
+
+
+class Candidate:
+    """
+    求職者情報の1件（scrape_candidate_pageの結果の辞書を、少ないメモリで保持する）
+
+    経歴・スキル・学歴はタプルで持ち、会社名・学校名・スキル名・期間・取得日時などの繰り返し現れる文字列は
+    インターンして共有します。項目がない場合はNoneで、to_dict()ではその項目を出力しません。
+    error_typeなどのその他の項目はextraに持ち、to_dict()でそのまま戻します。
+    """
+
+    __slots__ = ("url", "name", "age", "career_history", "skills", "education", "scraped_at", "error", "extra")
+
+    # 辞書から属性に取り込む項目（それ以外はextraに入れる）
+    FIELDS = ("url", "name", "age", "career_history", "skills", "education", "scraped_at", "error")
+
+    def __init__(self, url=None, name=None, age=None, career_history=None, skills=None, education=None,
+                 scraped_at=None, error=None, extra=None):
+        self.url = url
+        self.name = name
+        self.age = _intern(age)
+        self.career_history = tuple(career_history) if career_history is not None else None
+        self.skills = tuple(_intern(skill) for skill in skills) if skills is not None else None
+        self.education = tuple(education) if education is not None else None
+        self.scraped_at = _intern(scraped_at)
+        self.error = error
+        self.extra = extra or None
+
+    @classmethod
+    def from_dict(cls, candidate):
+        """
+        求職者情報の辞書から生成する
+
+        Args:
+            candidate (dict): scrape_candidate_pageの結果、またはiter_jsonl()で読み込んだ求職者情報
+
+        Returns:
+            Candidate: 生成した求職者情報
+        """
+        career_history = candidate.get("career_history")
+        education = candidate.get("education")
+        extra = {key: _intern(value) for key, value in candidate.items() if key not in cls.FIELDS}
+        return cls(
+            candidate.get("url"),
+            candidate.get("name"),
+            candidate.get("age"),
+            [CareerEntry.from_dict(entry) for entry in career_history] if career_history is not None else None,
+            candidate.get("skills"),
+            [EducationEntry.from_dict(entry) for entry in education] if education is not None else None,
+            candidate.get("scraped_at"),
+            candidate.get("error"),
+            extra
+        )
+
+    def to_dict(self):
+        """
+        現在の辞書の形式に戻す（書き出し処理やexport_csvなどにそのまま渡せる）
+
+        Returns:
+            dict: 求職者情報
+        """
+        candidate = {}
+        if self.name is not None:
+            candidate["name"] = self.name
+        if self.age is not None:
+            candidate["age"] = self.age
+        if self.career_history is not None:
+            candidate["career_history"] = [entry.to_dict() for entry in self.career_history]
+        if self.skills is not None:
+            candidate["skills"] = list(self.skills)
+        if self.education is not None:
+            candidate["education"] = [entry.to_dict() for entry in self.education]
+        if self.url is not None:
+            candidate["url"] = self.url
+        if self.error is not None:
+            candidate["error"] = self.error
+        if self.extra:
+            candidate.update(self.extra)
+        if self.scraped_at is not None:
+            candidate["scraped_at"] = self.scraped_at
+        return candidate
+
+    def __eq__(self, other):
+        return isinstance(other, Candidate) and self.to_dict() == other.to_dict()
+
+    def __hash__(self):
+        # extraにはリスト（changesなど）が入る場合があるため、ハッシュには含めない（等しければextra以外も等しい）
+        return hash((self.url, self.name, self.age, self.career_history, self.skills, self.education,
+                     self.scraped_at, self.error))
+
+    def __repr__(self):
+        return f"Candidate(url={self.url!r}, name={self.name!r})"
+
+
+class CandidateCollection:
+    """
+    求職者情報をCandidateとしてメモリに保持するシンク（重複排除や集計のために大量の求職者情報を持つ場合に使う）
+
+    JsonlSinkと同じwrite/closeを持ち、繰り返すと現在の辞書の形式で返すため、export_csvなどにそのまま渡せます。
+    """
+
+    def __init__(self, candidates=None):
+        """
+        Args:
+            candidates (iterable, optional): 最初に追加する求職者情報（辞書、iter_jsonl()など）
+        """
+        self.records = []
+        if candidates is not None:
+            for candidate in candidates:
+                self.write(candidate)
+
+    @property
+    def count(self):
+        """保持している件数"""
+        return len(self.records)
+
+    def write(self, candidate):
+        """
+        求職者情報を1件追加する
+
+        Args:
+            candidate (dict or Candidate): 求職者情報
+        """
+        self.records.append(candidate if isinstance(candidate, Candidate) else Candidate.from_dict(candidate))
+
+    def close(self):
+        """シンクとしての互換性のためのメソッド（何もしない）"""
+
+    def __len__(self):
+        return len(self.records)
+
+    def __iter__(self):
+        for record in self.records:
+            yield record.to_dict()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
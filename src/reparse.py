@@ -0,0 +1,108 @@
+import os
+import gzip
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from html_extractor import extract_candidate_from_html
+from utils import CANDIDATE_URL_TEMPLATE
+
+# 読み込むHTMLファイルの拡張子
+HTML_EXTENSIONS = (".html", ".htm", ".html.gz")
+
+
+def iter_html_dir(directory):
+    """
+    ディレクトリ以下に保存したHTMLファイルを、再取得用のタスクとして1件ずつ返すジェネレーター
+
+    ファイル名（拡張子を除く）を求職者IDとみなしてURLを組み立て、ファイルの更新日時を取得日時とします。
+
+    Args:
+        directory (str): HTMLファイルを保存したディレクトリ
+
+    Yields:
+        tuple: (URL, HTMLファイルのパス, 取得日時のUNIX時刻)
+    """
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for filename in sorted(files):
+            extension = next((ext for ext in HTML_EXTENSIONS if filename.endswith(ext)), None)
+            if extension is None:
+                continue
+
+            path = os.path.join(root, filename)
+            candidate_id = filename[:-len(extension)]
+            yield CANDIDATE_URL_TEMPLATE.format(candidate_id), path, os.path.getmtime(path)
+
+
+def iter_snapshots(snapshot_store):
+    """
+    スナップショットストアの求職者ごとの最新のHTMLを、再取得用のタスクとして1件ずつ返すジェネレーター
+
+    Args:
+        snapshot_store (SnapshotStore): スナップショットストア
+
+    Yields:
+        tuple: (URL, 圧縮HTMLのパス, 取得日時のUNIX時刻)
+    """
+    for snapshot in snapshot_store.iter_latest():
+        yield snapshot["url"], snapshot_store.object_path(snapshot["content_hash"]), snapshot["fetched_at"]
+
+
+def reparse_file(task):
+    """
+    保存したHTMLファイル1件から、scrape_candidate_pageと同じ形式の求職者情報を取得する関数
+
+    別プロセスで実行するため、モジュールの最上位に定義しています。
+
+    Args:
+        task (tuple): (URL, HTMLファイルのパス, 取得日時のUNIX時刻)
+
+    Returns:
+        dict: 取得した求職者情報。取得できなかった場合はerrorを含む辞書
+    """
+    url, path, fetched_at = task
+    scraped_at = datetime.fromtimestamp(fetched_at).strftime("%Y-%m-%d %H:%M:%S")
+
+    try:
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rb") as f:
+            html = f.read()
+
+        candidate_info = extract_candidate_from_html(html)
+        if candidate_info is None:
+            return {"url": url, "error": "HTMLから氏名を取得できませんでした", "scraped_at": scraped_at}
+
+        candidate_info["url"] = url
+        candidate_info["scraped_at"] = scraped_at
+        return candidate_info
+
+    except Exception as e:
+        return {"url": url, "error": str(e), "scraped_at": scraped_at}
+
+
+def reparse(tasks, sink, processes=None, chunksize=64):
+    """
+    保存したHTMLから求職者情報を複数のプロセスで並列に取得し直す関数
+
+    ブラウザやネットワークを使わないため、セレクターを変更した後に大量のページを短時間で取得し直せます。
+
+    Args:
+        tasks (iterable): iter_html_dirまたはiter_snapshotsが返すタスク
+        sink (JsonlSink): 取得した情報をタスクの順序で1件ずつ書き出すシンク
+        processes (int, optional): 使用するプロセス数。Noneの場合はCPUのコア数
+        chunksize (int): 1回にまとめて各プロセスへ渡すタスク数
+
+    Returns:
+        tuple: (取得できた件数, 取得できなかった件数)
+    """
+    succeeded = 0
+    failed = 0
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        for candidate in executor.map(reparse_file, tasks, chunksize=chunksize):
+            sink.write(candidate)
+            if "error" in candidate:
+                failed += 1
+            else:
+                succeeded += 1
+
+    return succeeded, failed
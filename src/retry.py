@@ -0,0 +1,231 @@
+import time
+import random
+import threading
+from collections import deque
+from errors import TRANSIENT, SESSION, STRUCTURE, THROTTLED, UNKNOWN
+
+
+class RetryPolicy:
+    """エラーの分類ごとの再試行の方針（ジッター付きの指数バックオフ）"""
+
+    def __init__(self, max_attempts, base_delay=1.0, max_delay=60.0):
+        """
+        再試行方針の初期化
+
+        Args:
+            max_attempts (int): 最初の試行を含む最大の試行回数（1の場合は再試行しない）
+            base_delay (float): 1回目の再試行前の待機時間の基準（秒）
+            max_delay (float): 待機時間の上限（秒）
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt):
+        """
+        再試行前の待機時間を返す
+
+        base_delay * 2^(attempt-1) を上限で切り詰め、その半分から全体までの範囲でランダムにずらします
+        （複数のワーカーが同時に再試行しないように）。
+
+        Args:
+            attempt (int): 失敗した試行の回数（1から）
+
+        Returns:
+            float: 待機時間（秒）
+        """
+        delay = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(delay / 2, delay)
+
+
+# エラーの分類ごとの標準の再試行方針
+DEFAULT_RETRY_POLICIES = {
+    TRANSIENT: RetryPolicy(max_attempts=4, base_delay=2.0, max_delay=30.0),
+    SESSION: RetryPolicy(max_attempts=2, base_delay=1.0, max_delay=5.0),
+    STRUCTURE: RetryPolicy(max_attempts=2, base_delay=5.0, max_delay=5.0),
+    THROTTLED: RetryPolicy(max_attempts=5, base_delay=30.0, max_delay=600.0),
+    UNKNOWN: RetryPolicy(max_attempts=2, base_delay=2.0, max_delay=10.0)
+}
+
+
+class CircuitBreaker:
+    """失敗が急増したときに実行を一時停止し、見込みのないリクエストでレートを浪費しないためのクラス"""
+
+    def __init__(self, failure_ratio=0.5, window=20, min_calls=10, cooldown=60.0, max_cooldown=900.0):
+        """
+        サーキットブレーカーの初期化
+
+        Args:
+            failure_ratio (float): 直近window件のうち、この割合以上が失敗したら停止する
+            window (int): 失敗の割合を計算する直近の件数
+            min_calls (int): 判定に必要な最低件数
+            cooldown (float): 停止する時間（秒）。停止後の試行が失敗するたびに倍にする
+            max_cooldown (float): 停止する時間の上限（秒）
+        """
+        self.failure_ratio = failure_ratio
+        self.min_calls = min_calls
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.opened = 0
+
+        self._results = deque(maxlen=window)
+        self._current_cooldown = cooldown
+        self._open_until = None
+        self._half_open = False
+        # 停止後に1件だけ通す試行のスレッド（その結果だけで再開するかを判定する）
+        self._probe = None
+        self._announced_until = None
+        self._cond = threading.Condition()
+
+    @property
+    def is_open(self):
+        """停止中ならTrue"""
+        return self._open_until is not None
+
+    def before_call(self):
+        """
+        リクエストの前に呼び出す
+
+        停止中は、全ての呼び出し元が停止時間が過ぎるまで待機します。停止時間が過ぎたら最初の1件だけを試行として通し、
+        他の呼び出し元はその結果が記録されるまで待機します（試行が失敗すれば再び停止時間まで待機します）。
+
+        Returns:
+            float: 待機した時間（秒）
+        """
+        start = time.monotonic()
+        me = threading.get_ident()
+        with self._cond:
+            while True:
+                if self._open_until is not None:
+                    deadline = self._open_until
+                    wait_time = max(0.0, deadline - time.monotonic())
+                    if wait_time > 0 and self._announced_until != deadline:
+                        self._announced_until = deadline
+                        print(f"失敗が続いているため、{wait_time:.0f}秒間停止します")
+
+                    # 停止時間が過ぎるまで、ロックを離して待機する
+                    self._cond.release()
+                    try:
+                        if wait_time > 0:
+                            time.sleep(wait_time)
+                    finally:
+                        self._cond.acquire()
+
+                    if self._open_until == deadline:
+                        # 停止時間が過ぎて最初の呼び出し元が、再開できるかを判定する試行になる
+                        self._open_until = None
+                        self._half_open = True
+                        self._probe = me
+                        return time.monotonic() - start
+                    continue
+
+                if self._half_open and self._probe != me:
+                    # 試行の結果を待つ（試行の結果が停止時間を過ぎても届かなければ、代わりに試行する）
+                    probe = self._probe
+                    if not self._cond.wait(self._current_cooldown) and self._half_open and self._probe == probe:
+                        self._probe = me
+                        return time.monotonic() - start
+                    continue
+
+                return time.monotonic() - start
+
+    def record(self, success):
+        """
+        リクエストの結果を記録する
+
+        停止中・試行中は、試行として通したリクエスト以外の結果（停止前に始まったリクエストなど）は数えません。
+
+        Args:
+            success (bool): 成功した（または停止の判定に含めない失敗の）場合True
+        """
+        with self._cond:
+            if self._half_open:
+                if self._probe != threading.get_ident():
+                    return
+                self._half_open = False
+                self._probe = None
+                if success:
+                    # 再開できたので、停止時間を元に戻す
+                    self._current_cooldown = self.cooldown
+                    self._results.clear()
+                else:
+                    self._current_cooldown = min(self.max_cooldown, self._current_cooldown * 2)
+                    self._trip()
+                self._cond.notify_all()
+                return
+
+            if self._open_until is not None:
+                return
+
+            self._results.append(success)
+            failures = self._results.count(False)
+            if len(self._results) >= self.min_calls and failures / len(self._results) >= self.failure_ratio:
+                self._trip()
+
+    def _trip(self):
+        """停止状態にする"""
+        self._open_until = time.monotonic() + self._current_cooldown
+        self._results.clear()
+        self.opened += 1
+
+
+class RetryHandler:
+    """エラーの分類ごとの方針で再試行し、サーキットブレーカーで失敗の急増を抑えるクラス"""
+
+    def __init__(self, policies=None, breaker=None, on_session_lost=None):
+        """
+        再試行ハンドラーの初期化
+
+        Args:
+            policies (dict, optional): エラーの分類をキーとするRetryPolicy。Noneの場合はDEFAULT_RETRY_POLICIES
+            breaker (CircuitBreaker, optional): 複数のワーカーで共有するサーキットブレーカー
+            on_session_lost (callable, optional): ログインセッションが切れたときに、再試行の前に呼び出す関数
+        """
+        self.policies = DEFAULT_RETRY_POLICIES if policies is None else policies
+        self.breaker = breaker
+        self.on_session_lost = on_session_lost
+
+        # エラーの分類ごとの再試行の回数
+        self.retries = {error_type: 0 for error_type in self.policies}
+
+    def run(self, url, scrape_page):
+        """
+        1ページを取得し、失敗した場合はエラーの分類ごとの方針で再試行する
+
+        Args:
+            url (str): 求職者ページのURL
+            scrape_page (callable): URLを受け取って求職者情報のdict（失敗時はerrorとerror_typeを含む）を返す関数
+
+        Returns:
+            dict: 取得した求職者情報。再試行しても失敗した場合は、試行回数（attempts）を含むエラー情報
+        """
+        attempt = 0
+        while True:
+            if self.breaker:
+                self.breaker.before_call()
+
+            result = scrape_page(url)
+            attempt += 1
+            error_type = result.get("error_type", UNKNOWN) if "error" in result else None
+
+            # ページの構造の変更はアクセスを止めても解決しないため、停止の判定に含めない
+            if self.breaker:
+                self.breaker.record(error_type in (None, STRUCTURE))
+
+            if error_type is None:
+                return result
+
+            policy = self.policies.get(error_type)
+            if policy is None or attempt >= policy.max_attempts:
+                result["attempts"] = attempt
+                return result
+
+            if error_type == SESSION and self.on_session_lost:
+                self.on_session_lost()
+
+            delay = policy.delay(attempt)
+            if result.get("retry_after"):
+                delay = max(delay, result["retry_after"])
+
+            self.retries[error_type] += 1
+            time.sleep(delay)
@@ -0,0 +1,164 @@
+import os
+import json
+import base64
+import hashlib
+import time
+import tempfile
+from cryptography.fernet import Fernet, InvalidToken
+from http_fetcher import HttpFetcher
+
+
+# 鍵の導出に使うPBKDF2の反復回数
+KDF_ITERATIONS = 200000
+
+
+class SessionCache:
+    """ログイン済みのセッション（Cookieとローカルストレージ）を暗号化してファイルに保存するクラス"""
+
+    def __init__(self, path, secret, max_age_hours=12, probe_url="https://www.bizreach.jp/company/dashboard"):
+        """
+        セッションキャッシュの初期化
+
+        Args:
+            path (str): セッションファイルのパス
+            secret (str): 暗号化に使う秘密の文字列（パスワードなど）
+            max_age_hours (float): 保存したセッションを再利用する最大時間（時間）
+            probe_url (str): セッションが有効かを確認するためにアクセスするURL
+        """
+        self.path = path
+        self.secret = secret
+        self.max_age_hours = max_age_hours
+        self.probe_url = probe_url
+
+    def _fernet(self, salt):
+        """ソルトと秘密の文字列から暗号化用のオブジェクトを生成する"""
+        key = hashlib.pbkdf2_hmac("sha256", self.secret.encode("utf-8"), salt, KDF_ITERATIONS)
+        return Fernet(base64.urlsafe_b64encode(key))
+
+    def save(self, scraper):
+        """
+        ログイン済みのブラウザのセッションを保存する
+
+        Args:
+            scraper (BizreachScraper): ログイン済みのスクレイパー
+
+        Returns:
+            bool: 保存成功ならTrue、失敗ならFalse
+        """
+        try:
+            session = {
+                "saved_at": time.time(),
+                "cookies": scraper.get_cookies(),
+                "local_storage": scraper.get_local_storage(),
+                "user_agent": scraper.driver.execute_script("return navigator.userAgent")
+            }
+
+            salt = os.urandom(16)
+            token = self._fernet(salt).encrypt(json.dumps(session, ensure_ascii=False).encode("utf-8"))
+            content = json.dumps({
+                "salt": base64.b64encode(salt).decode("ascii"),
+                "token": token.decode("ascii")
+            })
+
+            # 一時ファイル経由で置き換える（mkstempは本人だけが読める権限で、書き込みごとに別の名前で作成するため、
+            # 複数のワーカーが同時に保存しても互いの書きかけのファイルを置き換えない）
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(prefix=os.path.basename(self.path) + ".", suffix=".tmp", dir=directory)
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(content)
+                os.replace(temp_path, self.path)
+            except BaseException:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
+
+            return True
+
+        except Exception as e:
+            print(f"セッションの保存中にエラーが発生しました: {str(e)}")
+            return False
+
+    def load(self):
+        """
+        保存したセッションを読み込む
+
+        Returns:
+            dict: セッション情報。ファイルがない、復号できない、期限切れの場合はNone
+        """
+        if not os.path.exists(self.path):
+            return None
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                content = json.load(f)
+
+            salt = base64.b64decode(content["salt"])
+            session = json.loads(self._fernet(salt).decrypt(content["token"].encode("ascii")))
+        except (ValueError, KeyError, InvalidToken):
+            return None
+
+        if time.time() - session["saved_at"] > self.max_age_hours * 3600:
+            return None
+
+        return session
+
+    def probe(self, session):
+        """
+        保存したセッションがまだ有効かを、ブラウザを使わないHTTPリクエスト1回で確認する
+
+        Args:
+            session (dict): load()で読み込んだセッション情報
+
+        Returns:
+            bool: 有効ならTrue（ログインページへリダイレクトされなければ有効とみなす）
+        """
+        fetcher = HttpFetcher(session["cookies"], session.get("user_agent"), pool_size=1, timeout=10)
+        try:
+            response = fetcher.session.get(self.probe_url, timeout=fetcher.timeout, allow_redirects=False)
+            return response.status_code == 200
+        except Exception:
+            return False
+        finally:
+            fetcher.close()
+
+    def restore(self, scraper, session):
+        """
+        保存したセッションをブラウザに復元する
+
+        Args:
+            scraper (BizreachScraper): ブラウザを起動済みのスクレイパー
+            session (dict): load()で読み込んだセッション情報
+        """
+        scraper.add_cookies(session["cookies"])
+        scraper.set_local_storage(session.get("local_storage", {}))
+
+    def login(self, scraper, username, password):
+        """
+        有効なセッションが保存されていれば復元し、なければログインしてセッションを保存する
+
+        Args:
+            scraper (BizreachScraper): ブラウザを起動済みのスクレイパー
+            username (str): ログイン用ユーザー名/メールアドレス
+            password (str): パスワード
+
+        Returns:
+            bool: ログイン済みの状態になればTrue、ログインに失敗すればFalse
+        """
+        session = self.load()
+        if session and self.probe(session):
+            self.restore(scraper, session)
+            print("保存したセッションを再利用します（ログインを省略）")
+            return True
+
+        if not scraper.login(username, password):
+            return False
+
+        self.save(scraper)
+        return True
+
+    def clear(self):
+        """保存したセッションを削除する"""
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,238 @@
+import os
+import gzip
+import time
+import sqlite3
+import hashlib
+import threading
+from utils import extract_candidate_id
+
+
+class SnapshotStore:
+    """求職者ページのHTMLを圧縮して保存し、内容のハッシュで重複を排除するスナップショットストア"""
+
+    def __init__(self, directory):
+        """
+        スナップショットストアの初期化
+
+        Args:
+            directory (str): 保存先のディレクトリ（HTMLはobjects/以下、索引はindex.sqlite3に保存）
+        """
+        self.directory = directory
+        self.objects_dir = os.path.join(directory, "objects")
+        os.makedirs(self.objects_dir, exist_ok=True)
+
+        # 複数のワーカーから使えるよう、1つの接続をロックで保護して共有する
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(os.path.join(directory, "index.sqlite3"), check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS snapshots (
+                candidate_id TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                url TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                PRIMARY KEY (candidate_id, content_hash)
+            );
+            CREATE INDEX IF NOT EXISTS idx_snapshots_fetched_at ON snapshots (candidate_id, fetched_at);
+            CREATE INDEX IF NOT EXISTS idx_snapshots_content_hash ON snapshots (content_hash);
+            CREATE TABLE IF NOT EXISTS objects (
+                content_hash TEXT PRIMARY KEY,
+                size INTEGER NOT NULL
+            );
+        """)
+        self._conn.commit()
+
+    def object_path(self, content_hash):
+        """ハッシュに対応する圧縮HTMLのパスを返す"""
+        return os.path.join(self.objects_dir, content_hash[:2], content_hash + ".html.gz")
+
+    def save(self, url, html, fetched_at=None):
+        """
+        ページのHTMLを保存する（同じ内容のHTMLは1つだけ保存し、取得日時だけを更新する）
+
+        Args:
+            url (str): 求職者ページのURL
+            html (str): ページのHTML
+            fetched_at (float, optional): 取得日時（UNIX時刻）。Noneの場合は現在時刻
+
+        Returns:
+            str: 内容のハッシュ（SHA-256）
+        """
+        data = html.encode("utf-8")
+        content_hash = hashlib.sha256(data).hexdigest()
+        fetched_at = time.time() if fetched_at is None else fetched_at
+
+        with self._lock:
+            exists = self._conn.execute(
+                "SELECT 1 FROM objects WHERE content_hash = ?", (content_hash,)
+            ).fetchone()
+
+            if not exists:
+                path = self.object_path(content_hash)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                compressed = gzip.compress(data)
+                with open(path + ".tmp", "wb") as f:
+                    f.write(compressed)
+                os.replace(path + ".tmp", path)
+                self._conn.execute(
+                    "INSERT INTO objects (content_hash, size) VALUES (?, ?)", (content_hash, len(compressed))
+                )
+
+            self._conn.execute(
+                "INSERT OR REPLACE INTO snapshots (candidate_id, content_hash, url, fetched_at) VALUES (?, ?, ?, ?)",
+                (extract_candidate_id(url), content_hash, url, fetched_at)
+            )
+            self._conn.commit()
+
+        return content_hash
+
+    def load(self, content_hash):
+        """
+        保存したHTMLを読み込む
+
+        Args:
+            content_hash (str): 内容のハッシュ
+
+        Returns:
+            str: ページのHTML
+        """
+        with gzip.open(self.object_path(content_hash), "rb") as f:
+            return f.read().decode("utf-8")
+
+    def latest(self, url):
+        """
+        求職者の最新のスナップショットの情報を返す
+
+        Args:
+            url (str): 求職者ページのURL
+
+        Returns:
+            dict: content_hash, url, fetched_atを持つ辞書。スナップショットがなければNone
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content_hash, url, fetched_at FROM snapshots WHERE candidate_id = ? "
+                "ORDER BY fetched_at DESC LIMIT 1",
+                (extract_candidate_id(url),)
+            ).fetchone()
+
+        if row is None:
+            return None
+        return {"content_hash": row[0], "url": row[1], "fetched_at": row[2]}
+
+    def get_fresh(self, url, max_age_seconds):
+        """
+        指定した時間以内に取得したスナップショットがあれば、そのHTMLを返す
+
+        Args:
+            url (str): 求職者ページのURL
+            max_age_seconds (float): 再利用できる最大の経過時間（秒）
+
+        Returns:
+            str: ページのHTML。新しいスナップショットがなければNone
+        """
+        snapshot = self.latest(url)
+        if snapshot is None or time.time() - snapshot["fetched_at"] > max_age_seconds:
+            return None
+        return self.load(snapshot["content_hash"])
+
+    def iter_latest(self):
+        """
+        求職者ごとの最新のスナップショットを返すジェネレーター（オフラインでの再取得用）
+
+        Yields:
+            dict: content_hash, url, fetched_atを持つ辞書
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT content_hash, url, MAX(fetched_at) FROM snapshots GROUP BY candidate_id"
+            ).fetchall()
+
+        for content_hash, url, fetched_at in rows:
+            yield {"content_hash": content_hash, "url": url, "fetched_at": fetched_at}
+
+    def total_size(self):
+        """
+        保存している圧縮HTMLの合計サイズを返す
+
+        Returns:
+            int: 合計サイズ（バイト）
+        """
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM objects").fetchone()[0]
+
+    def prune(self, max_bytes=None, max_age_days=None):
+        """
+        古いスナップショットを削除する
+
+        max_age_daysより古いものを削除した後、合計サイズがmax_bytes以下になるまで古い順に削除します。
+
+        Args:
+            max_bytes (int, optional): 保存する圧縮HTMLの合計サイズの上限（バイト）
+            max_age_days (float, optional): 保存する最大の経過日数
+
+        Returns:
+            int: 削除したスナップショットの数
+        """
+        removed = 0
+
+        with self._lock:
+            if max_age_days is not None:
+                cutoff = time.time() - max_age_days * 86400
+                removed += self._conn.execute("DELETE FROM snapshots WHERE fetched_at < ?", (cutoff,)).rowcount
+
+            if max_bytes is not None:
+                rows = self._conn.execute(
+                    "SELECT s.rowid, s.fetched_at, s.content_hash, o.size FROM snapshots AS s "
+                    "JOIN objects AS o ON o.content_hash = s.content_hash ORDER BY s.fetched_at, s.rowid"
+                ).fetchall()
+
+                # HTMLは最後に参照しているスナップショットを削除したときに解放されるため、参照数を数えながら古い順に決める
+                references = {}
+                total = 0
+                for _, _, content_hash, size in rows:
+                    if content_hash not in references:
+                        references[content_hash] = 0
+                        total += size
+                    references[content_hash] += 1
+
+                last = None
+                for row in rows:
+                    if total <= max_bytes:
+                        break
+                    last = row
+                    references[row[2]] -= 1
+                    if references[row[2]] == 0:
+                        total -= row[3]
+
+                if last is not None:
+                    # 古い順に並べたlastまでのスナップショットを、1回のDELETEで削除する
+                    removed += self._conn.execute(
+                        "DELETE FROM snapshots WHERE fetched_at < ? OR (fetched_at = ? AND rowid <= ?)",
+                        (last[1], last[1], last[0])
+                    ).rowcount
+
+            self._remove_orphans()
+            self._conn.commit()
+
+        return removed
+
+    def _remove_orphans(self):
+        """どのスナップショットからも参照されなくなったHTMLを削除し、削除したサイズを返す"""
+        orphans = self._conn.execute(
+            "SELECT content_hash, size FROM objects AS o WHERE NOT EXISTS "
+            "(SELECT 1 FROM snapshots AS s WHERE s.content_hash = o.content_hash)"
+        ).fetchall()
+
+        for content_hash, _ in orphans:
+            path = self.object_path(content_hash)
+            if os.path.exists(path):
+                os.remove(path)
+        self._conn.executemany(
+            "DELETE FROM objects WHERE content_hash = ?", [(content_hash,) for content_hash, _ in orphans]
+        )
+
+        return sum(size for _, size in orphans)
+
+    def close(self):
+        """索引のデータベースを閉じる"""
+        self._conn.close()
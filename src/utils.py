@@ -1,39 +1,192 @@
 import os
+import re
+import csv
+import gzip
 import json
+import math
+import hashlib
 from datetime import datetime
+from urllib.parse import urlsplit, urlunsplit
+from fake_pages import render_candidate_html
+
+
+# 求職者ページのURLから求職者IDを取り出すパターン
+CANDIDATE_ID_PATTERN = re.compile(r"/candidates/([^/?#]+)")
+
+# 求職者IDから求職者ページのURLを組み立てるテンプレート
+CANDIDATE_URL_TEMPLATE = "https://www.bizreach.jp/company/candidates/{}"
+
+# URLリストファイルとして読み込める形式
+URL_LIST_EXTENSIONS = ('.txt', '.csv', '.jsonl', '.json')
+
+
+class BloomFilter:
+    """少ないメモリで大量の値の重複を判定するブルームフィルター（まれに未登録の値を登録済みと誤判定します）"""
+    
+    def __init__(self, capacity, error_rate=0.001):
+        """
+        ブルームフィルターの初期化
+        
+        Args:
+            capacity (int): 登録する値の想定件数
+            error_rate (float): 想定件数まで登録したときの誤判定率
+        """
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+    
+    def _positions(self, value):
+        """値に対応するビットの位置を返す（2つのハッシュ値の組み合わせで必要な数の位置を作る）"""
+        digest = hashlib.blake2b(value.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+    
+    def add(self, value):
+        """
+        値を登録する
+        
+        Args:
+            value (str): 登録する値
+            
+        Returns:
+            bool: 新しく登録した場合True、登録済み（と判定された）場合False
+        """
+        added = False
+        for position in self._positions(value):
+            byte, bit = divmod(position, 8)
+            if not self._bits[byte] & (1 << bit):
+                self._bits[byte] |= 1 << bit
+                added = True
+        return added
+    
+    def __contains__(self, value):
+        return all(self._bits[position // 8] & (1 << (position % 8)) for position in self._positions(value))
+
+
+class UrlStream:
+    """URLリストファイルを1行ずつ読み込み、検証・正規化・重複排除しながらURLを返すクラス"""
+    
+    def __init__(self, file_path, bloom_capacity=None, error_rate=0.001):
+        """
+        URLストリームの初期化
+        
+        Args:
+            file_path (str): URLリストが記載されたファイルのパス（.txt, .csv, .jsonl, .json。gzip圧縮した.gzも可）
+            bloom_capacity (int, optional): 指定した場合、求職者IDの重複判定にこの件数を想定したブルームフィルターを使う。
+                                           Noneの場合はセットで正確に判定する
+            error_rate (float): ブルームフィルターの誤判定率
+        """
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"URLリストファイルが見つかりません: {file_path}")
+        
+        self.file_path = file_path
+        self.compressed = file_path.lower().endswith('.gz')
+        self.file_ext = os.path.splitext(file_path[:-3] if self.compressed else file_path)[1].lower()
+        
+        if self.file_ext not in URL_LIST_EXTENSIONS:
+            raise ValueError(f"サポートされていないファイル形式です: {self.file_ext}")
+        
+        self.bloom_capacity = bloom_capacity
+        self.error_rate = error_rate
+        
+        # 直近の読み込みでの件数（返したURL、無効なURL、重複したURL）
+        self.count = 0
+        self.invalid = 0
+        self.duplicates = 0
+    
+    def _open(self):
+        """URLリストファイルをテキストとして開く"""
+        if self.compressed:
+            return gzip.open(self.file_path, 'rt', encoding='utf-8')
+        return open(self.file_path, 'r', encoding='utf-8')
+    
+    def _iter_raw(self, f):
+        """ファイルの形式に応じて、正規化前のURLを1件ずつ返す"""
+        if self.file_ext == '.json':
+            # JSONは1行ずつ読めないため、全体を読み込む（大きなリストには.jsonlを使用）
+            data = json.load(f)
+            if isinstance(data, dict) and 'urls' in data:
+                data = data['urls']
+            if not isinstance(data, list):
+                raise ValueError("JSONファイルの形式が正しくありません。リストまたは'urls'キーを持つ辞書である必要があります。")
+            yield from data
+        
+        elif self.file_ext == '.jsonl':
+            # 1行に1つのURL文字列、または'url'キーを持つオブジェクト
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    item = json.loads(line)
+                except ValueError:
+                    yield line
+                    continue
+                yield item.get('url', '') if isinstance(item, dict) else item
+        
+        elif self.file_ext == '.csv':
+            # 'url'列があればその列、なければ1列目を使う
+            url_column = 0
+            for i, row in enumerate(csv.reader(f)):
+                if not row or row[0].strip().startswith('#'):
+                    continue
+                if i == 0:
+                    header = [cell.strip().lower() for cell in row]
+                    if 'url' in header:
+                        url_column = header.index('url')
+                        continue
+                yield row[url_column] if url_column < len(row) else ''
+        
+        else:
+            # 空白行と#で始まるコメント行を除外
+            for line in f:
+                if line.strip() and not line.strip().startswith('#'):
+                    yield line
+    
+    def __iter__(self):
+        """
+        有効で重複のないURLを、求職者ページの正規のURLにして1件ずつ返す
+        
+        Yields:
+            str: 正規化したURL
+        """
+        self.count = 0
+        self.invalid = 0
+        self.duplicates = 0
+        seen = BloomFilter(self.bloom_capacity, self.error_rate) if self.bloom_capacity else set()
+        
+        with self._open() as f:
+            for url in self._iter_raw(f):
+                url = url.strip() if isinstance(url, str) else ''
+                if not validate_url(url):
+                    self.invalid += 1
+                    continue
+                
+                url = canonicalize_url(url)
+                candidate_id = extract_candidate_id(url)
+                if candidate_id in seen:
+                    self.duplicates += 1
+                    continue
+                seen.add(candidate_id)
+                
+                self.count += 1
+                yield url
+
 
 def load_url_list(file_path):
     """
     URLリストをファイルから読み込む関数
     
+    無効なURLと重複したURLは除外されます。大きなファイルはUrlStreamで1件ずつ読み込んでください。
+    
     Args:
-        file_path (str): URLリストが記載されたファイルのパス (.txt, .csv, .json)
+        file_path (str): URLリストが記載されたファイルのパス (.txt, .csv, .jsonl, .json, .gz)
         
     Returns:
         list: URLのリスト
     """
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"URLリストファイルが見つかりません: {file_path}")
-    
-    file_ext = os.path.splitext(file_path)[1].lower()
-    
-    if file_ext == '.json':
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            if isinstance(data, list):
-                return data
-            elif isinstance(data, dict) and 'urls' in data:
-                return data['urls']
-            else:
-                raise ValueError("JSONファイルの形式が正しくありません。リストまたは'urls'キーを持つ辞書である必要があります。")
-    
-    elif file_ext in ['.txt', '.csv']:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            # 行ごとに読み込み、空白行と#で始まるコメント行を除外
-            return [line.strip() for line in f if line.strip() and not line.strip().startswith('#')]
-    
-    else:
-        raise ValueError(f"サポートされていないファイル形式です: {file_ext}")
+    return list(UrlStream(file_path))
 
 
 def validate_url(url):
@@ -53,6 +206,39 @@ def validate_url(url):
     )
 
 
+def extract_candidate_id(url):
+    """
+    求職者ページのURLから求職者IDを取り出す関数
+    
+    Args:
+        url (str): 求職者ページのURL（例: https://www.bizreach.jp/company/candidates/12345）
+        
+    Returns:
+        str: 求職者ID。URLの形式が異なる場合は、クエリと末尾のスラッシュを除いたURL
+    """
+    match = CANDIDATE_ID_PATTERN.search(url)
+    if match:
+        return match.group(1)
+    return url.split("?", 1)[0].split("#", 1)[0].rstrip("/")
+
+
+def canonicalize_url(url):
+    """
+    同じ求職者のURLを1つの形にそろえる関数
+    
+    URLのスキーム・ホスト・パスはそのままに、ホストを小文字にし、クエリ文字列、フラグメント、末尾のスラッシュを除きます。
+    重複の判定には、このURLではなくextract_candidate_id()の求職者IDを使います。
+    
+    Args:
+        url (str): 求職者ページのURL
+        
+    Returns:
+        str: 正規化したURL
+    """
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"), "", ""))
+
+
 def create_output_filename(base_name, extension, timestamp=True):
     """
     タイムスタンプ付きの出力ファイル名を生成する関数
@@ -127,3 +313,18 @@ def generate_mock_candidate_data(url="https://www.bizreach.jp/company/candidates
             }
         ]
     }
+
+
+def generate_mock_candidate_html(candidate=None):
+    """
+    テスト用に、求職者情報から求職者ページと同じ構造のHTMLを生成する関数
+    
+    Args:
+        candidate (dict, optional): 求職者情報。Noneの場合はgenerate_mock_candidate_data()の値を使用
+        
+    Returns:
+        str: 求職者ページのHTML
+    """
+    if candidate is None:
+        candidate = generate_mock_candidate_data()
+    return render_candidate_html(candidate)
@@ -0,0 +1,421 @@
+import os
+import time
+import uuid
+import socket
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+
+
+# 作業キューの各URLの状態
+#   pending: 取得待ち（期限切れのリースや、再試行するエラーもここに戻る）
+#   leased: ワーカーが借りて取得中
+#   done: 取得済み（試行回数の上限に達したエラーを含む）
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS tasks (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        url TEXT NOT NULL UNIQUE,
+        priority INTEGER NOT NULL DEFAULT 0,
+        status TEXT NOT NULL DEFAULT 'pending',
+        lease_id TEXT,
+        worker TEXT,
+        lease_expires REAL,
+        attempts INTEGER NOT NULL DEFAULT 0,
+        result TEXT,
+        error TEXT,
+        finished_at REAL
+    );
+    CREATE INDEX IF NOT EXISTS idx_tasks_pending ON tasks (status, priority DESC, seq);
+    CREATE INDEX IF NOT EXISTS idx_tasks_lease ON tasks (lease_id);
+"""
+
+
+class WorkQueue(ABC):
+    """
+    複数のワーカー（マシン・プロセス）で1つのURLリストを分担する作業キューのインターフェース
+
+    ワーカーはURLをまとめて一定時間借り（リース）、取得中は期限を延長し、取得したURLごとに完了を記録します。
+    期限が切れたリース（ワーカーの異常終了など）のURLは、別のワーカーが借りられるようにキューに戻ります。
+    SqliteWorkQueueが標準の実装で、別の保存先を使う場合はこのクラスを継承して抽象メソッドを全て実装します。
+    """
+
+    @abstractmethod
+    def enqueue(self, urls, priority=0):
+        """
+        URLをキューに追加する（キューにあるURLは追加しない）
+
+        Args:
+            urls (iterable): 追加するURL
+            priority (int): 優先度（大きいほど先に取得される）
+
+        Returns:
+            int: 追加したURLの件数
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def lease(self, worker_id, batch_size, lease_seconds, max_attempts=3):
+        """
+        取得待ちのURLを優先度の高い順に借りる（期限切れのリースのURLも含む）
+
+        Args:
+            worker_id (str): ワーカーの識別子
+            batch_size (int): 借りるURLの最大件数
+            lease_seconds (float): リースの期限（秒）
+            max_attempts (int): 1つのURLを試行する最大回数（期限切れが繰り返されたURLはエラーとして完了にする）
+
+        Returns:
+            tuple: (リースID, URLのリスト)。取得待ちのURLがなければURLは空のリスト
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def renew(self, lease_id, lease_seconds):
+        """
+        リースの期限を延長する（ハートビート）
+
+        Args:
+            lease_id (str): リースID
+            lease_seconds (float): 現在からの新しい期限（秒）
+
+        Returns:
+            int: 期限を延長したURLの件数（0の場合はリースが切れて他のワーカーに渡っている）
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def complete(self, lease_id, url, error=None, max_attempts=3):
+        """
+        借りたURLの取得の完了を記録する
+
+        Args:
+            lease_id (str): リースID
+            url (str): 取得したURL
+            error (str, optional): 取得に失敗した場合のエラー。試行回数がmax_attempts未満ならキューに戻す
+            max_attempts (int): 1つのURLを試行する最大回数
+
+        Returns:
+            bool: 記録できた場合True（リースが切れていた場合はFalse）
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def release(self, lease_id):
+        """
+        リースを返却し、未完了のURLをすぐにキューに戻す（ワーカーの中断時など）
+
+        Args:
+            lease_id (str): リースID
+
+        Returns:
+            int: キューに戻したURLの件数
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def counts(self):
+        """
+        状態ごとのURLの件数を返す
+
+        Returns:
+            dict: {"pending": 件数, "leased": 件数, "done": 件数, "error": 件数}（errorはdoneのうちのエラー）
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def is_done(self, url):
+        """
+        URLが正常に取得済みかを返す（どのワーカーが取得したかは問わない）
+
+        Args:
+            url (str): 確認するURL
+
+        Returns:
+            bool: 正常に取得済みならTrue（エラーとして完了したURLはFalse）
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """キューを閉じる"""
+
+
+class SqliteWorkQueue(WorkQueue):
+    """
+    SQLiteファイルを使う作業キュー
+
+    リースは1つのトランザクションで借りるため、同じファイルを開いた複数のプロセスが同じURLを借りることはありません。
+    WALモードで開くため、ファイルは同じマシンのプロセス間、またはファイルロックが正しく動作するファイルシステムで共有してください。
+    """
+
+    def __init__(self, path, timeout=30):
+        """
+        作業キューの初期化
+
+        Args:
+            path (str): SQLiteデータベースファイルのパス（なければ作成）
+            timeout (float): 他のワーカーの書き込みを待つ最大時間（秒）
+        """
+        self.path = path
+        self.reclaimed = 0
+
+        # ハートビートのスレッドからも使えるよう、1つの接続をロックで保護して共有する
+        # （トランザクションはBEGIN IMMEDIATEで明示的に開始する）
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=timeout, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def _transaction(self, work):
+        """書き込みのロックを取ってからworkを実行し、コミットする（失敗した場合はロールバック）"""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                result = work()
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+            return result
+
+    def enqueue(self, urls, priority=0, batch_size=1000):
+        """
+        URLをキューに追加する（キューにあるURLは追加しない）
+
+        Args:
+            urls (iterable): 追加するURL（UrlStreamなど、1件ずつ読みながら追加する）
+            priority (int): 優先度（大きいほど先に取得される）
+            batch_size (int): この件数ごとに1つのトランザクションで書き込む
+
+        Returns:
+            int: 追加したURLの件数
+        """
+        def insert(batch):
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO tasks (url, priority) VALUES (?, ?)", [(url, priority) for url in batch]
+            )
+            return self._conn.total_changes - before
+
+        added = 0
+        batch = []
+        for url in urls:
+            batch.append(url)
+            if len(batch) >= batch_size:
+                added += self._transaction(lambda: insert(batch))
+                batch = []
+        if batch:
+            added += self._transaction(lambda: insert(batch))
+        return added
+
+    def lease(self, worker_id, batch_size, lease_seconds, max_attempts=3):
+        """
+        取得待ちのURLを優先度の高い順に借りる（先に期限切れのリースをキューに戻す）
+
+        Args:
+            worker_id (str): ワーカーの識別子
+            batch_size (int): 借りるURLの最大件数
+            lease_seconds (float): リースの期限（秒）
+            max_attempts (int): 期限切れのURLを戻すときの試行回数の上限（超えたURLはエラーとして完了にする）
+
+        Returns:
+            tuple: (リースID, URLのリスト)。取得待ちのURLがなければURLは空のリスト
+        """
+        lease_id = uuid.uuid4().hex
+
+        def take():
+            now = time.time()
+            # ワーカーの異常終了などで期限が切れたリースを戻す（繰り返し期限切れになるURLは諦める）
+            cursor = self._conn.execute(
+                "UPDATE tasks SET status = CASE WHEN attempts >= ? THEN 'done' ELSE 'pending' END, "
+                "result = CASE WHEN attempts >= ? THEN 'error' ELSE NULL END, "
+                "error = CASE WHEN attempts >= ? THEN 'リースの期限切れが繰り返されました' ELSE error END, "
+                "lease_id = NULL WHERE status = 'leased' AND lease_expires < ?",
+                (max_attempts, max_attempts, max_attempts, now)
+            )
+            self.reclaimed += cursor.rowcount
+
+            rows = self._conn.execute(
+                "SELECT seq, url FROM tasks WHERE status = 'pending' ORDER BY priority DESC, seq LIMIT ?",
+                (batch_size,)
+            ).fetchall()
+            self._conn.executemany(
+                "UPDATE tasks SET status = 'leased', lease_id = ?, worker = ?, lease_expires = ?, "
+                "attempts = attempts + 1 WHERE seq = ?",
+                [(lease_id, worker_id, now + lease_seconds, seq) for seq, _ in rows]
+            )
+            return [url for _, url in rows]
+
+        return lease_id, self._transaction(take)
+
+    def renew(self, lease_id, lease_seconds):
+        return self._transaction(lambda: self._conn.execute(
+            "UPDATE tasks SET lease_expires = ? WHERE lease_id = ? AND status = 'leased'",
+            (time.time() + lease_seconds, lease_id)
+        ).rowcount)
+
+    def complete(self, lease_id, url, error=None, max_attempts=3):
+        if error is None:
+            statement = ("UPDATE tasks SET status = 'done', result = 'ok', error = NULL, lease_id = NULL, "
+                         "finished_at = ? WHERE url = ? AND lease_id = ? AND status = 'leased'")
+            params = (time.time(), url, lease_id)
+        else:
+            # 試行回数が上限に達するまでは、キューに戻して別のワーカー（または後で自分）が取得し直す
+            statement = ("UPDATE tasks SET status = CASE WHEN attempts >= ? THEN 'done' ELSE 'pending' END, "
+                         "result = CASE WHEN attempts >= ? THEN 'error' ELSE NULL END, error = ?, "
+                         "lease_id = NULL, finished_at = ? WHERE url = ? AND lease_id = ? AND status = 'leased'")
+            params = (max_attempts, max_attempts, error, time.time(), url, lease_id)
+        return self._transaction(lambda: self._conn.execute(statement, params).rowcount) == 1
+
+    def release(self, lease_id):
+        return self._transaction(lambda: self._conn.execute(
+            "UPDATE tasks SET status = 'pending', lease_id = NULL, attempts = attempts - 1 "
+            "WHERE lease_id = ? AND status = 'leased'",
+            (lease_id,)
+        ).rowcount)
+
+    def counts(self):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, result = 'error', COUNT(*) FROM tasks GROUP BY status, result = 'error'"
+            ).fetchall()
+        counts = {PENDING: 0, LEASED: 0, DONE: 0, "error": 0}
+        for status, is_error, count in rows:
+            counts[status] += count
+            if is_error:
+                counts["error"] += count
+        return counts
+
+    def is_done(self, url):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM tasks WHERE url = ? AND status = 'done' AND result = 'ok'", (url,)
+            ).fetchone()
+        return row is not None
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def create_work_queue(location):
+    """
+    保存先の指定から作業キューを生成する
+
+    Args:
+        location (str): SQLiteファイルのパス（"sqlite:///path"の形式も可）
+
+    Returns:
+        WorkQueue: 作業キュー
+    """
+    if location.startswith("sqlite:///"):
+        return SqliteWorkQueue(location[len("sqlite:///"):])
+    if "://" in location:
+        raise ValueError(f"サポートされていない作業キューです: {location}")
+    return SqliteWorkQueue(location)
+
+
+def default_worker_id():
+    """ホスト名とプロセスIDからワーカーの識別子を生成する"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class QueueFeed:
+    """
+    作業キューからURLを借りながら1件ずつ返し、取得結果をキューに記録するクラス
+
+    scrape_multiple_candidatesのurl_listとcheckpointの両方に渡して使います。
+    借りている間は、バックグラウンドのスレッドが一定間隔でリースの期限を延長します。
+    """
+
+    def __init__(self, queue, worker_id=None, batch_size=20, lease_seconds=300, max_attempts=3):
+        """
+        Args:
+            queue (WorkQueue): 作業キュー
+            worker_id (str, optional): ワーカーの識別子。Noneの場合はホスト名とプロセスID
+            batch_size (int): 1回に借りるURLの件数
+            lease_seconds (float): リースの期限（秒）。期限の1/3ごとに延長する
+            max_attempts (int): 1つのURLを試行する最大回数
+        """
+        self.queue = queue
+        self.worker_id = worker_id or default_worker_id()
+        self.batch_size = batch_size
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+
+        # URLごとのリースID（完了を記録するまで保持する）
+        self._leases = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._heartbeat = None
+
+        # 完了を記録した件数と、リースが切れていて記録できなかった件数
+        self.completed = 0
+        self.lost = 0
+
+    def __iter__(self):
+        self._start_heartbeat()
+        while True:
+            lease_id, urls = self.queue.lease(self.worker_id, self.batch_size, self.lease_seconds,
+                                              self.max_attempts)
+            if not urls:
+                return
+            with self._lock:
+                for url in urls:
+                    self._leases[url] = lease_id
+            yield from urls
+
+    def _start_heartbeat(self):
+        """リースの期限を延長するスレッドを開始する"""
+        if self._heartbeat:
+            return
+        self._heartbeat = threading.Thread(target=self._renew_loop, daemon=True)
+        self._heartbeat.start()
+
+    def _renew_loop(self):
+        """未完了のURLがあるリースの期限を、期限の1/3ごとに延長する"""
+        while not self._stop.wait(self.lease_seconds / 3):
+            with self._lock:
+                lease_ids = set(self._leases.values())
+            for lease_id in lease_ids:
+                try:
+                    self.queue.renew(lease_id, self.lease_seconds)
+                except Exception as e:
+                    print(f"リースの延長に失敗しました: {str(e)}")
+
+    def record(self, url, candidate):
+        """
+        URLの取得結果をキューに記録する（CheckpointJournal.recordと同じ形式）
+
+        Args:
+            url (str): 取得したURL
+            candidate (dict): scrape_candidate_pageの結果
+        """
+        with self._lock:
+            lease_id = self._leases.pop(url, None)
+        if lease_id is None:
+            return
+
+        if self.queue.complete(lease_id, url, candidate.get("error"), self.max_attempts):
+            self.completed += 1
+        else:
+            self.lost += 1
+
+    def is_done(self, url):
+        """URLが正常に取得済みかを返す（完了はキューに記録されているため、キューに問い合わせる）"""
+        return self.queue.is_done(url)
+
+    def close(self):
+        """ハートビートを止め、未完了のURLをキューに戻す"""
+        self._stop.set()
+        if self._heartbeat:
+            self._heartbeat.join()
+        with self._lock:
+            lease_ids = set(self._leases.values())
+            self._leases = {}
+        for lease_id in lease_ids:
+            self.queue.release(lease_id)
@@ -0,0 +1,198 @@
+import queue
+from collections import deque
+import threading
+import time
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
+
+
+class RateLimiter:
+    """複数のワーカーで共有するリクエスト間隔の制限クラス"""
+
+    def __init__(self, min_interval):
+        """
+        レートリミッターの初期化
+
+        Args:
+            min_interval (float): リクエスト開始間の最小間隔（秒）。全ワーカー合計で適用されます。
+        """
+        self.min_interval = min_interval
+        self._next_time = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        次のリクエストを開始してよい時刻まで待機する
+
+        Returns:
+            float: 実際に待機した時間（秒）
+        """
+        with self._lock:
+            now = time.monotonic()
+            start_time = max(now, self._next_time)
+            self._next_time = start_time + self.min_interval
+
+        wait_time = start_time - now
+        if wait_time > 0:
+            time.sleep(wait_time)
+        return wait_time
+
+
+class WorkerPool:
+    """複数のブラウザセッションで並列にスクレイピングするためのクラス"""
+
+    def __init__(self, scraper_factory, num_workers, min_interval=3):
+        """
+        ワーカープールの初期化
+
+        Args:
+            scraper_factory (callable): BizreachScraperを生成する関数（引数なし）
+            num_workers (int): 同時に動かすブラウザセッション数
+            min_interval (float): 全ワーカー合計でのリクエスト間の最小間隔（秒）
+        """
+        if num_workers < 1:
+            raise ValueError("ワーカー数は1以上である必要があります")
+
+        self.scraper_factory = scraper_factory
+        self.num_workers = num_workers
+        self.rate_limiter = RateLimiter(min_interval)
+        self.scrapers = []
+        self._idle_scrapers = queue.Queue()
+
+        # enable_metrics()で設定される、処理段階ごとの時間の集計
+        self.metrics = None
+
+    @property
+    def primary(self):
+        """ログインを実行した最初のスクレイパー（データの保存に使用）"""
+        return self.scrapers[0] if self.scrapers else None
+
+    def start(self, username, password, session_cache=None):
+        """
+        全ワーカーのブラウザを起動する
+
+        最初のセッションだけがログインし、そのCookieとローカルストレージを他のセッションに共有します。
+
+        Args:
+            username (str): ログイン用ユーザー名/メールアドレス
+            password (str): パスワード
+            session_cache (SessionCache, optional): 保存したセッションを再利用する場合のキャッシュ
+
+        Returns:
+            bool: 全セッションの準備ができればTrue、ログインに失敗すればFalse
+        """
+        primary = self.scraper_factory()
+        primary.start_browser()
+        self.scrapers.append(primary)
+
+        if session_cache:
+            logged_in = session_cache.login(primary, username, password)
+        else:
+            logged_in = primary.login(username, password)
+
+        if not logged_in:
+            return False
+
+        cookies = primary.get_cookies()
+        local_storage = primary.get_local_storage()
+        self._idle_scrapers.put(primary)
+
+        for _ in range(self.num_workers - 1):
+            scraper = self.scraper_factory()
+            scraper.start_browser()
+            scraper.add_cookies(cookies)
+            scraper.set_local_storage(local_storage)
+            self.scrapers.append(scraper)
+            self._idle_scrapers.put(scraper)
+
+        return True
+
+    def enable_metrics(self, metrics):
+        """
+        全ワーカーの処理段階ごとの時間とページ数・エラー数を1つのMetricsに集計する（start()の後に呼び出す）
+
+        Args:
+            metrics (Metrics): 集計先
+        """
+        self.metrics = metrics
+        for scraper in self.scrapers:
+            scraper.enable_metrics(metrics)
+
+    def _timer(self, phase):
+        """処理段階の時間を計測するコンテキストマネージャーを返す（集計しない場合は何もしない）"""
+        return self.metrics.timer(phase) if self.metrics else nullcontext()
+
+    def _scrape_one(self, url):
+        """空いているセッションを1つ借りて1ページをスクレイピングする"""
+        scraper = self._idle_scrapers.get()
+        try:
+            with self._timer("wait"):
+                self.rate_limiter.acquire()
+            return scraper.scrape_candidate_page(url)
+        finally:
+            self._idle_scrapers.put(scraper)
+
+    def _map(self, url_list):
+        """
+        URLを順に読みながら並列にスクレイピングし、入力URLの順序で（入力URL, 結果）を返すジェネレーター
+
+        Executor.mapと異なり、全URLを先に読み込まず、実行中と待機中のURLをワーカー数の2倍までに抑えます。
+        中断（KeyboardInterruptなど）や途中で閉じられた場合は、まだ開始していないURLを取り消し、実行中のページの完了だけを待ちます。
+        """
+        window = deque()
+        with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
+            try:
+                for url in url_list:
+                    window.append((url, executor.submit(self._scrape_one, url)))
+                    if len(window) >= self.num_workers * 2:
+                        url, future = window.popleft()
+                        yield url, future.result()
+
+                while window:
+                    url, future = window.popleft()
+                    yield url, future.result()
+            except BaseException:
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+
+    def scrape_multiple_candidates(self, url_list, sink=None, checkpoint=None):
+        """
+        複数の求職者ページを並列にスクレイピングする
+
+        Args:
+            url_list (iterable): 求職者ページのURL（リストまたはUrlStreamなどのイテラブル）
+            sink (JsonlSink, optional): 指定した場合、取得した情報を入力URLの順序で1件ずつ書き出し、
+                                        メモリには保持しない
+            checkpoint (CheckpointJournal, optional): 指定した場合、各URLの処理結果を記録する
+
+        Returns:
+            list: 取得した求職者情報のリスト（入力URLと同じ順序。sinkを指定した場合は空のリスト）
+        """
+        results = []
+        for url, result in self._map(url_list):
+            if sink:
+                with self._timer("serialize"):
+                    sink.write(result)
+            else:
+                results.append(result)
+
+            if checkpoint:
+                # 単一セッションの場合と同じく、リダイレクトなどで結果のURLが変わっても入力URLで記録する
+                checkpoint.record(url, result)
+
+        # 既存の保存処理をそのまま使えるように、最初のスクレイパーに結果を持たせる
+        self.primary.candidate_data = results
+        return results
+
+    def close(self):
+        """
+        全ワーカーのブラウザを閉じる
+
+        Returns:
+            bool: 1つ以上のブラウザを閉じた場合True
+        """
+        closed = False
+        for scraper in self.scrapers:
+            if scraper.close_browser():
+                closed = True
+        return closed
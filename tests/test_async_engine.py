@@ -0,0 +1,170 @@
+import unittest
+import os
+import sys
+import time
+import asyncio
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# テスト対象のモジュールのパスを追加
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+from async_engine import TokenBucket, AsyncScrapeEngine
+from http_fetcher import HttpFetcher
+from utils import generate_mock_candidate_data, generate_mock_candidate_html
+
+
+class SlowCandidatePageHandler(BaseHTTPRequestHandler):
+    """少し遅れて求職者ページを返し、同時接続数を記録するハンドラー"""
+    
+    lock = threading.Lock()
+    active = 0
+    max_active = 0
+    
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.active += 1
+            cls.max_active = max(cls.max_active, cls.active)
+        
+        try:
+            time.sleep(0.05)
+            if self.path.endswith("/missing"):
+                self.send_response(404)
+                self.end_headers()
+                return
+            
+            candidate_id = self.path.rsplit("/", 1)[1]
+            candidate = generate_mock_candidate_data()
+            candidate["name"] = f"候補者 {candidate_id}"
+            
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.end_headers()
+            self.wfile.write(generate_mock_candidate_html(candidate).encode("utf-8"))
+        finally:
+            with cls.lock:
+                cls.active -= 1
+    
+    def log_message(self, format, *args):
+        pass
+
+
+class TestTokenBucket(unittest.TestCase):
+    """TokenBucketクラスのテストクラス"""
+    
+    def test_acquire_rate(self):
+        """トークンの補充レートが守られるかのテスト"""
+        bucket = TokenBucket(rate=20, capacity=2)
+        
+        async def acquire_all():
+            start = time.monotonic()
+            for _ in range(6):
+                await bucket.acquire()
+            return time.monotonic() - start
+        
+        elapsed = asyncio.run(acquire_all())
+        
+        # 最初の2回はすぐに取得でき、残り4回は1/20秒ごと
+        self.assertGreaterEqual(elapsed, 4 / 20 * 0.9)
+    
+    def test_reuse_across_event_loops(self):
+        """別のasyncio.run()でも、同じトークンバケットを使えるかのテスト"""
+        bucket = TokenBucket(rate=50, capacity=1)
+        
+        async def acquire_concurrently():
+            await asyncio.gather(*(bucket.acquire() for _ in range(3)))
+        
+        asyncio.run(acquire_concurrently())
+        asyncio.run(acquire_concurrently())
+    
+    def test_invalid_rate(self):
+        """不正なレートの指定テスト"""
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestAsyncScrapeEngine(unittest.TestCase):
+    """AsyncScrapeEngineクラスのテストクラス"""
+    
+    @classmethod
+    def setUpClass(cls):
+        """テスト用サーバーの起動"""
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), SlowCandidatePageHandler)
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_port}/company/candidates/"
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """テスト用サーバーの停止"""
+        cls.server.shutdown()
+        cls.server.server_close()
+    
+    def setUp(self):
+        """テスト前の準備"""
+        SlowCandidatePageHandler.max_active = 0
+        self.fetcher = HttpFetcher(pool_size=4)
+        self.urls = [self.base_url + str(i) for i in range(12)]
+    
+    def tearDown(self):
+        """テスト後のクリーンアップ"""
+        self.fetcher.close()
+    
+    def test_run_keeps_order(self):
+        """結果が入力URLの順序で返されるかのテスト"""
+        engine = AsyncScrapeEngine(self.fetcher.scrape_candidate_page, concurrency=4, rate=1000, burst=4)
+        
+        results = engine.run(self.urls)
+        
+        self.assertEqual([r["url"] for r in results], self.urls)
+        self.assertEqual(results[3]["name"], "候補者 3")
+    
+    def test_concurrency_is_bounded(self):
+        """同時実行数が上限を超えないかのテスト"""
+        engine = AsyncScrapeEngine(self.fetcher.scrape_candidate_page, concurrency=3, rate=1000, burst=10)
+        
+        engine.run(self.urls)
+        
+        self.assertLessEqual(SlowCandidatePageHandler.max_active, 3)
+        self.assertGreater(SlowCandidatePageHandler.max_active, 1)
+    
+    def test_rate_is_limited(self):
+        """リクエストレートが上限を超えないかのテスト"""
+        engine = AsyncScrapeEngine(self.fetcher.scrape_candidate_page, concurrency=8, rate=40, burst=1)
+        
+        start = time.monotonic()
+        engine.run(self.urls)
+        elapsed = time.monotonic() - start
+        
+        # 12リクエストを40件/秒で送るには、少なくとも11/40秒かかる
+        self.assertGreaterEqual(elapsed, 11 / 40 * 0.9)
+    
+    def test_scrape_async_generator(self):
+        """非同期ジェネレーターで結果を受け取るテスト"""
+        engine = AsyncScrapeEngine(self.fetcher.scrape_candidate_page, concurrency=2, rate=1000, burst=2)
+        urls = self.urls[:3] + [self.base_url + "missing"]
+        
+        async def collect():
+            return [item async for item in engine.scrape(urls)]
+        
+        results = dict(asyncio.run(collect()))
+        
+        self.assertEqual(set(results), set(urls))
+        # 取得できなかったページはNone
+        self.assertIsNone(results[self.base_url + "missing"])
+    
+    def test_fetch_exception(self):
+        """取得処理の例外がエラー情報になるかのテスト"""
+        def fetch(url):
+            raise RuntimeError("接続エラー")
+        
+        engine = AsyncScrapeEngine(fetch, concurrency=2, rate=1000)
+        
+        results = engine.run(self.urls[:2])
+        
+        self.assertEqual(results[0]["error"], "接続エラー")
+        self.assertEqual(results[0]["url"], self.urls[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,175 @@
+import unittest
+import os
+import sys
+import json
+import subprocess
+from collections import deque
+from unittest.mock import patch, MagicMock, PropertyMock
+from selenium.common.exceptions import JavascriptException, WebDriverException
+
+# テスト対象のモジュールのパスを追加
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+from backends import FakeBackend, CdpBackend, CdpDriver, create_backend
+from bizreach_scraper import BizreachScraper
+
+
+class FakeWebSocket:
+    """DevToolsのWebSocketを模したクラス（コマンドごとの結果を返す）"""
+
+    def __init__(self, results):
+        self.results = results
+        self.sent = []
+        self._messages = deque()
+
+    def send(self, message):
+        command = json.loads(message)
+        self.sent.append(command)
+        if command["method"] == "Page.navigate":
+            # 応答の前後にイベントが届く
+            self._messages.append({"method": "Page.frameStartedLoading", "params": {}})
+            self._messages.append({"id": command["id"], "result": {"frameId": "1"}})
+            self._messages.append({"method": "Page.loadEventFired", "params": {}})
+            return
+        result = self.results.get(command["method"], {})
+        self._messages.append(dict({"id": command["id"]}, **result))
+
+    def recv(self):
+        if not self._messages:
+            raise ConnectionError("closed")
+        return json.dumps(self._messages.popleft())
+
+    def close(self):
+        pass
+
+
+class TestFakeBackend(unittest.TestCase):
+    """FakeBackendでのスクレイピングのテストクラス"""
+
+    def test_scrape_candidate_page(self):
+        """ブラウザを起動せずに、ログインと求職者ページの取得ができるかのテスト"""
+        scraper = BizreachScraper(backend="fake")
+        scraper.start_browser()
+
+        self.assertTrue(scraper.login("test@example.com", "password123"))
+        result = scraper.scrape_candidate_page("https://www.bizreach.jp/company/candidates/12345")
+
+        self.assertEqual(result["name"], "テスト 太郎")
+        self.assertEqual(result["url"], "https://www.bizreach.jp/company/candidates/12345")
+        self.assertEqual(scraper.page_timings.last["extraction"], "html")
+
+    def test_missing_page(self):
+        """ページがない場合に、ページ構造のエラーになるかのテスト"""
+        backend = FakeBackend(pages=lambda url: None)
+        scraper = BizreachScraper(backend=backend)
+        scraper.start_browser()
+
+        result = scraper.scrape_candidate_page("https://www.bizreach.jp/company/candidates/12345")
+
+        self.assertEqual(result["error_type"], "structure")
+
+    def test_cookies_and_local_storage(self):
+        """Cookieとローカルストレージの共有が動作するかのテスト"""
+        scraper = BizreachScraper(backend="fake")
+        scraper.start_browser()
+
+        scraper.add_cookies([{"name": "session", "value": "abc", "unknown": 1}])
+        scraper.set_local_storage({"token": "xyz"})
+
+        self.assertEqual(scraper.get_cookies(), [{"name": "session", "value": "abc"}])
+        self.assertEqual(scraper.get_local_storage(), {"token": "xyz"})
+
+    def test_unknown_backend(self):
+        """サポートされていないバックエンドのテスト"""
+        with self.assertRaises(ValueError):
+            create_backend("playwright")
+        with self.assertRaises(ValueError):
+            BizreachScraper(backend="playwright")
+
+    def test_main_does_not_import_selenium(self):
+        """main.pyの読み込み時（--helpの表示など）に、バックエンドの選択肢のためにseleniumを読み込まないかのテスト"""
+        src_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+        code = "import sys, main; print('selenium' in sys.modules)"
+
+        output = subprocess.run([sys.executable, "-c", code], cwd=src_dir, capture_output=True, text=True).stdout
+
+        self.assertEqual(output.strip(), "False")
+
+
+class TestCdpBackend(unittest.TestCase):
+    """CdpBackendクラスのテストクラス"""
+
+    @patch('backends.time.sleep')
+    def test_login_waits_through_navigation(self, mock_sleep):
+        """ログイン後の移動中にページのURLが取得できなくても、確認し直してログインできるかのテスト"""
+        scraper = MagicMock()
+        scraper.driver.execute_script.return_value = True
+        type(scraper.driver).current_url = PropertyMock(side_effect=[
+            "https://www.bizreach.jp/company/login",
+            JavascriptException("Execution context was destroyed."),
+            "https://www.bizreach.jp/company/dashboard"
+        ])
+
+        self.assertTrue(CdpBackend().login(scraper, "test@example.com", "password123",
+                                           "https://www.bizreach.jp/company/login"))
+        self.assertEqual(mock_sleep.call_count, 2)
+
+
+class TestCdpDriver(unittest.TestCase):
+    """CdpDriverクラスのテストクラス"""
+
+    def _driver(self, results=None):
+        """模擬WebSocketに接続したドライバーを生成する"""
+        self.websocket = FakeWebSocket(results or {})
+        with patch('websocket.create_connection', return_value=self.websocket):
+            return CdpDriver("ws://127.0.0.1:9222/devtools/page/1")
+
+    def test_get_waits_for_load(self):
+        """ページの移動でloadイベントまで待つかのテスト"""
+        driver = self._driver()
+
+        driver.get("https://www.bizreach.jp/company/candidates/12345")
+
+        self.assertEqual(self.websocket.sent[-1]["params"], {"url": "https://www.bizreach.jp/company/candidates/12345"})
+        self.assertIn("Page.loadEventFired", driver._events)
+
+    def test_execute_script(self):
+        """スクリプトが引数付きの関数として評価され、値が返されるかのテスト"""
+        driver = self._driver({"Runtime.evaluate": {"result": {"result": {"type": "string", "value": "complete"}}}})
+
+        self.assertEqual(driver.execute_script("return arguments[0]", "テスト"), "complete")
+        expression = self.websocket.sent[-1]["params"]["expression"]
+        self.assertIn("return arguments[0]", expression)
+        self.assertIn('.apply(null, ["テスト"])', expression)
+
+    def test_execute_script_exception(self):
+        """スクリプトの例外がJavascriptExceptionになるかのテスト"""
+        driver = self._driver({"Runtime.evaluate": {"result": {
+            "result": {}, "exceptionDetails": {"text": "Uncaught", "exception": {"description": "ReferenceError"}}
+        }}})
+
+        with self.assertRaises(JavascriptException):
+            driver.execute_script("return missing")
+
+    def test_get_cookies(self):
+        """CookieがWebDriverと同じ形式に変換されるかのテスト"""
+        driver = self._driver({"Network.getCookies": {"result": {"cookies": [{
+            "name": "session", "value": "abc", "domain": ".bizreach.jp", "path": "/",
+            "secure": True, "httpOnly": True, "expires": 1900000000.5, "sameSite": "Lax", "size": 10
+        }]}}})
+
+        self.assertEqual(driver.get_cookies(), [{
+            "name": "session", "value": "abc", "domain": ".bizreach.jp", "path": "/",
+            "secure": True, "httpOnly": True, "expiry": 1900000000, "sameSite": "Lax"
+        }])
+
+    def test_disconnected(self):
+        """接続が切れた場合にWebDriverExceptionになるかのテスト（ブラウザ監視が異常終了と判定できるように）"""
+        driver = self._driver()
+        self.websocket.send = lambda message: (_ for _ in ()).throw(ConnectionError("closed"))
+
+        with self.assertRaises(WebDriverException):
+            driver.execute_script("return 1")
+
+
+if __name__ == '__main__':
+    unittest.main()
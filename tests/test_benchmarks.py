@@ -0,0 +1,91 @@
+import unittest
+import os
+import sys
+import threading
+
+# テスト対象のモジュールのパスを追加
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'benchmarks')))
+from synthetic_server import create_server
+from bench_suite import compare, median_result, throughput_ratio
+from http_fetcher import HttpFetcher
+
+
+class TestSyntheticServer(unittest.TestCase):
+    """ベンチマーク用のサーバーのテストクラス"""
+
+    @classmethod
+    def setUpClass(cls):
+        """テスト用サーバーの起動"""
+        cls.server = create_server(latency=0.01)
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_port}"
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """テスト用サーバーの停止"""
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_page_matches_selectors(self):
+        """生成したページからスクレイパーのセレクターで指定した件数の情報が取得できるかのテスト"""
+        fetcher = HttpFetcher()
+
+        result = fetcher.scrape_candidate_page(self.base_url + "/company/candidates/12345?careers=7&skills=12&educations=3")
+
+        self.assertEqual(result["name"], "テスト 太郎")
+        self.assertEqual(len(result["career_history"]), 7)
+        self.assertEqual(len(result["skills"]), 12)
+        self.assertEqual(len(result["education"]), 3)
+        fetcher.close()
+
+    def test_unknown_path(self):
+        """求職者ページ以外のパスが404になるかのテスト"""
+        fetcher = HttpFetcher()
+
+        self.assertIsNone(fetcher.fetch(self.base_url + "/company/jobs/1"))
+        fetcher.close()
+
+
+class TestCompare(unittest.TestCase):
+    """基準値との比較のテストクラス"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.baseline = {"pages": 100, "errors": 0, "seconds": 5.0, "pages_per_second": 20.0, "peak_rss_mb": 40.0}
+
+    def test_within_tolerance(self):
+        """許容範囲内の変動は性能の低下とみなさないかのテスト"""
+        result = dict(self.baseline, pages_per_second=17.0, peak_rss_mb=45.0)
+
+        self.assertEqual(compare(result, self.baseline, 0.2), [])
+
+    def test_regressions(self):
+        """スループットの低下・メモリ使用量の増加・取得エラーが検出されるかのテスト"""
+        result = dict(self.baseline, pages_per_second=10.0, peak_rss_mb=60.0, errors=2)
+
+        self.assertEqual(len(compare(result, self.baseline, 0.2)), 3)
+
+    def test_single_tolerance(self):
+        """実行時間によらず、スループットに同じ許容範囲を使うかのテスト"""
+        baseline = dict(self.baseline, seconds=0.5)
+
+        self.assertEqual(compare(dict(baseline, pages_per_second=16.0), baseline, 0.2), [])
+        self.assertEqual(len(compare(dict(baseline, pages_per_second=15.0), baseline, 0.2)), 1)
+        self.assertEqual(throughput_ratio(dict(baseline, pages_per_second=15.0), baseline), 0.75)
+
+    def test_median_result(self):
+        """複数回の計測から、スループットが中央値の回を選び、取得エラーは最大を残すかのテスト"""
+        runs = [dict(self.baseline, pages_per_second=pps, peak_rss_mb=rss, errors=errors)
+                for pps, rss, errors in ((30.0, 41.0, 0), (10.0, 42.0, 1), (20.0, 43.0, 0))]
+
+        result = median_result(runs)
+
+        self.assertEqual((result["pages_per_second"], result["peak_rss_mb"]), (20.0, 43.0))
+        self.assertEqual(result["errors"], 1)
+        self.assertEqual(result["repeats"], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
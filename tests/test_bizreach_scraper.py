@@ -3,12 +3,13 @@ import os
 import sys
 import tempfile
 import json
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, ANY
 
 # テスト対象のモジュールのパスを追加
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
-from bizreach_scraper import BizreachScraper
-from utils import generate_mock_candidate_data
+from bizreach_scraper import BizreachScraper, NAME_NOT_FOUND
+from driver_cache import DRIVER_CACHE_ENV
+from utils import generate_mock_candidate_data, generate_mock_candidate_html
 
 # ChromeDriverManagerをモック化
 from unittest.mock import patch, MagicMock
@@ -22,6 +23,11 @@ class TestBizreachScraper(unittest.TestCase):
         # 一時ディレクトリを作成
         self.temp_dir = tempfile.mkdtemp()
         
+        # ChromeDriverのパスのキャッシュを使わない（実際の~/.cacheやインストールされたChromeに依存しない）
+        env_patcher = patch.dict(os.environ, {DRIVER_CACHE_ENV: ""})
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
+        
         # サンプルURLとモックデータ
         self.sample_urls = [
             "https://www.bizreach.jp/company/candidates/12345",
@@ -61,6 +67,43 @@ class TestBizreachScraper(unittest.TestCase):
         self.assertTrue(result)
         self.assertEqual(scraper.driver, mock_driver)
     
+    @patch('bizreach_scraper.webdriver')
+    @patch('bizreach_scraper.ChromeDriverManager')
+    def test_start_browser_driver_cache(self, mock_chrome_driver_manager, mock_webdriver):
+        """指定したドライバーのキャッシュでChromeDriverのパスを解決するかのテスト"""
+        # モックの設定
+        driver_cache = MagicMock()
+        driver_cache.resolve.return_value = '/cached/chromedriver'
+        
+        # スクレイパーの初期化と実行
+        scraper = BizreachScraper(driver_cache=driver_cache)
+        scraper.start_browser()
+        
+        # 検証
+        driver_cache.resolve.assert_called_once()
+        mock_chrome_driver_manager.assert_not_called()
+        driver_cache.resolve.call_args.args[0]()
+        mock_chrome_driver_manager.return_value.install.assert_called_once()
+    
+    @patch('bizreach_scraper.webdriver')
+    @patch('bizreach_scraper.ChromeDriverManager')
+    def test_start_browser_lean(self, mock_chrome_driver_manager, mock_webdriver):
+        """軽量モードでのブラウザの起動テスト"""
+        # モックの設定
+        mock_driver = MagicMock()
+        mock_webdriver.Chrome.return_value = mock_driver
+        
+        # スクレイパーの初期化と実行
+        scraper = BizreachScraper(lean=True)
+        result = scraper.start_browser()
+        
+        # 検証
+        self.assertTrue(result)
+        scraper.options.add_argument.assert_any_call("--headless=new")
+        scraper.options.add_experimental_option.assert_called_once()
+        mock_driver.maximize_window.assert_not_called()
+        mock_driver.execute_cdp_cmd.assert_any_call("Network.setBlockedURLs", {"urls": ANY})
+    
     @patch('bizreach_scraper.webdriver')
     def test_login_success(self, mock_webdriver):
         """ログイン成功のテスト"""
@@ -109,7 +152,29 @@ class TestBizreachScraper(unittest.TestCase):
         self.assertFalse(result)
     
     @patch('bizreach_scraper.webdriver')
-    def test_scrape_candidate_page(self, mock_webdriver):
+    @patch('bizreach_scraper.ChromeDriverManager')
+    def test_add_cookies(self, mock_chrome_driver_manager, mock_webdriver):
+        """Cookie共有のテスト"""
+        # モックの設定
+        mock_driver = MagicMock()
+        mock_webdriver.Chrome.return_value = mock_driver
+
+        # スクレイパーの初期化
+        scraper = BizreachScraper()
+        scraper.start_browser()
+
+        # テスト実行（add_cookieが受け付けないキーは除外される）
+        scraper.add_cookies([{"name": "session", "value": "abc", "domain": ".bizreach.jp", "size": 10}])
+
+        # 検証
+        mock_driver.get.assert_called_once_with("https://www.bizreach.jp/")
+        mock_driver.add_cookie.assert_called_once_with(
+            {"name": "session", "value": "abc", "domain": ".bizreach.jp"}
+        )
+
+    @patch('bizreach_scraper.webdriver')
+    @patch('bizreach_scraper.WebDriverWait')
+    def test_scrape_candidate_page(self, mock_webdriver_wait, mock_webdriver):
         """候補者ページのスクレイピングテスト"""
         # モックの設定
         mock_driver = MagicMock()
@@ -119,6 +184,7 @@ class TestBizreachScraper(unittest.TestCase):
         
         mock_webdriver.Chrome.return_value = mock_driver
         mock_wait.until.return_value = mock_name_element
+        mock_webdriver_wait.return_value = mock_wait
         
         # スクレイパーの初期化
         scraper = BizreachScraper()
@@ -135,6 +201,231 @@ class TestBizreachScraper(unittest.TestCase):
         self.assertEqual(result["url"], url)
         self.assertEqual(result["name"], "テスト 太郎")
         mock_driver.get.assert_called_once_with(url)
+        
+        # 待機時間が記録されていることを確認
+        self.assertEqual(scraper.page_timings.count, 1)
+        self.assertEqual(scraper.page_timings.last["url"], url)
+        self.assertEqual(scraper.page_timings.last["readiness"], "ready_state")
+        
+        # スクリプトの結果が使えないため、要素ごとの取得にフォールバックしている
+        self.assertEqual(scraper.page_timings.last["extraction"], "selenium")
+    
+    @patch('bizreach_scraper.WebDriverWait')
+    def test_scrape_candidate_page_with_script(self, mock_webdriver_wait):
+        """スクリプト1回で候補者ページを取得するテスト"""
+        # モックの設定
+        mock_driver = MagicMock()
+        script_result = generate_mock_candidate_data()
+        del script_result["url"], script_result["scraped_at"]
+        script_result["age"] = None
+        mock_driver.execute_script.return_value = script_result
+        
+        # スクレイパーの初期化
+        scraper = BizreachScraper(extraction="script")
+        scraper.driver = mock_driver
+        
+        # テスト実行
+        url = self.sample_urls[0]
+        result = scraper.scrape_candidate_page(url)
+        
+        # 検証
+        self.assertEqual(result["name"], "テスト 太郎")
+        self.assertEqual(result["age"], "不明")
+        self.assertEqual(len(result["career_history"]), 2)
+        self.assertEqual(result["url"], url)
+        self.assertEqual(scraper.page_timings.last["extraction"], "script")
+        
+        # 要素ごとの取得は行われない
+        mock_driver.find_element.assert_not_called()
+        mock_driver.find_elements.assert_not_called()
+    
+    @patch('bizreach_scraper.WebDriverWait')
+    def test_scrape_candidate_page_with_selenium(self, mock_webdriver_wait):
+        """要素ごとの取得方式のテスト"""
+        # モックの設定
+        mock_driver = MagicMock()
+        mock_name_element = MagicMock()
+        mock_name_element.text = "テスト 太郎"
+        mock_webdriver_wait.return_value.until.return_value = mock_name_element
+        
+        mock_item = MagicMock()
+        mock_item.find_element.return_value.text = "株式会社テスト"
+        mock_driver.find_elements.return_value = [mock_item]
+        
+        # スクレイパーの初期化
+        scraper = BizreachScraper(extraction="selenium")
+        scraper.driver = mock_driver
+        
+        # テスト実行
+        result = scraper.scrape_candidate_page(self.sample_urls[0])
+        
+        # 検証
+        self.assertEqual(result["name"], "テスト 太郎")
+        self.assertEqual(result["career_history"][0]["company"], "株式会社テスト")
+        self.assertEqual(scraper.page_timings.last["extraction"], "selenium")
+        mock_driver.execute_script.assert_not_called()
+    
+    def test_scrape_candidate_page_with_http_fast_path(self):
+        """HTTPでの直接取得のテスト"""
+        # モックの設定
+        mock_driver = MagicMock()
+        
+        scraper = BizreachScraper()
+        scraper.driver = mock_driver
+        scraper.http_fetcher = MagicMock()
+        scraper.http_fetcher.scrape_candidate_page.return_value = self.mock_data[0]
+        
+        # テスト実行
+        result = scraper.scrape_candidate_page(self.sample_urls[0])
+        
+        # 検証（ブラウザは使われない）
+        self.assertEqual(result, self.mock_data[0])
+        mock_driver.get.assert_not_called()
+        self.assertEqual(scraper.page_timings.last["extraction"], "http")
+    
+    @patch('bizreach_scraper.WebDriverWait')
+    def test_scrape_candidate_page_http_fallback(self, mock_webdriver_wait):
+        """HTTPで取得できない場合にブラウザで取得するテスト"""
+        # モックの設定
+        mock_driver = MagicMock()
+        mock_driver.execute_script.return_value = {
+            "name": "テスト 太郎", "age": "35歳", "career_history": [], "skills": [], "education": []
+        }
+        
+        scraper = BizreachScraper()
+        scraper.driver = mock_driver
+        scraper.http_fetcher = MagicMock()
+        scraper.http_fetcher.scrape_candidate_page.return_value = None
+        
+        # テスト実行
+        result = scraper.scrape_candidate_page(self.sample_urls[0])
+        
+        # 検証
+        self.assertEqual(result["name"], "テスト 太郎")
+        mock_driver.get.assert_called_once_with(self.sample_urls[0])
+        self.assertEqual(scraper.page_timings.last["extraction"], "script")
+    
+    def test_scrape_candidate_page_from_snapshot(self):
+        """新しいスナップショットがある場合にページにアクセスしないかのテスト"""
+        # モックの設定
+        mock_driver = MagicMock()
+        snapshot_store = MagicMock()
+        snapshot_store.get_fresh.return_value = generate_mock_candidate_html()
+        
+        scraper = BizreachScraper()
+        scraper.driver = mock_driver
+        scraper.enable_snapshots(snapshot_store, reuse_seconds=3600)
+        
+        # テスト実行
+        result = scraper.scrape_candidate_page(self.sample_urls[0])
+        
+        # 検証
+        self.assertEqual(result["url"], self.sample_urls[0])
+        snapshot_store.get_fresh.assert_called_once_with(self.sample_urls[0], 3600)
+        mock_driver.get.assert_not_called()
+        self.assertEqual(scraper.page_timings.last["extraction"], "snapshot")
+    
+    @patch('bizreach_scraper.WebDriverWait')
+    def test_scrape_candidate_page_saves_snapshot(self, mock_webdriver_wait):
+        """ブラウザで取得したページのHTMLが保存されるかのテスト"""
+        # モックの設定
+        mock_driver = MagicMock()
+        mock_driver.execute_script.return_value = {
+            "name": "テスト 太郎", "age": "35歳", "career_history": [], "skills": [], "education": []
+        }
+        mock_driver.page_source = "<html></html>"
+        snapshot_store = MagicMock()
+        
+        scraper = BizreachScraper()
+        scraper.driver = mock_driver
+        scraper.enable_snapshots(snapshot_store)
+        
+        # テスト実行
+        scraper.scrape_candidate_page(self.sample_urls[0])
+        
+        # 検証（再利用しない設定ではスナップショットを読まない）
+        snapshot_store.get_fresh.assert_not_called()
+        snapshot_store.save.assert_called_once_with(self.sample_urls[0], "<html></html>")
+    
+    def test_scrape_candidate_page_with_supervisor(self):
+        """ブラウザ監視を有効にした場合に、監視を通して取得するかのテスト"""
+        scraper = BizreachScraper()
+        supervisor = scraper.enable_supervisor("test@example.com", "password123", recycle_pages=10)
+        supervisor.scrape = MagicMock(return_value=self.mock_data[0])
+        
+        result = scraper.scrape_candidate_page(self.sample_urls[0])
+        
+        self.assertEqual(result, self.mock_data[0])
+        supervisor.scrape.assert_called_once_with(self.sample_urls[0], scraper._scrape_candidate_page)
+    
+    @patch('bizreach_scraper.WebDriverWait')
+    def test_scrape_candidate_page_error_types(self, mock_webdriver_wait):
+        """取得エラーが分類されるかのテスト（ログインページ・CAPTCHAページへのリダイレクト、氏名の要素の欠落）"""
+        mock_driver = MagicMock()
+        mock_driver.current_url = "https://www.bizreach.jp/company/login"
+        mock_driver.execute_script.return_value = {
+            "name": NAME_NOT_FOUND, "age": "35歳", "career_history": [], "skills": [], "education": []
+        }
+        
+        scraper = BizreachScraper()
+        scraper.driver = mock_driver
+        
+        self.assertEqual(scraper.scrape_candidate_page(self.sample_urls[0])["error_type"], "session")
+        
+        mock_driver.current_url = "https://www.bizreach.jp/captcha"
+        self.assertEqual(scraper.scrape_candidate_page(self.sample_urls[0])["error_type"], "throttled")
+        
+        mock_driver.current_url = self.sample_urls[0]
+        self.assertEqual(scraper.scrape_candidate_page(self.sample_urls[0])["error_type"], "structure")
+    
+    @patch('retry.time.sleep')
+    def test_scrape_candidate_page_with_retries(self, mock_sleep):
+        """再試行を有効にした場合に、一時的なエラーのページを取得し直すかのテスト"""
+        scraper = BizreachScraper()
+        scraper.enable_retries()
+        scraper._scrape_candidate_page = MagicMock(side_effect=[
+            {"url": self.sample_urls[0], "error": "timeout", "error_type": "transient"},
+            self.mock_data[0]
+        ])
+        
+        result = scraper.scrape_candidate_page(self.sample_urls[0])
+        
+        self.assertEqual(result, self.mock_data[0])
+        self.assertEqual(scraper.retry_handler.retries["transient"], 1)
+    
+    @patch('bizreach_scraper.WebDriverWait')
+    def test_wait_for_page_ready_timeout(self, mock_webdriver_wait):
+        """準備完了の待機がタイムアウトしても例外にならないかのテスト"""
+        from selenium.common.exceptions import TimeoutException
+        mock_webdriver_wait.return_value.until.side_effect = TimeoutException()
+        
+        scraper = BizreachScraper(readiness="sections", page_timeout=1)
+        scraper.driver = MagicMock()
+        
+        waited = scraper.wait_for_page_ready()
+        
+        self.assertGreaterEqual(waited, 0)
+        mock_webdriver_wait.assert_called_once_with(scraper.driver, 1, poll_frequency=0.1)
+    
+    def test_network_idle_condition(self):
+        """network_idle方式の判定条件のテスト"""
+        from bizreach_scraper import NetworkIdle
+        mock_driver = MagicMock()
+        condition = NetworkIdle(idle_seconds=0)
+        
+        # 読み込み中はFalse
+        mock_driver.execute_script.return_value = -1
+        self.assertFalse(condition(mock_driver))
+        
+        # リソース数が変化した直後はFalse、変化しなければTrue
+        mock_driver.execute_script.return_value = 5
+        self.assertFalse(condition(mock_driver))
+        self.assertTrue(condition(mock_driver))
+    
+    def test_invalid_readiness(self):
+        """サポートされていない待機方式の指定テスト"""
+        with self.assertRaises(ValueError):
+            BizreachScraper(readiness="unknown")
     
     @patch('bizreach_scraper.webdriver')
     @patch('bizreach_scraper.time')
@@ -164,6 +455,34 @@ class TestBizreachScraper(unittest.TestCase):
         self.assertEqual(scraper.scrape_candidate_page.call_count, 2)
         self.assertEqual(mock_time.sleep.call_count, 1)  # 2ページなので1回の待機
     
+    @patch('bizreach_scraper.time')
+    def test_scrape_multiple_candidates_with_sink(self, mock_time):
+        """取得した情報を逐次書き出すテスト"""
+        # スクレイパーの初期化
+        scraper = BizreachScraper()
+        scraper.scrape_candidate_page = MagicMock(side_effect=self.mock_data)
+        sink = MagicMock()
+        
+        # テスト実行
+        results = scraper.scrape_multiple_candidates(self.sample_urls, sink=sink)
+        
+        # 検証（メモリには保持せず、1件ずつ書き出す）
+        self.assertEqual(results, [])
+        self.assertEqual(sink.write.call_count, 2)
+        sink.write.assert_any_call(self.mock_data[1])
+    
+    @patch('bizreach_scraper.time')
+    def test_scrape_multiple_candidates_with_checkpoint(self, mock_time):
+        """各URLの処理結果を記録するテスト"""
+        scraper = BizreachScraper()
+        scraper.scrape_candidate_page = MagicMock(side_effect=self.mock_data)
+        checkpoint = MagicMock()
+        
+        scraper.scrape_multiple_candidates(self.sample_urls, checkpoint=checkpoint)
+        
+        checkpoint.record.assert_any_call(self.sample_urls[0], self.mock_data[0])
+        checkpoint.record.assert_any_call(self.sample_urls[1], self.mock_data[1])
+    
     @patch('bizreach_scraper.webdriver')
     def test_save_data_to_csv(self, mock_webdriver):
         """CSVへのデータ保存テスト"""
@@ -188,12 +507,14 @@ class TestBizreachScraper(unittest.TestCase):
         self.assertTrue(os.path.exists(csv_filename))
         
         # CSVファイルの内容を確認
-        import pandas as pd
-        df = pd.read_csv(csv_filename)
-        self.assertEqual(len(df), 2)
-        self.assertIn("name", df.columns)
-        self.assertIn("age", df.columns)
-        self.assertIn("url", df.columns)
+        import csv
+        with open(csv_filename, "r", encoding="utf-8-sig", newline="") as f:
+            reader = csv.DictReader(f)
+            rows = list(reader)
+        self.assertEqual(len(rows), 2)
+        self.assertIn("name", reader.fieldnames)
+        self.assertIn("age", reader.fieldnames)
+        self.assertIn("url", reader.fieldnames)
     
     @patch('bizreach_scraper.webdriver')
     def test_save_data_to_json(self, mock_webdriver):
@@ -0,0 +1,141 @@
+import unittest
+import os
+import sys
+from unittest.mock import MagicMock
+from selenium.common.exceptions import InvalidSessionIdException, WebDriverException
+
+# テスト対象のモジュールのパスを追加
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+from browser_supervisor import BrowserSupervisor
+from metrics import PageTimings
+from utils import generate_mock_candidate_data
+
+
+class TestBrowserSupervisor(unittest.TestCase):
+    """BrowserSupervisorクラスのテストクラス"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.scraper = MagicMock()
+        self.scraper.page_timings = PageTimings()
+        self.scraper.http_fetcher = None
+        self.scraper.login.return_value = True
+        self.scraper.get_cookies.return_value = [{"name": "session", "value": "abc"}]
+        self.scraper.get_local_storage.return_value = {"token": "xyz"}
+        self.urls = [f"https://www.bizreach.jp/company/candidates/{i}" for i in range(5)]
+
+    def _scrape_page(self, url, extraction="script"):
+        """ブラウザでの取得を模して、取得時間を記録してモックデータを返す"""
+        self.scraper.page_timings.record(url, "ready_state", extraction, 0.0, 0.0)
+        return generate_mock_candidate_data(url)
+
+    def test_recycle_after_pages(self):
+        """指定したページ数ごとに、Cookieを引き継いでブラウザを再起動するかのテスト"""
+        supervisor = BrowserSupervisor(self.scraper, "user", "pass", recycle_pages=2)
+
+        for url in self.urls:
+            supervisor.scrape(url, self._scrape_page)
+
+        self.assertEqual(supervisor.restarts, {"pages": 2, "memory": 0, "crash": 0})
+        self.assertEqual(self.scraper.start_browser.call_count, 2)
+        self.scraper.add_cookies.assert_called_with([{"name": "session", "value": "abc"}])
+        self.scraper.set_local_storage.assert_called_with({"token": "xyz"})
+        self.scraper.login.assert_not_called()
+
+    def test_non_browser_pages_not_counted(self):
+        """HTTPやスナップショットで取得したページはブラウザのページ数に数えないかのテスト"""
+        supervisor = BrowserSupervisor(self.scraper, "user", "pass", recycle_pages=2)
+
+        for url in self.urls:
+            supervisor.scrape(url, lambda u: self._scrape_page(u, "http"))
+
+        self.assertEqual(supervisor.browser_pages, 0)
+        self.assertEqual(supervisor.restarts["pages"], 0)
+
+    def test_recycle_on_memory(self):
+        """JavaScriptヒープが上限を超えたらブラウザを再起動するかのテスト"""
+        self.scraper.driver.execute_cdp_cmd.return_value = {
+            "metrics": [{"name": "JSHeapTotalSize", "value": 600 * 1024 * 1024}]
+        }
+        supervisor = BrowserSupervisor(self.scraper, "user", "pass", recycle_pages=0,
+                                       max_memory_mb=512, memory_check_interval=2)
+
+        for url in self.urls[:3]:
+            supervisor.scrape(url, self._scrape_page)
+
+        self.assertEqual(supervisor.restarts["memory"], 1)
+        self.scraper.driver.execute_cdp_cmd.assert_any_call("Performance.getMetrics", {})
+
+    def test_restart_on_dead_session(self):
+        """ブラウザのセッションが切れた場合に、再ログインして同じURLを取得し直すかのテスト"""
+        self.scraper.driver.execute_script.side_effect = InvalidSessionIdException("invalid session id")
+        results = [{"url": self.urls[0], "error": "invalid session id"}, generate_mock_candidate_data(self.urls[0])]
+        scrape_page = MagicMock(side_effect=results)
+        supervisor = BrowserSupervisor(self.scraper, "user", "pass")
+
+        result = supervisor.scrape(self.urls[0], scrape_page)
+
+        self.assertEqual(result["name"], "テスト 太郎")
+        self.assertEqual(scrape_page.call_count, 2)
+        self.assertEqual(supervisor.restarts["crash"], 1)
+        self.scraper.login.assert_called_once_with("user", "pass")
+        self.scraper.get_cookies.assert_not_called()
+
+    def test_error_with_live_session_not_restarted(self):
+        """ブラウザが応答する場合は、取得エラーでも再起動しないかのテスト"""
+        scrape_page = MagicMock(return_value={"url": self.urls[0], "error": "timeout"})
+        supervisor = BrowserSupervisor(self.scraper, "user", "pass")
+
+        result = supervisor.scrape(self.urls[0], scrape_page)
+
+        self.assertIn("error", result)
+        self.assertEqual(supervisor.restarts["crash"], 0)
+        self.scraper.start_browser.assert_not_called()
+
+    def test_gives_up_after_max_restarts(self):
+        """再ログインできない場合に、上限の回数で諦めるかのテスト"""
+        self.scraper.driver.execute_script.side_effect = InvalidSessionIdException("invalid session id")
+        self.scraper.login.return_value = False
+        scrape_page = MagicMock(return_value={"url": self.urls[0], "error": "invalid session id"})
+        supervisor = BrowserSupervisor(self.scraper, "user", "pass", max_restarts=3)
+
+        with self.assertRaises(RuntimeError):
+            supervisor.scrape(self.urls[0], scrape_page)
+        self.assertEqual(supervisor.restarts["crash"], 3)
+
+    def test_recycle_failure_retried(self):
+        """定期的な再起動でブラウザの起動に失敗した場合に、実行を止めずに再起動し直すかのテスト"""
+        self.scraper.start_browser.side_effect = [WebDriverException("chrome not reachable"), None]
+        supervisor = BrowserSupervisor(self.scraper, "user", "pass", recycle_pages=1)
+
+        for url in self.urls[:2]:
+            result = supervisor.scrape(url, self._scrape_page)
+
+        self.assertEqual(result["url"], self.urls[1])
+        self.assertEqual(supervisor.restarts, {"pages": 1, "memory": 0, "crash": 1})
+        self.scraper.login.assert_called_once_with("user", "pass")
+
+    def test_recycle_failure_counts_against_max_restarts(self):
+        """定期的な再起動の失敗も、再起動の上限の回数に数えるかのテスト"""
+        self.scraper.start_browser.side_effect = WebDriverException("chrome not reachable")
+        supervisor = BrowserSupervisor(self.scraper, "user", "pass", recycle_pages=1, max_restarts=3)
+        supervisor.scrape(self.urls[0], self._scrape_page)
+
+        with self.assertRaises(RuntimeError):
+            supervisor.scrape(self.urls[1], self._scrape_page)
+        self.assertEqual(supervisor.restarts, {"pages": 1, "memory": 0, "crash": 2})
+
+    def test_relogin(self):
+        """ログインセッションが切れた場合に、保存したセッションを削除してログインし直すかのテスト"""
+        session_cache = MagicMock()
+        session_cache.login.return_value = True
+        supervisor = BrowserSupervisor(self.scraper, "user", "pass", session_cache=session_cache)
+
+        self.assertTrue(supervisor.relogin())
+        session_cache.clear.assert_called_once()
+        session_cache.login.assert_called_once_with(self.scraper, "user", "pass")
+        self.scraper.start_browser.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+import os
+import sys
+import shutil
+import sqlite3
+import tempfile
+
+# テスト対象のモジュールのパスを追加
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+from candidate_store import CandidateStore
+from utils import generate_mock_candidate_data
+
+
+class TestCandidateStore(unittest.TestCase):
+    """CandidateStoreクラスのテストクラス"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "candidates.db")
+        self.store = CandidateStore(self.db_path, batch_size=2)
+        self.url = "https://www.bizreach.jp/company/candidates/12345"
+
+    def tearDown(self):
+        """テスト後のクリーンアップ"""
+        self.store.close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_write_and_get(self):
+        """保存した求職者情報を同じ形式で取得できるかのテスト"""
+        candidate = generate_mock_candidate_data(self.url)
+        self.store.write(candidate)
+
+        self.assertEqual(self.store.get(self.url), candidate)
+        self.assertEqual(self.store.get("12345"), candidate)
+        self.assertIsNone(self.store.get("https://www.bizreach.jp/company/candidates/99999"))
+
+    def test_upsert_replaces_entries(self):
+        """同じ求職者の情報が1件に更新されるかのテスト"""
+        candidate = generate_mock_candidate_data(self.url)
+        self.store.write(candidate)
+
+        updated = generate_mock_candidate_data(self.url + "?tab=career")
+        updated["career_history"] = updated["career_history"][:1]
+        updated["skills"] = ["Go"]
+        self.store.write(updated)
+
+        self.assertEqual(self.store.total(), 1)
+        stored = self.store.get(self.url)
+        self.assertEqual(len(stored["career_history"]), 1)
+        self.assertEqual(stored["skills"], ["Go"])
+        self.assertEqual(self.store.find_by_skill("Python"), [])
+
+    def test_error_keeps_previous_data(self):
+        """取得に失敗した場合に前回の情報が残るかのテスト"""
+        self.store.write(generate_mock_candidate_data(self.url))
+        self.store.write({"url": self.url, "error": "timeout", "scraped_at": "2024-01-01 00:00:00"})
+
+        stored = self.store.get(self.url)
+        self.assertEqual(stored["name"], "テスト 太郎")
+        self.assertEqual(stored["error"], "timeout")
+        self.assertEqual(len(stored["career_history"]), 2)
+
+    def test_find_by_company_and_skill(self):
+        """会社とスキルで求職者を検索できるかのテスト"""
+        for candidate_id in ["1", "2"]:
+            self.store.write(generate_mock_candidate_data(f"https://www.bizreach.jp/company/candidates/{candidate_id}"))
+
+        self.assertEqual(self.store.find_by_company("株式会社テスト"), ["1", "2"])
+        self.assertEqual(self.store.find_by_skill("AWS"), ["1", "2"])
+        self.assertEqual(self.store.find_by_company("存在しない株式会社"), [])
+
+    def test_batched_writes(self):
+        """一定件数ごとにまとめて書き込まれ、WALモードで開かれるかのテスト"""
+        self.store.commit_interval = 3600
+        self.store.write(generate_mock_candidate_data("https://www.bizreach.jp/company/candidates/1"))
+
+        # 別の接続からはまだ見えない
+        reader = sqlite3.connect(self.db_path)
+        self.assertEqual(reader.execute("SELECT COUNT(*) FROM candidates").fetchone()[0], 0)
+
+        self.store.write(generate_mock_candidate_data("https://www.bizreach.jp/company/candidates/2"))
+        self.assertEqual(reader.execute("SELECT COUNT(*) FROM candidates").fetchone()[0], 2)
+        self.assertEqual(reader.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        reader.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+from unittest.mock import MagicMock
+
+# テスト対象のモジュールのパスを追加
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+from change_detection import fingerprint, diff_candidates, ChangeTrackingSink
+from candidate_store import CandidateStore
+from utils import generate_mock_candidate_data
+
+
+class TestChangeDetection(unittest.TestCase):
+    """変更検出のテストクラス"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.store = CandidateStore(os.path.join(self.temp_dir, "candidates.db"))
+        self.url = "https://www.bizreach.jp/company/candidates/12345"
+        self.candidate = generate_mock_candidate_data(self.url)
+
+    def tearDown(self):
+        """テスト後のクリーンアップ"""
+        self.store.close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_fingerprint_ignores_formatting(self):
+        """取得日時・空白・スキルの順序の違いでフィンガープリントが変わらないかのテスト"""
+        other = generate_mock_candidate_data(self.url + "?tab=1")
+        other["scraped_at"] = "2000-01-01 00:00:00"
+        other["name"] = " テスト  太郎 "
+        other["skills"] = list(reversed(other["skills"]))
+
+        self.assertEqual(fingerprint(self.candidate), fingerprint(other))
+
+        other["age"] = "36歳"
+        self.assertNotEqual(fingerprint(self.candidate), fingerprint(other))
+
+    def test_diff_candidates(self):
+        """項目ごとの差分のテスト"""
+        new = generate_mock_candidate_data(self.url)
+        new["age"] = "36歳"
+        new["skills"] = ["Python", "Go"]
+
+        changes = diff_candidates(self.candidate, new)
+
+        self.assertEqual(set(changes), {"age", "skills"})
+        self.assertEqual(changes["age"], {"old": "35歳", "new": "36歳"})
+        self.assertEqual(changes["skills"], {"added": ["Go"], "removed": ["AWS", "Docker", "JavaScript"]})
+
+    def test_change_tracking_sink(self):
+        """新規と変更された求職者情報だけが書き出されるかのテスト"""
+        sink = MagicMock()
+        tracking = ChangeTrackingSink(self.store, sink, changes_only=True, diff=True)
+
+        tracking.write(self.candidate)
+        self.store.flush()
+        tracking.write(generate_mock_candidate_data(self.url))
+        self.store.flush()
+        changed = generate_mock_candidate_data(self.url)
+        changed["age"] = "36歳"
+        tracking.write(changed)
+
+        self.assertEqual(tracking.counts, {"new": 1, "changed": 1, "unchanged": 1, "error": 0})
+        self.assertEqual(sink.write.call_count, 2)
+        written = sink.write.call_args_list[1].args[0]
+        self.assertEqual(written["changes"], {"age": {"old": "35歳", "new": "36歳"}})
+        self.assertEqual(self.store.get(self.url)["age"], "36歳")
+
+    def test_iter_stale(self):
+        """最近取得できた求職者のURLが除外されるかのテスト"""
+        other_url = "https://www.bizreach.jp/company/candidates/67890"
+        error_url = "https://www.bizreach.jp/company/candidates/11111"
+        self.store.write(self.candidate)
+        self.store.write({"url": error_url, "error": "timeout", "scraped_at": "2024-01-01 00:00:00"})
+        self.store.flush()
+
+        stale = list(self.store.iter_stale([self.url, other_url, error_url], 3600))
+
+        self.assertEqual(stale, [other_url, error_url])
+        self.assertEqual(self.store.skipped_fresh, 1)
+        self.assertEqual(list(self.store.iter_stale([self.url], 0)), [self.url])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+import os
+import sys
+import tempfile
+
+# テスト対象のモジュールのパスを追加
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+from checkpoint import CheckpointJournal
+from utils import generate_mock_candidate_data
+
+
+class TestCheckpointJournal(unittest.TestCase):
+    """CheckpointJournalクラスのテストクラス"""
+    
+    def setUp(self):
+        """テスト前の準備"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "checkpoint.jsonl")
+        self.sample_urls = [
+            "https://www.bizreach.jp/company/candidates/12345",
+            "https://www.bizreach.jp/company/candidates/67890",
+            "https://www.bizreach.jp/company/candidates/54321"
+        ]
+    
+    def tearDown(self):
+        """テスト後のクリーンアップ"""
+        for name in os.listdir(self.temp_dir):
+            os.remove(os.path.join(self.temp_dir, name))
+        os.rmdir(self.temp_dir)
+    
+    def test_resume_skips_completed_urls(self):
+        """再開時に処理済みのURLを除外するテスト"""
+        journal = CheckpointJournal(self.path)
+        journal.start_run("/tmp/candidates.jsonl")
+        journal.record(self.sample_urls[0], generate_mock_candidate_data(self.sample_urls[0]))
+        journal.record(self.sample_urls[1], {"url": self.sample_urls[1], "error": "timeout"})
+        journal.close()
+        
+        resumed = CheckpointJournal(self.path, resume=True)
+        
+        # 前回のJSONLファイルを引き継ぎ、エラーになったURLはもう一度処理する
+        self.assertEqual(resumed.stream_filename, "/tmp/candidates.jsonl")
+        self.assertTrue(resumed.is_done(self.sample_urls[0]))
+        self.assertFalse(resumed.is_done(self.sample_urls[1]))
+        self.assertEqual(list(resumed.pending(self.sample_urls)), self.sample_urls[1:])
+        resumed.close()
+    
+    def test_resume_appends(self):
+        """再開後の記録が追記されるかのテスト"""
+        journal = CheckpointJournal(self.path)
+        journal.start_run("/tmp/candidates.jsonl")
+        journal.record(self.sample_urls[0], generate_mock_candidate_data(self.sample_urls[0]))
+        journal.close()
+        
+        resumed = CheckpointJournal(self.path, resume=True)
+        resumed.record(self.sample_urls[1], generate_mock_candidate_data(self.sample_urls[1]))
+        resumed.close()
+        
+        self.assertEqual(list(CheckpointJournal(self.path, resume=True).pending(self.sample_urls)), self.sample_urls[2:])
+    
+    def test_new_run_discards_previous_records(self):
+        """resumeを指定しなければ記録をやり直すテスト"""
+        journal = CheckpointJournal(self.path)
+        journal.record(self.sample_urls[0], generate_mock_candidate_data(self.sample_urls[0]))
+        journal.close()
+        
+        journal = CheckpointJournal(self.path)
+        self.assertEqual(list(journal.pending(self.sample_urls)), self.sample_urls)
+        journal.close()
+    
+    def test_resume_ignores_broken_line(self):
+        """書き込み途中の不完全な行を読み飛ばすテスト"""
+        journal = CheckpointJournal(self.path)
+        journal.record(self.sample_urls[0], generate_mock_candidate_data(self.sample_urls[0]))
+        journal.close()
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write('{"url": "https://www.bizreach')
+        
+        resumed = CheckpointJournal(self.path, resume=True)
+        self.assertEqual(list(resumed.pending(self.sample_urls)), self.sample_urls[1:])
+        resumed.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+import unittest
+import os
+import sys
+import stat
+import shutil
+import tempfile
+from unittest.mock import MagicMock
+
+# テスト対象のモジュールのパスを追加
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+from driver_cache import DriverPathCache
+
+
+class TestDriverPathCache(unittest.TestCase):
+    """DriverPathCacheクラスのテストクラス"""
+
+    def setUp(self):
+        """テスト前の準備（バージョンを表示するだけの模擬Chromeとドライバーを作成）"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_file = os.path.join(self.temp_dir, "cache", "chromedriver.json")
+        self.chrome_path = os.path.join(self.temp_dir, "google-chrome")
+        self.calls_file = os.path.join(self.temp_dir, "calls")
+        self._write_chrome("120.0.6099.109")
+
+        self.driver_path = os.path.join(self.temp_dir, "chromedriver")
+        open(self.driver_path, "w").close()
+        self.install = MagicMock(return_value=self.driver_path)
+
+    def tearDown(self):
+        """テスト後のクリーンアップ"""
+        shutil.rmtree(self.temp_dir)
+
+    def _write_chrome(self, version):
+        """--versionで指定したバージョンを表示し、呼び出された回数を記録する模擬Chromeを作成する"""
+        with open(self.chrome_path, "w") as f:
+            f.write(f"#!/bin/sh\necho x >> {self.calls_file}\necho 'Google Chrome {version}'\n")
+        os.chmod(self.chrome_path, os.stat(self.chrome_path).st_mode | stat.S_IEXEC)
+
+    def _version_calls(self):
+        """模擬Chromeが呼び出された回数"""
+        if not os.path.exists(self.calls_file):
+            return 0
+        with open(self.calls_file) as f:
+            return len(f.readlines())
+
+    def _cache(self):
+        return DriverPathCache(self.cache_file, self.chrome_path)
+
+    def test_reuse_for_same_version(self):
+        """同じバージョンのChromeでは、ドライバーの解決とChromeの起動をせずにキャッシュを使うかのテスト"""
+        self.assertEqual(self._cache().resolve(self.install), self.driver_path)
+
+        cache = self._cache()
+        self.assertEqual(cache.resolve(self.install), self.driver_path)
+
+        self.install.assert_called_once()
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(self._version_calls(), 1)
+
+    def test_chrome_updated(self):
+        """Chromeが更新された場合に、ドライバーを解決し直すかのテスト"""
+        self._cache().resolve(self.install)
+
+        self._write_chrome("121.0.6167.85")
+        os.utime(self.chrome_path, (0, 0))
+        self._cache().resolve(self.install)
+
+        self.assertEqual(self.install.call_count, 2)
+        self.assertEqual(self._version_calls(), 2)
+
+    def test_driver_removed(self):
+        """キャッシュしたドライバーが削除された場合に、解決し直すかのテスト"""
+        self._cache().resolve(self.install)
+        os.remove(self.driver_path)
+
+        self._cache().resolve(self.install)
+
+        self.assertEqual(self.install.call_count, 2)
+
+    def test_chrome_not_found(self):
+        """Chromeが見つからない場合は、キャッシュせずに毎回解決するかのテスト"""
+        cache = DriverPathCache(self.cache_file, os.path.join(self.temp_dir, "missing"))
+
+        self.assertEqual(cache.resolve(self.install), self.driver_path)
+        self.assertEqual(cache.resolve(self.install), self.driver_path)
+
+        self.assertEqual(self.install.call_count, 2)
+        self.assertFalse(os.path.exists(self.cache_file))
+
+    def test_broken_cache_file(self):
+        """壊れたキャッシュファイルを無視して解決し直すかのテスト"""
+        os.makedirs(os.path.dirname(self.cache_file))
+        with open(self.cache_file, "w") as f:
+            f.write("{broken")
+
+        self.assertEqual(self._cache().resolve(self.install), self.driver_path)
+        self.assertEqual(self._cache().resolve(self.install), self.driver_path)
+
+        self.install.assert_called_once()
+
+
+    def test_only_caches_paths(self):
+        """ドライバーのパスの文字列以外（モックなど）はキャッシュせず、キャッシュファイルも作らないかのテスト"""
+        install = MagicMock(return_value=MagicMock())
+
+        self._cache().resolve(install)
+        self._cache().resolve(install)
+
+        self.assertEqual(install.call_count, 2)
+        self.assertFalse(os.path.exists(self.cache_file))
+
+    def test_save_failure_removes_temp_file(self):
+        """書き出せない内容の保存に失敗しても例外にならず、一時ファイルを残さないかのテスト"""
+        self._cache()._save({"chrome": {}, "drivers": {"120": MagicMock()}})
+
+        self.assertEqual(os.listdir(os.path.dirname(self.cache_file)), [])
+
+    def test_disabled(self):
+        """キャッシュファイルのパスが空文字列の場合は、キャッシュを使わないかのテスト"""
+        cache = DriverPathCache("", self.chrome_path)
+
+        self.assertEqual(cache.resolve(self.install), self.driver_path)
+        self.assertEqual(cache.resolve(self.install), self.driver_path)
+
+        self.assertEqual(self.install.call_count, 2)
+        self.assertEqual(self._version_calls(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,206 @@
+import unittest
+import os
+import sys
+import json
+import tempfile
+from unittest.mock import patch
+
+# テスト対象のモジュールのパスを追加
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+from exporters import BASE_FIELDS, STATUS_FIELDS, JsonlSink, ParquetSink, CsvSink, iter_jsonl, csv_columns, flatten_candidate, export_csv, export_json, export_parquet
+from utils import generate_mock_candidate_data
+
+
+class TestExporters(unittest.TestCase):
+    """書き出し処理のテストクラス"""
+    
+    def setUp(self):
+        """テスト前の準備"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.jsonl_path = os.path.join(self.temp_dir, "candidates.jsonl")
+        self.mock_data = [
+            generate_mock_candidate_data("https://www.bizreach.jp/company/candidates/12345"),
+            generate_mock_candidate_data("https://www.bizreach.jp/company/candidates/67890")
+        ]
+    
+    def tearDown(self):
+        """テスト後のクリーンアップ"""
+        for name in os.listdir(self.temp_dir):
+            os.remove(os.path.join(self.temp_dir, name))
+        os.rmdir(self.temp_dir)
+    
+    def test_jsonl_sink_and_iter(self):
+        """JSONLへの逐次書き出しと読み込みのテスト"""
+        with JsonlSink(self.jsonl_path) as sink:
+            for candidate in self.mock_data:
+                sink.write(candidate)
+            
+            # 閉じる前でも1行ずつ書き出されている
+            sink.sync()
+            with open(self.jsonl_path, "r", encoding="utf-8") as f:
+                self.assertEqual(len(f.readlines()), 2)
+        
+        self.assertEqual(sink.count, 2)
+        self.assertEqual(list(iter_jsonl(self.jsonl_path)), self.mock_data)
+    
+    def test_jsonl_sink_appends(self):
+        """既存のJSONLファイルに追記されるかのテスト"""
+        for candidate in self.mock_data:
+            with JsonlSink(self.jsonl_path) as sink:
+                sink.write(candidate)
+        
+        self.assertEqual(len(list(iter_jsonl(self.jsonl_path))), 2)
+    
+    @patch('exporters.os.fsync')
+    def test_jsonl_sink_periodic_fsync(self, mock_fsync):
+        """一定件数ごとにディスクへ同期するかのテスト"""
+        sink = JsonlSink(self.jsonl_path, fsync_every=2, fsync_interval=3600)
+        for _ in range(5):
+            sink.write(self.mock_data[0])
+        
+        self.assertEqual(mock_fsync.call_count, 2)
+        
+        sink.close()
+        self.assertEqual(mock_fsync.call_count, 3)
+    
+    def test_iter_jsonl_skips_broken_line(self):
+        """書き込み途中の不完全な行を読み飛ばすテスト"""
+        with open(self.jsonl_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(self.mock_data[0], ensure_ascii=False) + "\n")
+            f.write('{"name": "途中')
+        
+        self.assertEqual(list(iter_jsonl(self.jsonl_path)), [self.mock_data[0]])
+    
+    def test_flatten_candidate(self):
+        """CSV用のフラット化のテスト"""
+        flat = flatten_candidate(self.mock_data[0])
+        
+        self.assertEqual(flat["company_1"], "株式会社テスト")
+        self.assertEqual(flat["position_2"], "Webエンジニア")
+        self.assertNotIn("company_3", flat)
+        self.assertEqual(flat["skills"], "Python, JavaScript, AWS, Docker")
+        self.assertEqual(flat["school"], "サンプル大学")
+    
+    def test_export_csv_from_stream(self):
+        """JSONLファイルからCSVを作成するテスト"""
+        with JsonlSink(self.jsonl_path) as sink:
+            for candidate in self.mock_data:
+                sink.write(candidate)
+        
+        csv_path = os.path.join(self.temp_dir, "candidates.csv")
+        export_csv(iter_jsonl(self.jsonl_path), csv_path)
+        
+        with open(csv_path, "r", encoding="utf-8-sig") as f:
+            lines = f.read().splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[0].startswith("name,age,url,scraped_at"))
+    
+    def test_csv_columns(self):
+        """経歴と学歴の件数から列が決まるかのテスト"""
+        columns = csv_columns(career_depth=2, education_depth=2)
+        
+        self.assertEqual(columns, [
+            "name", "age", "url", "scraped_at",
+            "company_1", "period_1", "position_1", "company_2", "period_2", "position_2",
+            "skills", "school", "edu_period", "degree", "school_2", "edu_period_2", "degree_2",
+            "error", "error_type", "attempts", "retry_after", "changes"
+        ])
+    
+    def test_csv_sink_fixed_columns(self):
+        """経歴のない行やエラー行があっても列がそろい、BOM付きで書き出されるかのテスト"""
+        import csv
+        
+        csv_path = os.path.join(self.temp_dir, "candidates.csv")
+        error_row = {"url": "https://www.bizreach.jp/company/candidates/1", "error": "timeout", "scraped_at": "2024-01-01 00:00:00"}
+        with CsvSink(csv_path, career_depth=5) as sink:
+            sink.write(error_row)
+            sink.write(self.mock_data[0])
+        
+        with open(csv_path, "rb") as f:
+            self.assertTrue(f.read().startswith(b"\xef\xbb\xbf"))
+        with open(csv_path, "r", encoding="utf-8-sig", newline="") as f:
+            reader = csv.DictReader(f)
+            rows = list(reader)
+        
+        self.assertEqual(reader.fieldnames, csv_columns(career_depth=5))
+        self.assertEqual(rows[0]["company_1"], "")
+        self.assertEqual(rows[1]["company_1"], "株式会社テスト")
+        self.assertEqual(rows[1]["school"], "サンプル大学")
+    
+    def test_export_json_matches_json_dump(self):
+        """逐次書き出したJSONがjson.dumpと同じ内容になるかのテスト"""
+        json_path = os.path.join(self.temp_dir, "candidates.json")
+        
+        for data in ([], self.mock_data):
+            export_json(iter(data), json_path)
+            with open(json_path, "r", encoding="utf-8") as f:
+                self.assertEqual(f.read(), json.dumps(data, ensure_ascii=False, indent=2))
+
+    
+    def test_export_parquet_keeps_nested_structure(self):
+        """経歴・スキル・学歴が入れ子の構造のまま保存されるかのテスト"""
+        import pyarrow.parquet as pq
+        
+        parquet_path = os.path.join(self.temp_dir, "candidates.parquet")
+        error_row = {"url": "https://www.bizreach.jp/company/candidates/1", "error": "timeout", "scraped_at": "2024-01-01 00:00:00"}
+        export_parquet(iter(self.mock_data + [error_row]), parquet_path)
+        
+        rows = pq.read_table(parquet_path).to_pylist()
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[0]["career_history"], self.mock_data[0]["career_history"])
+        self.assertEqual(rows[0]["skills"], self.mock_data[0]["skills"])
+        self.assertEqual(rows[0]["education"], self.mock_data[0]["education"])
+        self.assertIsNone(rows[0]["error"])
+        self.assertEqual(rows[2]["error"], "timeout")
+        self.assertIsNone(rows[2]["name"])
+    
+    def test_parquet_sink_row_groups(self):
+        """指定した件数ごとに行グループが書き出されるかのテスト"""
+        import pyarrow.parquet as pq
+        
+        parquet_path = os.path.join(self.temp_dir, "candidates.parquet")
+        with ParquetSink(parquet_path, row_group_size=2) as sink:
+            for i in range(5):
+                sink.write(generate_mock_candidate_data(f"https://www.bizreach.jp/company/candidates/{i}"))
+        
+        metadata = pq.ParquetFile(parquet_path).metadata
+        self.assertEqual(metadata.num_rows, 5)
+        self.assertEqual(metadata.num_row_groups, 3)
+    
+    def test_status_fields_in_every_format(self):
+        """エラーの分類・試行回数・待機秒数・差分がCSVとParquetの両方に出力されるかのテスト"""
+        import csv
+        import pyarrow.parquet as pq
+        
+        error_row = {
+            "url": "https://www.bizreach.jp/company/candidates/1", "error": "429", "error_type": "rate_limited",
+            "attempts": 3, "retry_after": 30.0, "scraped_at": "2024-01-01 00:00:00"
+        }
+        changed_row = dict(self.mock_data[0], changes={"skills": {"added": ["Go"], "removed": []}})
+        
+        csv_path = os.path.join(self.temp_dir, "candidates.csv")
+        parquet_path = os.path.join(self.temp_dir, "candidates.parquet")
+        export_csv([error_row, changed_row], csv_path)
+        export_parquet([error_row, changed_row], parquet_path)
+        
+        with open(csv_path, "r", encoding="utf-8-sig", newline="") as f:
+            csv_rows = list(csv.DictReader(f))
+        table = pq.read_table(parquet_path)
+        parquet_rows = table.to_pylist()
+        
+        for field in BASE_FIELDS + STATUS_FIELDS:
+            self.assertIn(field, csv_rows[0])
+            self.assertIn(field, table.column_names)
+        
+        self.assertEqual(csv_rows[0]["error_type"], "rate_limited")
+        self.assertEqual(csv_rows[0]["attempts"], "3")
+        self.assertEqual(parquet_rows[0]["error_type"], "rate_limited")
+        self.assertEqual(parquet_rows[0]["attempts"], 3)
+        self.assertEqual(parquet_rows[0]["retry_after"], 30.0)
+        self.assertIsNone(parquet_rows[1]["attempts"])
+        
+        self.assertEqual(json.loads(csv_rows[1]["changes"]), changed_row["changes"])
+        self.assertEqual(json.loads(parquet_rows[1]["changes"]), changed_row["changes"])
+
+if __name__ == '__main__':
+    unittest.main()
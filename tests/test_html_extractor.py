@@ -0,0 +1,56 @@
+import unittest
+import os
+import sys
+
+# テスト対象のモジュールのパスを追加
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+from html_extractor import css_to_xpath, extract_candidate_from_html
+from utils import generate_mock_candidate_data, generate_mock_candidate_html
+
+
+class TestHtmlExtractor(unittest.TestCase):
+    """HTMLからの求職者情報取得のテストクラス"""
+    
+    def test_css_to_xpath(self):
+        """CSSセレクターからXPathへの変換テスト"""
+        self.assertEqual(
+            css_to_xpath("div.company-name"),
+            ".//div[contains(concat(' ', normalize-space(@class), ' '), ' company-name ')]"
+        )
+        self.assertEqual(css_to_xpath("h1"), ".//h1")
+    
+    def test_extract_candidate_from_html(self):
+        """求職者ページのHTMLから全項目を取得するテスト"""
+        candidate = generate_mock_candidate_data()
+        
+        result = extract_candidate_from_html(generate_mock_candidate_html(candidate))
+        
+        # scrape_candidate_pageと同じ形式で取得できる（url, scraped_atは除く）
+        del candidate["url"], candidate["scraped_at"]
+        self.assertEqual(result, candidate)
+    
+    def test_extract_candidate_without_name(self):
+        """氏名がないページ（JavaScriptで描画されるページなど）のテスト"""
+        self.assertIsNone(extract_candidate_from_html('<html><body><div id="app"></div></body></html>'))
+        self.assertIsNone(extract_candidate_from_html(''))
+    
+    def test_extract_candidate_with_missing_fields(self):
+        """項目が欠けている場合のテスト"""
+        html = (
+            '<html><body><h1 class="candidate-name">テスト 太郎</h1>'
+            '<div class="career-history-item"><div class="company-name">株式会社テスト</div></div>'
+            '<div class="skill-item"> Python </div>'
+            '</body></html>'
+        )
+        
+        result = extract_candidate_from_html(html)
+        
+        # 年齢がなければ「不明」、経歴の項目が欠けていれば空のリスト
+        self.assertEqual(result["age"], "不明")
+        self.assertEqual(result["career_history"], [])
+        self.assertEqual(result["skills"], ["Python"])
+        self.assertEqual(result["education"], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
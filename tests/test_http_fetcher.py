@@ -0,0 +1,126 @@
+import unittest
+import os
+import sys
+import threading
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from unittest.mock import MagicMock
+
+# テスト対象のモジュールのパスを追加
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+from http_fetcher import HttpFetcher
+from errors import ThrottledError
+from utils import generate_mock_candidate_html
+
+
+class CandidatePageHandler(BaseHTTPRequestHandler):
+    """テスト用の求職者ページを返すハンドラー"""
+    
+    def do_GET(self):
+        if self.path.startswith("/company/candidates/busy"):
+            # アクセス制限
+            self.send_response(429)
+            self.send_header("Retry-After", "120")
+            self.end_headers()
+        elif self.path.startswith("/company/candidates/spa"):
+            # JavaScriptで描画されるページ
+            self._send(200, '<html><body><div id="app"></div></body></html>')
+        elif self.path.startswith("/company/candidates/"):
+            # セッションCookieがなければログインページへリダイレクト
+            if "session=abc" not in self.headers.get("Cookie", ""):
+                self.send_response(302)
+                self.send_header("Location", "/company/login")
+                self.end_headers()
+                return
+            self._send(200, generate_mock_candidate_html())
+        else:
+            self._send(200, "<html><body>login</body></html>")
+    
+    def _send(self, status, body):
+        self.send_response(status)
+        # charsetを付けずに返し、UTF-8として扱われることを確認する
+        self.send_header("Content-Type", "text/html")
+        self.end_headers()
+        self.wfile.write(body.encode("utf-8"))
+    
+    def log_message(self, format, *args):
+        pass
+
+
+class TestHttpFetcher(unittest.TestCase):
+    """HttpFetcherクラスのテストクラス"""
+    
+    @classmethod
+    def setUpClass(cls):
+        """テスト用サーバーの起動"""
+        cls.server = HTTPServer(("127.0.0.1", 0), CandidatePageHandler)
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_port}"
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """テスト用サーバーの停止"""
+        cls.server.shutdown()
+        cls.server.server_close()
+    
+    def setUp(self):
+        """テスト前の準備"""
+        self.cookies = [{"name": "session", "value": "abc", "domain": "127.0.0.1", "path": "/"}]
+    
+    def test_from_driver(self):
+        """WebDriverからCookieとUser-Agentを引き継ぐテスト"""
+        mock_driver = MagicMock()
+        mock_driver.get_cookies.return_value = self.cookies
+        mock_driver.execute_script.return_value = "Mozilla/5.0 Test"
+        
+        fetcher = HttpFetcher.from_driver(mock_driver)
+        
+        self.assertEqual(fetcher.session.headers["User-Agent"], "Mozilla/5.0 Test")
+        self.assertEqual(fetcher.session.cookies.get("session"), "abc")
+        fetcher.close()
+    
+    def test_scrape_candidate_page(self):
+        """HTTPで求職者ページを取得するテスト"""
+        fetcher = HttpFetcher(self.cookies)
+        url = self.base_url + "/company/candidates/12345"
+        
+        result = fetcher.scrape_candidate_page(url)
+        
+        self.assertEqual(result["name"], "テスト 太郎")
+        self.assertEqual(result["url"], url)
+        self.assertIn("scraped_at", result)
+        fetcher.close()
+    
+    def test_scrape_candidate_page_without_session(self):
+        """ログインページにリダイレクトされた場合のテスト"""
+        fetcher = HttpFetcher()
+        
+        self.assertIsNone(fetcher.scrape_candidate_page(self.base_url + "/company/candidates/12345"))
+        fetcher.close()
+    
+    def test_scrape_candidate_page_requires_javascript(self):
+        """JavaScriptが必要なページのテスト"""
+        fetcher = HttpFetcher(self.cookies)
+        
+        self.assertIsNone(fetcher.scrape_candidate_page(self.base_url + "/company/candidates/spa"))
+        fetcher.close()
+    
+    def test_fetch_throttled(self):
+        """アクセスが制限された場合に、待機時間付きの例外が発生するかのテスト"""
+        fetcher = HttpFetcher(self.cookies)
+        
+        with self.assertRaises(ThrottledError) as context:
+            fetcher.fetch(self.base_url + "/company/candidates/busy")
+        self.assertEqual(context.exception.retry_after, 120)
+        fetcher.close()
+    
+    def test_fetch_connection_error(self):
+        """接続できない場合のテスト"""
+        fetcher = HttpFetcher(timeout=1)
+        
+        self.assertIsNone(fetcher.fetch("http://127.0.0.1:1/company/candidates/12345"))
+        fetcher.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+import unittest
+import os
+import sys
+import json
+import tempfile
+from unittest.mock import patch, MagicMock
+
+# テスト対象のモジュールのパスを追加
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+from metrics import Histogram, Metrics, PageTimings
+from bizreach_scraper import BizreachScraper
+
+
+class TestHistogram(unittest.TestCase):
+    """Histogramクラスのテストクラス"""
+
+    def test_observe_and_quantile(self):
+        """記録した値の件数・合計・最大と、分位数の推定のテスト"""
+        histogram = Histogram(buckets=(1.0, 2.0, 5.0))
+        for value in [0.5, 0.5, 1.5, 1.5, 4.0, 8.0]:
+            histogram.observe(value)
+
+        self.assertEqual(histogram.bucket_counts, [2, 2, 1, 1])
+        self.assertEqual(histogram.count, 6)
+        self.assertAlmostEqual(histogram.sum, 16.0)
+        self.assertEqual(histogram.max, 8.0)
+        self.assertAlmostEqual(histogram.quantile(0.5), 1.5)
+        self.assertLessEqual(histogram.quantile(1.0), 8.0)
+        self.assertEqual(Histogram().quantile(0.5), 0.0)
+
+
+class TestPageTimings(unittest.TestCase):
+    """PageTimingsクラスのテストクラス"""
+
+    def test_record_and_combine(self):
+        """ページごとの時間を保持せずに集計し、複数のワーカーの集計をまとめられるかのテスト"""
+        first, second = PageTimings(), PageTimings()
+        first.record("https://www.bizreach.jp/company/candidates/1", "ready_state", "script", 1.0, 0.25)
+        first.record("https://www.bizreach.jp/company/candidates/2", "http", "http", 0.0, 0.5)
+        second.record("https://www.bizreach.jp/company/candidates/3", "ready_state", "script", 2.0, 0.75)
+
+        combined = PageTimings.combine([first, second])
+
+        self.assertEqual(first.last["url"], "https://www.bizreach.jp/company/candidates/2")
+        self.assertEqual(combined.count, 3)
+        self.assertAlmostEqual(combined.ready.to_dict()["mean"], 1.0)
+        self.assertEqual(combined.extract.to_dict()["max"], 0.75)
+        self.assertEqual(combined.extractions, {"script": 2, "http": 1})
+
+
+class TestMetrics(unittest.TestCase):
+    """Metricsクラスのテストクラス"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.metrics = Metrics()
+        self.metrics.observe("navigate", 0.8)
+        self.metrics.observe("navigate", 1.2)
+        self.metrics.inc("pages", status="ok")
+        self.metrics.inc("pages", status="ok")
+        self.metrics.inc("pages", status="error")
+        self.metrics.inc("errors", error_type="transient")
+
+    def test_timer(self):
+        """withブロックの時間が記録されるかのテスト"""
+        with self.metrics.timer("extract"):
+            pass
+
+        self.assertEqual(self.metrics.phases["extract"].count, 1)
+
+    def test_summary_json(self):
+        """集計結果がJSONファイルに保存されるかのテスト"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filename = os.path.join(temp_dir, "metrics.json")
+            self.metrics.save_json(filename)
+            with open(filename, encoding="utf-8") as f:
+                summary = json.load(f)
+
+        self.assertEqual(summary["pages"], 3)
+        self.assertEqual(summary["counters"]["pages"], {"ok": 2, "error": 1})
+        self.assertEqual(summary["phases"]["navigate"]["count"], 2)
+        self.assertAlmostEqual(summary["phases"]["navigate"]["mean"], 1.0)
+        self.assertGreater(summary["pages_per_minute"], 0)
+
+    def test_prometheus(self):
+        """Prometheusのテキスト形式のテスト"""
+        text = self.metrics.to_prometheus()
+
+        self.assertIn('bizreach_pages_total{status="ok"} 2', text)
+        self.assertIn('bizreach_errors_total{error_type="transient"} 1', text)
+        self.assertIn('bizreach_phase_seconds_bucket{phase="navigate",le="1.0"} 1', text)
+        self.assertIn('bizreach_phase_seconds_bucket{phase="navigate",le="+Inf"} 2', text)
+        self.assertIn('bizreach_phase_seconds_count{phase="navigate"} 2', text)
+
+    def test_format_profile(self):
+        """内訳の表に処理段階とカウンターが含まれるかのテスト"""
+        profile = self.metrics.format_profile()
+
+        self.assertIn("navigate", profile)
+        self.assertIn("transient 1", profile)
+
+
+class TestScraperMetrics(unittest.TestCase):
+    """スクレイパーの処理段階ごとの計測のテストクラス"""
+
+    @patch('bizreach_scraper.WebDriverWait')
+    def test_phases_recorded(self, mock_webdriver_wait):
+        """ページの移動・待機・項目ごとの取得の時間と、ページ数が記録されるかのテスト"""
+        mock_webdriver_wait.return_value.until.return_value.text = "テスト 太郎"
+        metrics = Metrics()
+        scraper = BizreachScraper(extraction="selenium")
+        scraper.driver = MagicMock()
+        scraper.driver.find_elements.return_value = []
+        scraper.enable_metrics(metrics)
+
+        scraper.scrape_candidate_page("https://www.bizreach.jp/company/candidates/12345")
+
+        for phase in ["page", "navigate", "ready", "extract", "extract.name", "extract.career", "extract.education"]:
+            self.assertEqual(metrics.phases[phase].count, 1, phase)
+        self.assertEqual(metrics.counters["pages"], {"ok": 1})
+
+    def test_error_counted(self):
+        """取得エラーがエラーの分類ごとに数えられるかのテスト"""
+        metrics = Metrics()
+        scraper = BizreachScraper()
+        scraper.enable_metrics(metrics)
+
+        # ブラウザが起動していないため、取得は失敗する
+        scraper.scrape_candidate_page("https://www.bizreach.jp/company/candidates/12345")
+
+        self.assertEqual(metrics.counters["pages"], {"error": 1})
+        self.assertEqual(sum(metrics.counters["errors"].values()), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
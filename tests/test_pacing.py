@@ -0,0 +1,119 @@
+import unittest
+import os
+import sys
+from unittest.mock import patch, MagicMock
+
+# テスト対象のモジュールのパスを追加
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+from pacing import AdaptivePacer
+from bizreach_scraper import BizreachScraper
+from utils import generate_mock_candidate_data
+
+
+class TestAdaptivePacer(unittest.TestCase):
+    """AdaptivePacerクラスのテストクラス"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.ok = generate_mock_candidate_data("https://www.bizreach.jp/company/candidates/12345")
+
+    def _error(self, error_type):
+        """エラー情報を作成する"""
+        return {"url": self.ok["url"], "error": "failed", "error_type": error_type}
+
+    def test_speeds_up_while_healthy(self):
+        """正常なページが続くとリクエスト間隔が少しずつ短くなり、下限で止まるかのテスト"""
+        pacer = AdaptivePacer(4.0, min_wait=1.0, max_wait=10.0, increase=0.05)
+
+        pacer.record(self.ok, 0.5)
+        self.assertAlmostEqual(pacer.interval, 1 / 0.3)
+
+        for _ in range(100):
+            pacer.record(self.ok, 0.5)
+        self.assertEqual(pacer.interval, 1.0)
+
+    @patch('pacing.time.monotonic', return_value=1000.0)
+    def test_backs_off_on_throttling(self, mock_monotonic):
+        """アクセス制限・ログインページへのリダイレクト・遅いページで間隔が大きく長くなり、上限で止まるかのテスト"""
+        pacer = AdaptivePacer(2.0, min_wait=1.0, max_wait=10.0, slow_page_seconds=5)
+
+        pacer.record(self._error("throttled"), 1.0)
+        self.assertAlmostEqual(pacer.interval, 4.0)
+
+        mock_monotonic.return_value = 1010.0
+        pacer.record(self._error("session"), 1.0)
+        self.assertAlmostEqual(pacer.interval, 8.0)
+
+        mock_monotonic.return_value = 1020.0
+        pacer.record(self.ok, 6.0)
+        self.assertEqual(pacer.interval, 10.0)
+        self.assertEqual(pacer.decreases, 3)
+
+    @patch('pacing.time.monotonic', return_value=1000.0)
+    def test_single_backoff_per_congestion(self, mock_monotonic):
+        """減速前に始まったリクエストの失敗では、重ねて減速しないかのテスト"""
+        pacer = AdaptivePacer(2.0, min_wait=1.0, max_wait=60.0)
+
+        pacer.record(self._error("transient"), 3.0)
+        mock_monotonic.return_value = 1001.0
+        pacer.record(self._error("transient"), 3.0)
+
+        self.assertEqual(pacer.decreases, 1)
+        self.assertAlmostEqual(pacer.interval, 4.0)
+
+    def test_structure_error_keeps_interval(self):
+        """ページ構造の変更によるエラーでは間隔を変えないかのテスト"""
+        pacer = AdaptivePacer(3.0)
+
+        pacer.record(self._error("structure"), 1.0)
+
+        self.assertEqual(pacer.interval, 3.0)
+
+    def test_invalid_limits(self):
+        """下限と上限の指定が不正な場合のテスト"""
+        with self.assertRaises(ValueError):
+            AdaptivePacer(3.0, min_wait=5.0, max_wait=2.0)
+        with self.assertRaises(ValueError):
+            AdaptivePacer(3.0, decrease_factor=1.5)
+
+
+class TestScraperPacing(unittest.TestCase):
+    """スクレイパーでのリクエスト間隔の調整のテストクラス"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.urls = [f"https://www.bizreach.jp/company/candidates/{i}" for i in range(3)]
+
+    @patch('bizreach_scraper.time.sleep')
+    def test_paced_requests(self, mock_sleep):
+        """ページにアクセスする前に間隔を空け、結果を記録するかのテスト（固定の待機はしない）"""
+        pacer = MagicMock()
+        scraper = BizreachScraper()
+        scraper.enable_pacing(pacer)
+        scraper.http_fetcher = MagicMock()
+        scraper.http_fetcher.scrape_candidate_page.side_effect = generate_mock_candidate_data
+
+        scraper.scrape_multiple_candidates(self.urls)
+
+        self.assertEqual(pacer.acquire.call_count, 3)
+        self.assertEqual(pacer.record.call_count, 3)
+        mock_sleep.assert_not_called()
+
+    def test_snapshot_not_paced(self):
+        """保存したHTMLを再利用するページでは間隔を空けないかのテスト"""
+        from utils import generate_mock_candidate_html
+        pacer = MagicMock()
+        snapshot_store = MagicMock()
+        snapshot_store.get_fresh.return_value = generate_mock_candidate_html()
+        scraper = BizreachScraper()
+        scraper.enable_pacing(pacer)
+        scraper.enable_snapshots(snapshot_store, reuse_seconds=3600)
+
+        scraper.scrape_candidate_page(self.urls[0])
+
+        pacer.acquire.assert_not_called()
+        pacer.record.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+import unittest
+import os
+import sys
+import json
+import shutil
+import tempfile
+
+# テスト対象のモジュールのパスを追加
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+from records import Candidate, CareerEntry, EducationEntry, CandidateCollection
+from exporters import export_csv, export_json
+from utils import generate_mock_candidate_data
+
+
+class TestCandidate(unittest.TestCase):
+    """Candidateクラスのテストクラス"""
+
+    def test_round_trip(self):
+        """辞書から生成して、同じ辞書に戻せるかのテスト"""
+        candidate = generate_mock_candidate_data()
+
+        record = Candidate.from_dict(candidate)
+
+        self.assertEqual(record.to_dict(), candidate)
+        self.assertEqual(record.career_history[0], CareerEntry("株式会社テスト", "2018年4月 - 現在", "シニアエンジニア"))
+        self.assertEqual(record.education[0], EducationEntry("サンプル大学", "2010年4月 - 2014年3月", "工学部 情報工学科"))
+        self.assertEqual(record.skills, ("Python", "JavaScript", "AWS", "Docker"))
+
+    def test_error_round_trip(self):
+        """取得エラーの辞書も、その他の項目を含めて同じ辞書に戻せるかのテスト"""
+        candidate = {
+            "url": "https://www.bizreach.jp/company/candidates/12345",
+            "error": "アクセスが制限されました",
+            "error_type": "throttled",
+            "scraped_at": "2024-05-01 12:00:00",
+            "retry_after": 120
+        }
+
+        record = Candidate.from_dict(candidate)
+
+        self.assertEqual(record.to_dict(), candidate)
+        self.assertIsNone(record.career_history)
+        self.assertEqual(record.extra, {"error_type": "throttled", "retry_after": 120})
+
+    def test_slots(self):
+        """属性が固定され、インスタンスごとの辞書を持たないかのテスト"""
+        record = Candidate.from_dict(generate_mock_candidate_data())
+
+        for obj in (record, record.career_history[0], record.education[0]):
+            self.assertFalse(hasattr(obj, "__dict__"))
+        with self.assertRaises(AttributeError):
+            record.unknown = 1
+
+    def test_interning(self):
+        """別々に読み込んだ同じ会社名・スキル名・取得日時が、1つの文字列オブジェクトを共有するかのテスト"""
+        line = json.dumps(generate_mock_candidate_data(), ensure_ascii=False)
+        first = Candidate.from_dict(json.loads(line))
+        second = Candidate.from_dict(json.loads(line))
+
+        self.assertIs(first.career_history[0].company, second.career_history[0].company)
+        self.assertIs(first.education[0].school, second.education[0].school)
+        self.assertIs(first.skills[0], second.skills[0])
+        self.assertIs(first.scraped_at, second.scraped_at)
+
+    def test_hashable(self):
+        """等しい求職者情報が同じハッシュを持ち、集合で重複を排除できるかのテスト"""
+        candidate = dict(generate_mock_candidate_data(), changes=[{"field": "age", "old": "34歳", "new": "35歳"}])
+        first = Candidate.from_dict(candidate)
+        second = Candidate.from_dict(json.loads(json.dumps(candidate, ensure_ascii=False)))
+        other = Candidate.from_dict(generate_mock_candidate_data("https://www.bizreach.jp/company/candidates/67890"))
+
+        self.assertEqual(hash(first), hash(second))
+        self.assertEqual(len({first, second, other}), 2)
+        self.assertEqual(len({first.career_history[0], second.career_history[0]}), 1)
+        self.assertEqual({first.education[0]: 1}[second.education[0]], 1)
+
+
+class TestCandidateCollection(unittest.TestCase):
+    """CandidateCollectionクラスのテストクラス"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.mock_data = [
+            generate_mock_candidate_data("https://www.bizreach.jp/company/candidates/12345"),
+            generate_mock_candidate_data("https://www.bizreach.jp/company/candidates/67890")
+        ]
+
+    def tearDown(self):
+        """テスト後のクリーンアップ"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_write_and_iterate(self):
+        """シンクとして追加した求職者情報を、辞書の形式で返すかのテスト"""
+        with CandidateCollection() as collection:
+            for candidate in self.mock_data:
+                collection.write(candidate)
+            collection.write(Candidate.from_dict(self.mock_data[0]))
+
+        self.assertEqual(collection.count, 3)
+        self.assertEqual(list(collection)[:2], self.mock_data)
+
+    def test_exporters(self):
+        """保持した求職者情報を、辞書と同じ内容で書き出せるかのテスト"""
+        collection = CandidateCollection(self.mock_data)
+        for name, candidates in (("records", collection), ("dicts", self.mock_data)):
+            export_csv(candidates, os.path.join(self.temp_dir, f"{name}.csv"))
+            export_json(candidates, os.path.join(self.temp_dir, f"{name}.json"))
+
+        with open(os.path.join(self.temp_dir, "records.csv"), encoding="utf-8") as f:
+            records_csv = f.read()
+        with open(os.path.join(self.temp_dir, "dicts.csv"), encoding="utf-8") as f:
+            self.assertEqual(records_csv, f.read())
+
+        # JSONはキーの順序が異なる場合があるため、読み込んだ内容で比較する
+        with open(os.path.join(self.temp_dir, "records.json"), encoding="utf-8") as f:
+            records_json = json.load(f)
+        with open(os.path.join(self.temp_dir, "dicts.json"), encoding="utf-8") as f:
+            self.assertEqual(records_json, json.load(f))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import unittest
+import os
+import sys
+import gzip
+import shutil
+import tempfile
+from unittest.mock import MagicMock
+
+# テスト対象のモジュールのパスを追加
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+from reparse import iter_html_dir, iter_snapshots, reparse_file, reparse
+from snapshot_store import SnapshotStore
+from utils import generate_mock_candidate_html
+
+
+class TestReparse(unittest.TestCase):
+    """保存したHTMLからの再取得のテストクラス"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.html = generate_mock_candidate_html()
+
+        for candidate_id in ["12345", "67890"]:
+            with open(os.path.join(self.temp_dir, candidate_id + ".html"), "w", encoding="utf-8") as f:
+                f.write(self.html)
+        with gzip.open(os.path.join(self.temp_dir, "54321.html.gz"), "wt", encoding="utf-8") as f:
+            f.write(self.html)
+        with open(os.path.join(self.temp_dir, "notes.txt"), "w") as f:
+            f.write("HTMLではないファイル")
+
+    def tearDown(self):
+        """テスト後のクリーンアップ"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_iter_html_dir(self):
+        """HTMLファイルだけがファイル名の求職者IDのURLで返されるかのテスト"""
+        urls = [url for url, _, _ in iter_html_dir(self.temp_dir)]
+
+        self.assertEqual(urls, [
+            "https://www.bizreach.jp/company/candidates/12345",
+            "https://www.bizreach.jp/company/candidates/54321",
+            "https://www.bizreach.jp/company/candidates/67890"
+        ])
+
+    def test_iter_snapshots(self):
+        """スナップショットの最新のHTMLが返されるかのテスト"""
+        store = SnapshotStore(os.path.join(self.temp_dir, "snapshots"))
+        url = "https://www.bizreach.jp/company/candidates/12345"
+        store.save(url, self.html, fetched_at=100)
+
+        tasks = list(iter_snapshots(store))
+        store.close()
+
+        self.assertEqual(len(tasks), 1)
+        self.assertEqual(tasks[0][0], url)
+        self.assertEqual(reparse_file(tasks[0])["name"], "テスト 太郎")
+
+    def test_reparse_file_gzip(self):
+        """圧縮したHTMLから求職者情報を取得できるかのテスト"""
+        url = "https://www.bizreach.jp/company/candidates/54321"
+        result = reparse_file((url, os.path.join(self.temp_dir, "54321.html.gz"), 0))
+
+        self.assertEqual(result["url"], url)
+        self.assertEqual(result["age"], "35歳")
+        self.assertEqual(result["career_history"][0]["company"], "株式会社テスト")
+        self.assertIn("scraped_at", result)
+
+    def test_reparse_file_error(self):
+        """取得できないHTMLでエラー情報が返されるかのテスト"""
+        path = os.path.join(self.temp_dir, "empty.html")
+        with open(path, "w") as f:
+            f.write("<html><body></body></html>")
+
+        result = reparse_file(("https://www.bizreach.jp/company/candidates/1", path, 0))
+        missing = reparse_file(("https://www.bizreach.jp/company/candidates/2", path + ".missing", 0))
+
+        self.assertIn("error", result)
+        self.assertIn("error", missing)
+
+    def test_reparse(self):
+        """複数のプロセスで取得した情報がタスクの順序で書き出されるかのテスト"""
+        tasks = list(iter_html_dir(self.temp_dir))
+        tasks.append(("https://www.bizreach.jp/company/candidates/0", os.path.join(self.temp_dir, "none.html"), 0))
+        sink = MagicMock()
+
+        succeeded, failed = reparse(tasks, sink, processes=2, chunksize=1)
+
+        self.assertEqual((succeeded, failed), (3, 1))
+        written = [call.args[0]["url"] for call in sink.write.call_args_list]
+        self.assertEqual(written, [url for url, _, _ in tasks])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,195 @@
+import unittest
+import os
+import sys
+import time
+import threading
+import requests
+from unittest.mock import patch, MagicMock
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, InvalidSessionIdException
+
+# テスト対象のモジュールのパスを追加
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+from errors import classify_error, ThrottledError, PageStructureError, TRANSIENT, SESSION, STRUCTURE, THROTTLED, UNKNOWN
+from retry import RetryPolicy, CircuitBreaker, RetryHandler
+from utils import generate_mock_candidate_data
+
+
+class TestClassifyError(unittest.TestCase):
+    """エラーの分類のテストクラス"""
+
+    def test_classify_error(self):
+        """例外がエラーの分類に振り分けられるかのテスト"""
+        self.assertEqual(classify_error(TimeoutException()), TRANSIENT)
+        self.assertEqual(classify_error(requests.ConnectionError()), TRANSIENT)
+        self.assertEqual(classify_error(InvalidSessionIdException()), SESSION)
+        self.assertEqual(classify_error(NoSuchElementException()), STRUCTURE)
+        self.assertEqual(classify_error(PageStructureError("changed")), STRUCTURE)
+        self.assertEqual(classify_error(ThrottledError("429", retry_after=10)), THROTTLED)
+        self.assertEqual(classify_error(ValueError()), UNKNOWN)
+
+
+class TestRetryPolicy(unittest.TestCase):
+    """RetryPolicyクラスのテストクラス"""
+
+    def test_delay_grows_with_jitter(self):
+        """待機時間が指数的に伸び、上限とジッターの範囲に収まるかのテスト"""
+        policy = RetryPolicy(max_attempts=5, base_delay=1.0, max_delay=6.0)
+
+        for attempt, expected in [(1, 1.0), (2, 2.0), (3, 4.0), (4, 6.0)]:
+            delays = [policy.delay(attempt) for _ in range(50)]
+            self.assertTrue(all(expected / 2 <= delay <= expected for delay in delays))
+            self.assertGreater(len(set(delays)), 1)
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """CircuitBreakerクラスのテストクラス"""
+
+    @patch('retry.time.sleep')
+    def test_trips_and_recovers(self, mock_sleep):
+        """失敗が急増すると停止し、停止後の試行が成功すれば再開するかのテスト"""
+        breaker = CircuitBreaker(failure_ratio=0.5, window=4, min_calls=4, cooldown=30)
+
+        for success in [True, False, False, True]:
+            breaker.before_call()
+            breaker.record(success)
+
+        self.assertTrue(breaker.is_open)
+        self.assertEqual(breaker.opened, 1)
+
+        breaker.before_call()
+        self.assertGreater(mock_sleep.call_args.args[0], 29)
+        breaker.record(True)
+        self.assertFalse(breaker.is_open)
+
+    @patch('retry.time.sleep')
+    def test_failed_trial_doubles_cooldown(self, mock_sleep):
+        """停止後の試行が失敗すると、停止時間を倍にして再び停止するかのテスト"""
+        breaker = CircuitBreaker(failure_ratio=1.0, window=2, min_calls=2, cooldown=10)
+        breaker.record(False)
+        breaker.record(False)
+
+        breaker.before_call()
+        breaker.record(False)
+        breaker.before_call()
+
+        self.assertEqual(breaker.opened, 2)
+        self.assertGreater(mock_sleep.call_args.args[0], 19)
+
+    def test_all_workers_wait_for_single_probe(self):
+        """停止中は全てのワーカーが停止時間まで待機し、試行の1件の結果が出るまで他のワーカーが待つかのテスト"""
+        breaker = CircuitBreaker(failure_ratio=1.0, window=2, min_calls=2, cooldown=0.3)
+        breaker.record(False)
+        breaker.record(False)
+        tripped_at = time.monotonic()
+        lock = threading.Lock()
+        passed = []
+        probe_done = []
+
+        def worker():
+            breaker.before_call()
+            with lock:
+                passed.append(time.monotonic())
+                is_probe = breaker._probe == threading.get_ident()
+            if is_probe:
+                time.sleep(0.2)
+                probe_done.append(time.monotonic())
+            breaker.record(True)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(len(passed), 4)
+        self.assertEqual(len(probe_done), 1)
+        self.assertTrue(all(at - tripped_at >= 0.29 for at in passed))
+        # 試行以外のワーカーは、試行の結果が記録されてから再開する
+        self.assertEqual(sum(at < probe_done[0] for at in passed), 1)
+        self.assertFalse(breaker.is_open)
+        self.assertEqual(breaker.opened, 1)
+
+    @patch('retry.time.sleep')
+    def test_ignores_results_from_other_workers(self, mock_sleep):
+        """停止中・試行中に、試行以外のワーカーの結果で再開や再停止をしないかのテスト"""
+        breaker = CircuitBreaker(failure_ratio=1.0, window=2, min_calls=2, cooldown=10)
+        breaker.record(False)
+        breaker.record(False)
+
+        breaker.record(True)
+        self.assertTrue(breaker.is_open)
+
+        breaker.before_call()
+        other = threading.Thread(target=breaker.record, args=(False,))
+        other.start()
+        other.join()
+        self.assertEqual(breaker.opened, 1)
+        self.assertFalse(breaker.is_open)
+
+        breaker.record(True)
+        breaker.before_call()
+        self.assertEqual(mock_sleep.call_count, 1)
+
+
+class TestRetryHandler(unittest.TestCase):
+    """RetryHandlerクラスのテストクラス"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.url = "https://www.bizreach.jp/company/candidates/12345"
+
+    def _error(self, error_type, **extra):
+        """エラー情報を作成する"""
+        return dict({"url": self.url, "error": "failed", "error_type": error_type}, **extra)
+
+    @patch('retry.time.sleep')
+    def test_retries_transient_error(self, mock_sleep):
+        """一時的なエラーが再試行され、成功した結果が返されるかのテスト"""
+        scrape_page = MagicMock(side_effect=[self._error(TRANSIENT), self._error(TRANSIENT),
+                                             generate_mock_candidate_data(self.url)])
+        handler = RetryHandler()
+
+        result = handler.run(self.url, scrape_page)
+
+        self.assertNotIn("error", result)
+        self.assertEqual(scrape_page.call_count, 3)
+        self.assertEqual(handler.retries[TRANSIENT], 2)
+        self.assertEqual(mock_sleep.call_count, 2)
+
+    @patch('retry.time.sleep')
+    def test_gives_up_after_max_attempts(self, mock_sleep):
+        """上限の回数まで失敗した場合に、試行回数付きのエラー情報が返されるかのテスト"""
+        scrape_page = MagicMock(side_effect=lambda url: self._error(STRUCTURE))
+        handler = RetryHandler({STRUCTURE: RetryPolicy(max_attempts=2, base_delay=0)})
+
+        result = handler.run(self.url, scrape_page)
+
+        self.assertEqual(result["error_type"], STRUCTURE)
+        self.assertEqual(result["attempts"], 2)
+
+    @patch('retry.time.sleep')
+    def test_session_lost_and_retry_after(self, mock_sleep):
+        """セッション切れで再ログインし、アクセス制限ではサーバーの指定した時間待つかのテスト"""
+        on_session_lost = MagicMock()
+        scrape_page = MagicMock(side_effect=[self._error(SESSION), self._error(THROTTLED, retry_after=120),
+                                             generate_mock_candidate_data(self.url)])
+        handler = RetryHandler(on_session_lost=on_session_lost)
+
+        handler.run(self.url, scrape_page)
+
+        on_session_lost.assert_called_once()
+        self.assertGreaterEqual(mock_sleep.call_args_list[1].args[0], 120)
+
+    def test_breaker_ignores_structure_errors(self):
+        """ページ構造の変更による失敗がサーキットブレーカーに数えられないかのテスト"""
+        breaker = MagicMock()
+        handler = RetryHandler({}, breaker)
+
+        handler.run(self.url, lambda url: self._error(STRUCTURE))
+        handler.run(self.url, lambda url: self._error(TRANSIENT))
+
+        self.assertEqual([c.args[0] for c in breaker.record.call_args_list], [True, False])
+
+
+if __name__ == '__main__':
+    unittest.main()
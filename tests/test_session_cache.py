@@ -0,0 +1,161 @@
+import unittest
+import os
+import sys
+import json
+import tempfile
+import threading
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from unittest.mock import patch, MagicMock
+
+# テスト対象のモジュールのパスを追加
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+from session_cache import SessionCache
+
+
+class DashboardHandler(BaseHTTPRequestHandler):
+    """セッションCookieがあればダッシュボード、なければログインページへリダイレクトするハンドラー"""
+    
+    def do_GET(self):
+        if "session=valid" in self.headers.get("Cookie", ""):
+            self.send_response(200)
+            self.end_headers()
+            self.wfile.write(b"dashboard")
+        else:
+            self.send_response(302)
+            self.send_header("Location", "/company/login")
+            self.end_headers()
+    
+    def log_message(self, format, *args):
+        pass
+
+
+class TestSessionCache(unittest.TestCase):
+    """SessionCacheクラスのテストクラス"""
+    
+    @classmethod
+    def setUpClass(cls):
+        """テスト用サーバーの起動"""
+        cls.server = HTTPServer(("127.0.0.1", 0), DashboardHandler)
+        cls.probe_url = f"http://127.0.0.1:{cls.server.server_port}/company/dashboard"
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """テスト用サーバーの停止"""
+        cls.server.shutdown()
+        cls.server.server_close()
+    
+    def setUp(self):
+        """テスト前の準備"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "session.json")
+        self.cache = SessionCache(self.path, "secret", probe_url=self.probe_url)
+        
+        self.scraper = MagicMock()
+        self.scraper.get_cookies.return_value = [
+            {"name": "session", "value": "valid", "domain": "127.0.0.1", "path": "/"}
+        ]
+        self.scraper.get_local_storage.return_value = {"token": "xyz"}
+        self.scraper.driver.execute_script.return_value = "Mozilla/5.0 Test"
+    
+    def tearDown(self):
+        """テスト後のクリーンアップ"""
+        for name in os.listdir(self.temp_dir):
+            os.remove(os.path.join(self.temp_dir, name))
+        os.rmdir(self.temp_dir)
+    
+    def test_save_and_load(self):
+        """セッションの保存と読み込みのテスト"""
+        self.assertTrue(self.cache.save(self.scraper))
+        
+        # ファイルは暗号化され、本人以外は読めない
+        with open(self.path, "r", encoding="utf-8") as f:
+            content = f.read()
+        self.assertNotIn("valid", content)
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o600)
+        
+        session = self.cache.load()
+        self.assertEqual(session["cookies"][0]["value"], "valid")
+        self.assertEqual(session["local_storage"], {"token": "xyz"})
+        self.assertEqual(session["user_agent"], "Mozilla/5.0 Test")
+    
+    def test_concurrent_save(self):
+        """複数のスレッドが同時に保存しても、読み込めるファイルが1つだけ残るかのテスト"""
+        threads = [threading.Thread(target=self.cache.save, args=(self.scraper,)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(os.listdir(self.temp_dir), ["session.json"])
+        self.assertEqual(self.cache.load()["local_storage"], {"token": "xyz"})
+    
+    def test_save_failure_removes_temp_file(self):
+        """書き込みに失敗した場合、一時ファイルを残さずFalseを返すかのテスト"""
+        with patch("session_cache.os.replace", side_effect=OSError("disk full")):
+            self.assertFalse(self.cache.save(self.scraper))
+        
+        self.assertEqual(os.listdir(self.temp_dir), [])
+    
+    def test_load_with_wrong_secret(self):
+        """異なる鍵では読み込めないかのテスト"""
+        self.cache.save(self.scraper)
+        
+        self.assertIsNone(SessionCache(self.path, "other").load())
+    
+    def test_load_expired(self):
+        """期限切れのセッションを読み込まないかのテスト"""
+        self.cache.save(self.scraper)
+        
+        self.assertIsNone(SessionCache(self.path, "secret", max_age_hours=0).load())
+    
+    def test_load_missing_or_broken(self):
+        """ファイルがない場合と壊れている場合のテスト"""
+        self.assertIsNone(self.cache.load())
+        
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"salt": "AAAA", "token": "broken"}, f)
+        self.assertIsNone(self.cache.load())
+    
+    def test_probe(self):
+        """セッションの有効性確認のテスト"""
+        valid = {"cookies": [{"name": "session", "value": "valid", "domain": "127.0.0.1"}]}
+        expired = {"cookies": [{"name": "session", "value": "expired", "domain": "127.0.0.1"}]}
+        
+        self.assertTrue(self.cache.probe(valid))
+        self.assertFalse(self.cache.probe(expired))
+    
+    def test_login_reuses_valid_session(self):
+        """有効なセッションがあればログインを省略するテスト"""
+        self.cache.save(self.scraper)
+        
+        self.assertTrue(self.cache.login(self.scraper, "test@example.com", "password123"))
+        
+        self.scraper.login.assert_not_called()
+        self.scraper.add_cookies.assert_called_once()
+        self.scraper.set_local_storage.assert_called_once_with({"token": "xyz"})
+    
+    def test_login_when_session_expired(self):
+        """セッションが無効ならログインして保存し直すテスト"""
+        self.scraper.get_cookies.return_value = [{"name": "session", "value": "expired", "domain": "127.0.0.1"}]
+        self.cache.save(self.scraper)
+        self.scraper.login.return_value = True
+        
+        with patch.object(self.cache, "save") as mock_save:
+            self.assertTrue(self.cache.login(self.scraper, "test@example.com", "password123"))
+            mock_save.assert_called_once_with(self.scraper)
+        
+        self.scraper.login.assert_called_once_with("test@example.com", "password123")
+        self.scraper.add_cookies.assert_not_called()
+    
+    def test_login_failure(self):
+        """ログインに失敗した場合は保存しないテスト"""
+        self.scraper.login.return_value = False
+        
+        self.assertFalse(self.cache.login(self.scraper, "test@example.com", "wrong_password"))
+        self.assertFalse(os.path.exists(self.path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import unittest
+import os
+import sys
+import time
+import shutil
+import tempfile
+from unittest.mock import patch
+
+# テスト対象のモジュールのパスを追加
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+from snapshot_store import SnapshotStore
+from utils import generate_mock_candidate_html
+
+
+class TestSnapshotStore(unittest.TestCase):
+    """SnapshotStoreクラスのテストクラス"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.store = SnapshotStore(self.temp_dir)
+        self.url = "https://www.bizreach.jp/company/candidates/12345"
+        self.html = generate_mock_candidate_html()
+
+    def tearDown(self):
+        """テスト後のクリーンアップ"""
+        self.store.close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_save_and_load(self):
+        """保存したHTMLを読み込めるかのテスト"""
+        content_hash = self.store.save(self.url, self.html)
+
+        self.assertEqual(self.store.load(content_hash), self.html)
+        self.assertEqual(self.store.latest(self.url)["content_hash"], content_hash)
+
+    def test_save_deduplicates_content(self):
+        """同じ内容のHTMLが1つだけ保存されるかのテスト"""
+        first = self.store.save(self.url, self.html, fetched_at=100)
+        second = self.store.save(self.url + "?tab=career", self.html, fetched_at=200)
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.store.latest(self.url)["fetched_at"], 200)
+        objects = [name for _, _, files in os.walk(self.store.objects_dir) for name in files]
+        self.assertEqual(len(objects), 1)
+
+    def test_get_fresh(self):
+        """指定した時間以内のスナップショットだけが返されるかのテスト"""
+        self.store.save(self.url, self.html, fetched_at=time.time() - 3600)
+
+        self.assertEqual(self.store.get_fresh(self.url, 7200), self.html)
+        self.assertIsNone(self.store.get_fresh(self.url, 60))
+        self.assertIsNone(self.store.get_fresh("https://www.bizreach.jp/company/candidates/99999", 7200))
+
+    def test_iter_latest(self):
+        """求職者ごとに最新のスナップショットが返されるかのテスト"""
+        self.store.save(self.url, "<html>old</html>", fetched_at=100)
+        newest = self.store.save(self.url, self.html, fetched_at=200)
+        self.store.save("https://www.bizreach.jp/company/candidates/67890", self.html, fetched_at=150)
+
+        snapshots = list(self.store.iter_latest())
+
+        self.assertEqual(len(snapshots), 2)
+        latest = [s for s in snapshots if s["url"] == self.url][0]
+        self.assertEqual(latest["content_hash"], newest)
+
+    def test_prune_by_age(self):
+        """古いスナップショットとそのHTMLが削除されるかのテスト"""
+        old_hash = self.store.save(self.url, "<html>old</html>", fetched_at=time.time() - 10 * 86400)
+        self.store.save(self.url, self.html)
+
+        removed = self.store.prune(max_age_days=7)
+
+        self.assertEqual(removed, 1)
+        self.assertFalse(os.path.exists(self.store.object_path(old_hash)))
+        self.assertEqual(self.store.get_fresh(self.url, 60), self.html)
+
+    def test_prune_by_size(self):
+        """合計サイズが上限以下になるまで古い順に削除されるかのテスト"""
+        for i in range(5):
+            self.store.save(f"https://www.bizreach.jp/company/candidates/{i}", f"<html>{i}{os.urandom(512).hex()}</html>",
+                            fetched_at=100 + i)
+        limit = self.store.total_size() // 2
+
+        removed = self.store.prune(max_bytes=limit)
+
+        self.assertGreater(removed, 0)
+        self.assertLessEqual(self.store.total_size(), limit)
+        # 最新のスナップショットは残る
+        self.assertIsNotNone(self.store.latest("https://www.bizreach.jp/company/candidates/4"))
+        self.assertIsNone(self.store.latest("https://www.bizreach.jp/company/candidates/0"))
+
+    def test_prune_by_size_shared_html(self):
+        """他の求職者と共有しているHTMLは、最後の参照が削除されるまで合計サイズから減らさないかのテスト"""
+        shared = f"<html>{os.urandom(512).hex()}</html>"
+        for i in range(4):
+            self.store.save(f"https://www.bizreach.jp/company/candidates/{i}", shared, fetched_at=100 + i)
+        unique_hash = self.store.save("https://www.bizreach.jp/company/candidates/9",
+                                      f"<html>{os.urandom(512).hex()}</html>", fetched_at=200)
+        limit = self.store.total_size() - 1
+
+        with patch.object(self.store, "_remove_orphans", wraps=self.store._remove_orphans) as remove_orphans:
+            removed = self.store.prune(max_bytes=limit)
+
+        # 共有しているHTMLを解放するには、それを参照する4件をすべて削除する必要がある
+        self.assertEqual(removed, 4)
+        remove_orphans.assert_called_once()
+        self.assertLessEqual(self.store.total_size(), limit)
+        self.assertEqual([s["content_hash"] for s in self.store.iter_latest()], [unique_hash])
+
+
+if __name__ == '__main__':
+    unittest.main()
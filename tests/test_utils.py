@@ -1,13 +1,17 @@
 import unittest
 import os
 import json
+import gzip
 import tempfile
 from datetime import datetime
 import sys
 
 # テスト対象のモジュールのパスを追加
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
-from utils import load_url_list, validate_url, create_output_filename, ensure_directory_exists, generate_mock_candidate_data
+from utils import (
+    load_url_list, validate_url, create_output_filename, ensure_directory_exists, generate_mock_candidate_data,
+    extract_candidate_id, canonicalize_url, UrlStream, BloomFilter
+)
 
 
 class TestUtils(unittest.TestCase):
@@ -85,6 +89,63 @@ class TestUtils(unittest.TestCase):
         with self.assertRaises(ValueError):
             load_url_list(invalid_path)
     
+    def test_url_stream_deduplicates(self):
+        """同じ求職者のURLが正規化されて1件だけ返されるかのテスト"""
+        txt_path = os.path.join(self.temp_dir, "urls.txt")
+        with open(txt_path, 'w', encoding='utf-8') as f:
+            f.write(self.sample_urls[0] + "\n")
+            f.write(self.sample_urls[0] + "/?utm_source=mail#career\n")
+            f.write("https://www.example.com/company/candidates/1\n")
+            f.write(self.sample_urls[1] + "\n")
+        
+        stream = UrlStream(txt_path)
+        
+        self.assertEqual(list(stream), self.sample_urls[:2])
+        self.assertEqual((stream.count, stream.invalid, stream.duplicates), (2, 1, 1))
+        # 再度読み込んでも同じ結果になる
+        self.assertEqual(list(stream), self.sample_urls[:2])
+    
+    def test_url_stream_csv_and_jsonl_gzip(self):
+        """CSVのurl列とgzip圧縮したJSONLから読み込むテスト"""
+        csv_path = os.path.join(self.temp_dir, "urls.csv")
+        with open(csv_path, 'w', encoding='utf-8') as f:
+            f.write("name,url\n")
+            for i, url in enumerate(self.sample_urls):
+                f.write(f"候補者{i},{url}\n")
+        
+        jsonl_path = os.path.join(self.temp_dir, "urls.jsonl.gz")
+        with gzip.open(jsonl_path, 'wt', encoding='utf-8') as f:
+            f.write(json.dumps({"url": self.sample_urls[0]}) + "\n")
+            f.write(json.dumps(self.sample_urls[1]) + "\n")
+            f.write(self.sample_urls[2] + "\n")
+        
+        self.assertEqual(list(UrlStream(csv_path)), self.sample_urls)
+        self.assertEqual(list(UrlStream(jsonl_path, bloom_capacity=1000)), self.sample_urls)
+    
+    def test_canonicalize_url(self):
+        """URLの正規化のテスト"""
+        expected = "https://www.bizreach.jp/company/candidates/12345"
+        self.assertEqual(canonicalize_url("https://WWW.Bizreach.jp/company/candidates/12345/?tab=1#career"), expected)
+        self.assertEqual(canonicalize_url("https://www.bizreach.jp/company/search/?q=1"), "https://www.bizreach.jp/company/search")
+        
+        # スキーム・ホスト・パスは書き換えない
+        self.assertEqual(canonicalize_url("http://www.bizreach.jp/company/candidates/12345"),
+                         "http://www.bizreach.jp/company/candidates/12345")
+        self.assertEqual(canonicalize_url("https://stg.bizreach.jp/v2/company/candidates/12345/"),
+                         "https://stg.bizreach.jp/v2/company/candidates/12345")
+    
+    def test_bloom_filter(self):
+        """ブルームフィルターで登録済みの値を判定できるかのテスト"""
+        bloom = BloomFilter(1000)
+        
+        for i in range(1000):
+            self.assertTrue(bloom.add(str(i)))
+        
+        self.assertFalse(bloom.add("500"))
+        self.assertTrue(all(str(i) in bloom for i in range(1000)))
+        false_positives = sum(1 for i in range(1000, 11000) if str(i) in bloom)
+        self.assertLess(false_positives, 100)
+    
     def test_validate_url(self):
         """URL検証のテスト"""
         # 有効なURL
@@ -144,6 +205,13 @@ class TestUtils(unittest.TestCase):
         # 学歴情報の検証
         self.assertIsInstance(mock_data["education"], list)
 
+    def test_extract_candidate_id(self):
+        """URLから求職者IDを取り出せるかのテスト"""
+        self.assertEqual(extract_candidate_id(self.sample_urls[0]), "12345")
+        self.assertEqual(extract_candidate_id(self.sample_urls[1] + "?tab=career#top"), "67890")
+        # 求職者IDを含まないURLはそのまま返す
+        self.assertEqual(extract_candidate_id("https://example.com/page"), "https://example.com/page")
+
 
 if __name__ == '__main__':
     unittest.main()
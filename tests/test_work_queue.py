@@ -0,0 +1,208 @@
+import unittest
+import os
+import sys
+import time
+import shutil
+import tempfile
+import multiprocessing
+
+# テスト対象のモジュールのパスを追加
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+from work_queue import WorkQueue, SqliteWorkQueue, QueueFeed, create_work_queue
+
+
+def _lease_all(path, result_queue):
+    """別プロセスで、キューが空になるまでURLを借りて完了を記録する"""
+    queue = SqliteWorkQueue(path)
+    urls = []
+    while True:
+        lease_id, batch = queue.lease(f"worker-{os.getpid()}", 5, 60)
+        if not batch:
+            break
+        for url in batch:
+            queue.complete(lease_id, url)
+        urls.extend(batch)
+    queue.close()
+    result_queue.put(urls)
+
+
+class TestSqliteWorkQueue(unittest.TestCase):
+    """SqliteWorkQueueクラスのテストクラス"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "queue.sqlite3")
+        self.queue = SqliteWorkQueue(self.path)
+        self.urls = [f"https://www.bizreach.jp/company/candidates/{i}" for i in range(10)]
+
+    def tearDown(self):
+        """テスト後のクリーンアップ"""
+        self.queue.close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_enqueue_and_priority(self):
+        """重複を除いて追加し、優先度の高い順・追加順に借りられるかのテスト"""
+        self.assertEqual(self.queue.enqueue(self.urls[:5]), 5)
+        self.assertEqual(self.queue.enqueue(self.urls[3:8], priority=1), 3)
+
+        _, urls = self.queue.lease("worker-1", 4, 60)
+
+        self.assertEqual(urls, self.urls[5:8] + self.urls[:1])
+        self.assertEqual(self.queue.counts(), {"pending": 4, "leased": 4, "done": 0, "error": 0})
+
+    def test_leases_do_not_overlap(self):
+        """同じファイルを開いた複数のキューで、同じURLを借りないかのテスト"""
+        self.queue.enqueue(self.urls)
+        other = SqliteWorkQueue(self.path)
+
+        _, first = self.queue.lease("worker-1", 6, 60)
+        _, second = other.lease("worker-2", 6, 60)
+        other.close()
+
+        self.assertEqual(len(first), 6)
+        self.assertEqual(sorted(first + second), sorted(self.urls))
+
+    def test_multiple_processes(self):
+        """複数のプロセスでキューが空になるまで取得し、全URLがちょうど1回ずつ処理されるかのテスト"""
+        self.queue.enqueue(self.urls + [f"{url}?page=2" for url in self.urls])
+        result_queue = multiprocessing.Queue()
+        processes = [multiprocessing.Process(target=_lease_all, args=(self.path, result_queue)) for _ in range(3)]
+        for process in processes:
+            process.start()
+        leased = [url for _ in processes for url in result_queue.get(timeout=30)]
+        for process in processes:
+            process.join()
+
+        self.assertEqual(len(leased), 20)
+        self.assertEqual(len(set(leased)), 20)
+        self.assertEqual(self.queue.counts()["done"], 20)
+
+    def test_expired_lease_returns_to_queue(self):
+        """期限切れのリースのURLが他のワーカーに渡り、元のワーカーの完了は記録されないかのテスト"""
+        self.queue.enqueue(self.urls[:2])
+        lease_id, urls = self.queue.lease("worker-1", 2, -1)
+
+        other_lease_id, other_urls = self.queue.lease("worker-2", 2, 60)
+
+        self.assertEqual(other_urls, urls)
+        self.assertEqual(self.queue.reclaimed, 2)
+        self.assertFalse(self.queue.complete(lease_id, urls[0]))
+        self.assertTrue(self.queue.complete(other_lease_id, urls[0]))
+
+    def test_renew(self):
+        """期限を延長したリースは期限切れにならないかのテスト"""
+        self.queue.enqueue(self.urls[:2])
+        lease_id, _ = self.queue.lease("worker-1", 2, -1)
+
+        self.assertEqual(self.queue.renew(lease_id, 60), 2)
+        _, urls = self.queue.lease("worker-2", 2, 60)
+
+        self.assertEqual(urls, [])
+
+    def test_error_retried_until_max_attempts(self):
+        """取得に失敗したURLが、試行回数の上限まで作業キューに戻るかのテスト"""
+        self.queue.enqueue(self.urls[:1])
+
+        for _ in range(2):
+            lease_id, urls = self.queue.lease("worker-1", 1, 60)
+            self.queue.complete(lease_id, urls[0], "タイムアウト", max_attempts=2)
+
+        _, urls = self.queue.lease("worker-1", 1, 60)
+        self.assertEqual(urls, [])
+        self.assertEqual(self.queue.counts(), {"pending": 0, "leased": 0, "done": 1, "error": 1})
+
+    def test_release(self):
+        """返却したリースのURLが、試行回数を増やさずにすぐ作業キューに戻るかのテスト"""
+        self.queue.enqueue(self.urls[:3])
+        lease_id, _ = self.queue.lease("worker-1", 3, 60)
+
+        self.assertEqual(self.queue.release(lease_id), 3)
+        self.assertEqual(self.queue.counts()["pending"], 3)
+
+    def test_create_work_queue(self):
+        """保存先の指定から作業キューを生成するかのテスト"""
+        queue = create_work_queue("sqlite:///" + self.path)
+        self.assertIsInstance(queue, SqliteWorkQueue)
+        queue.close()
+
+        with self.assertRaises(ValueError):
+            create_work_queue("redis://localhost/0")
+
+    def test_incomplete_implementation(self):
+        """インターフェースのメソッドを実装していない作業キューは生成できないかのテスト"""
+        class PartialQueue(WorkQueue):
+            def enqueue(self, urls, priority=0):
+                return 0
+
+        with self.assertRaises(TypeError):
+            PartialQueue()
+
+    def test_is_done(self):
+        """正常に完了したURLだけが取得済みになり、別の接続（ワーカー）からも分かるかのテスト"""
+        self.queue.enqueue(self.urls)
+        lease_id, urls = self.queue.lease("worker-1", 2, 60)
+        self.assertFalse(self.queue.is_done(urls[0]))
+
+        self.queue.complete(lease_id, urls[0])
+        self.queue.complete(lease_id, urls[1], error="timeout", max_attempts=1)
+
+        other = SqliteWorkQueue(self.path)
+        self.assertTrue(other.is_done(urls[0]))
+        self.assertFalse(other.is_done(urls[1]))
+        other.close()
+
+
+class TestQueueFeed(unittest.TestCase):
+    """QueueFeedクラスのテストクラス"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.queue = SqliteWorkQueue(os.path.join(self.temp_dir, "queue.sqlite3"))
+        self.urls = [f"https://www.bizreach.jp/company/candidates/{i}" for i in range(5)]
+        self.queue.enqueue(self.urls)
+
+    def tearDown(self):
+        """テスト後のクリーンアップ"""
+        self.queue.close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_iterate_until_empty(self):
+        """キューが空になるまで借りながらURLを返し、結果を記録するかのテスト（失敗したURLは上限まで取得し直す）"""
+        feed = QueueFeed(self.queue, "worker-1", batch_size=2, max_attempts=2)
+
+        for url in feed:
+            feed.record(url, {"url": url, "error": "取得できませんでした"} if url == self.urls[1] else {"url": url})
+        feed.close()
+
+        self.assertEqual(feed.completed, 6)
+        self.assertTrue(feed.is_done(self.urls[0]))
+        self.assertFalse(feed.is_done(self.urls[1]))
+        self.assertEqual(self.queue.counts(), {"pending": 0, "leased": 0, "done": 5, "error": 1})
+
+    def test_close_releases_unfinished(self):
+        """途中で閉じた場合に、未完了のURLが作業キューに戻るかのテスト"""
+        feed = QueueFeed(self.queue, "worker-1", batch_size=3)
+        iterator = iter(feed)
+        url = next(iterator)
+        feed.record(url, {"url": url})
+
+        feed.close()
+
+        self.assertEqual(self.queue.counts(), {"pending": 4, "leased": 0, "done": 1, "error": 0})
+
+    def test_heartbeat(self):
+        """取得中のリースの期限がバックグラウンドで延長されるかのテスト"""
+        feed = QueueFeed(self.queue, "worker-1", batch_size=5, lease_seconds=0.3)
+        next(iter(feed))
+
+        time.sleep(0.6)
+        _, urls = self.queue.lease("worker-2", 5, 60)
+        feed.close()
+
+        self.assertEqual(urls, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,157 @@
+import unittest
+import os
+import sys
+import time
+from unittest.mock import MagicMock
+
+# テスト対象のモジュールのパスを追加
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+from worker_pool import RateLimiter, WorkerPool
+from utils import generate_mock_candidate_data
+
+
+class TestRateLimiter(unittest.TestCase):
+    """RateLimiterクラスのテストクラス"""
+
+    def test_acquire_enforces_interval(self):
+        """連続したリクエストの間隔が守られるかのテスト"""
+        limiter = RateLimiter(0.05)
+
+        start = time.monotonic()
+        for _ in range(3):
+            limiter.acquire()
+        elapsed = time.monotonic() - start
+
+        # 1回目は即時、2回目と3回目で合計2間隔分待機する
+        self.assertGreaterEqual(elapsed, 0.1)
+
+
+class TestWorkerPool(unittest.TestCase):
+    """WorkerPoolクラスのテストクラス"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self.sample_urls = [
+            f"https://www.bizreach.jp/company/candidates/{i}" for i in range(10)
+        ]
+        self.created = []
+
+    def _factory(self):
+        """URLごとに異なる待ち時間でモックデータを返すスクレイパーを生成する"""
+        scraper = MagicMock()
+        scraper.login.return_value = True
+        scraper.get_cookies.return_value = [{"name": "session", "value": "abc"}]
+
+        def scrape(url):
+            # 後ろのURLほど早く終わるようにして、順序の保持を確認する
+            time.sleep(0.001 * (10 - int(url.rsplit("/", 1)[1])))
+            return generate_mock_candidate_data(url)
+
+        scraper.scrape_candidate_page.side_effect = scrape
+        self.created.append(scraper)
+        return scraper
+
+    def test_start_shares_login_cookies(self):
+        """最初のセッションだけがログインし、Cookieが共有されるかのテスト"""
+        pool = WorkerPool(self._factory, 3, min_interval=0)
+
+        self.assertTrue(pool.start("test@example.com", "password123"))
+
+        self.assertEqual(len(self.created), 3)
+        self.created[0].login.assert_called_once()
+        for scraper in self.created[1:]:
+            scraper.login.assert_not_called()
+            scraper.add_cookies.assert_called_once_with([{"name": "session", "value": "abc"}])
+
+    def test_start_login_failure(self):
+        """ログイン失敗時に他のセッションを起動しないかのテスト"""
+        def factory():
+            scraper = MagicMock()
+            scraper.login.return_value = False
+            self.created.append(scraper)
+            return scraper
+
+        pool = WorkerPool(factory, 3, min_interval=0)
+
+        self.assertFalse(pool.start("test@example.com", "wrong_password"))
+        self.assertEqual(len(self.created), 1)
+
+    def test_scrape_multiple_candidates_keeps_order(self):
+        """結果が入力URLの順序で返されるかのテスト"""
+        pool = WorkerPool(self._factory, 4, min_interval=0)
+        pool.start("test@example.com", "password123")
+
+        results = pool.scrape_multiple_candidates(self.sample_urls)
+
+        self.assertEqual([r["url"] for r in results], self.sample_urls)
+        self.assertEqual(pool.primary.candidate_data, results)
+
+    def test_scrape_multiple_candidates_from_iterator(self):
+        """URLを1件ずつ読みながら処理し、順序が保持されるかのテスト"""
+        pool = WorkerPool(self._factory, 3, min_interval=0)
+        pool.start("test@example.com", "password123")
+
+        results = pool.scrape_multiple_candidates(iter(self.sample_urls))
+
+        self.assertEqual([r["url"] for r in results], self.sample_urls)
+
+    def test_scrape_multiple_candidates_with_sink(self):
+        """結果が入力URLの順序で1件ずつ書き出されるかのテスト"""
+        pool = WorkerPool(self._factory, 4, min_interval=0)
+        pool.start("test@example.com", "password123")
+        sink = MagicMock()
+
+        results = pool.scrape_multiple_candidates(self.sample_urls, sink=sink)
+
+        self.assertEqual(results, [])
+        written = [call.args[0]["url"] for call in sink.write.call_args_list]
+        self.assertEqual(written, self.sample_urls)
+
+    def test_checkpoint_records_input_url(self):
+        """結果のURLが入力URLと異なる場合（リダイレクトなど）も、入力URLで処理結果を記録するかのテスト"""
+        pool = WorkerPool(self._factory, 2, min_interval=0)
+        pool.start("test@example.com", "password123")
+        for scraper in self.created:
+            scraper.scrape_candidate_page.side_effect = lambda url: generate_mock_candidate_data(url + "?from=redirect")
+        checkpoint = MagicMock()
+
+        pool.scrape_multiple_candidates(self.sample_urls[:3], checkpoint=checkpoint)
+
+        recorded = [call.args[0] for call in checkpoint.record.call_args_list]
+        self.assertEqual(recorded, self.sample_urls[:3])
+
+    def test_interrupt_cancels_pending_urls(self):
+        """中断した場合に、まだ開始していないURLを取得せずに終了するかのテスト"""
+        pool = WorkerPool(self._factory, 2, min_interval=0)
+        pool.start("test@example.com", "password123")
+        scraped = []
+
+        def scrape(url):
+            scraped.append(url)
+            # 最初のURLだけ早く終わり、中断時に他のURLは実行中または待機中になる
+            time.sleep(0.01 if url == self.sample_urls[0] else 0.2)
+            return generate_mock_candidate_data(url)
+
+        for scraper in self.created:
+            scraper.scrape_candidate_page.side_effect = scrape
+        sink = MagicMock()
+        sink.write.side_effect = KeyboardInterrupt
+
+        with self.assertRaises(KeyboardInterrupt):
+            pool.scrape_multiple_candidates(self.sample_urls, sink=sink)
+
+        # 中断時に待機中だったURLは取り消され、取得されない
+        self.assertNotIn(self.sample_urls[3], scraped)
+
+    def test_close(self):
+        """全セッションのブラウザが閉じられるかのテスト"""
+        pool = WorkerPool(self._factory, 2, min_interval=0)
+        pool.start("test@example.com", "password123")
+
+        self.assertTrue(pool.close())
+        for scraper in self.created:
+            scraper.close_browser.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()